@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure the training dataloading throughput of a LeRobotDataset for several numbers of workers.
+
+Every configuration iterates a shuffled DataLoader like `lerobot/scripts/train.py` does and reports samples
+per second. `--no-decoder-pool` decodes every item from scratch with `decode_video_frames` for comparison.
+`--frame-store` reads the camera frames from a DecodedFrameStore (built on the first run) instead of
+decoding them, to compare it with the video backend (torchcodec by default). `--action-steps` queries
+chunks of actions like ACT or diffusion policies, and `--no-getitems` fetches the items of a batch one by one
+instead of with `LeRobotDataset.__getitems__`. `--tensor-cache` reads the numeric columns from a TensorCache.
+
+Example:
+    python benchmarks/datasets/run_dataloader_benchmark.py --repo-id lerobot/cheeto_cut \\
+        --root data/cheeto_cut --num-workers 0 2 4 8 --video-backend pyav
+    python benchmarks/datasets/run_dataloader_benchmark.py --repo-id lerobot/cheeto_cut \\
+        --root data/cheeto_cut --frame-store --frame-store-resolution 240 320
+"""
+
+import argparse
+import time
+
+import torch
+
+from lerobot.common.datasets.lerobot_dataset import LeRobotDataset, LeRobotDatasetMetadata
+from lerobot.common.datasets.video_utils import decode_video_frames
+
+
+class _NoDecoderPool:
+    """Stands in for `VideoDecoderPool`: decodes every query from scratch."""
+
+    def __init__(self, backend: str):
+        self.backend = backend
+
+    def decode(self, video_path, timestamps, tolerance_s):
+        return decode_video_frames(video_path, timestamps, tolerance_s, self.backend)
+
+
+def measure_throughput(
+    dataset: LeRobotDataset, num_workers: int, batch_size: int, num_batches: int, warmup_batches: int = 2
+) -> float:
+    """Samples per second over `num_batches` batches, after `warmup_batches` (worker startup)."""
+    dataloader = torch.utils.data.DataLoader(
+        dataset,
+        num_workers=num_workers,
+        batch_size=batch_size,
+        shuffle=True,
+        pin_memory=False,
+        drop_last=False,
+        persistent_workers=False,
+    )
+    num_samples = 0
+    start = None
+    for i, batch in enumerate(dataloader):
+        if i == warmup_batches:
+            start = time.perf_counter()
+        elif i > warmup_batches:
+            num_samples += len(batch["index"])
+        if i == warmup_batches + num_batches:
+            break
+    if start is None or num_samples == 0:
+        raise ValueError("The dataset is too small for the number of batches; lower --num-batches.")
+    return num_samples / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--repo-id", required=True)
+    parser.add_argument("--root", help="Local directory of the dataset.")
+    parser.add_argument("--num-workers", type=int, nargs="+", default=[0, 2, 4])
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--num-batches", type=int, default=50)
+    parser.add_argument("--video-backend", help="Defaults to torchcodec when available, else pyav.")
+    parser.add_argument("--no-decoder-pool", action="store_true", help="Decode every item from scratch.")
+    parser.add_argument("--frame-store", action="store_true", help="Read frames from a frame store.")
+    parser.add_argument("--frame-store-resolution", type=int, nargs=2, metavar=("HEIGHT", "WIDTH"))
+    parser.add_argument("--frame-store-dir", help="Defaults to the LeRobot cache directory.")
+    parser.add_argument("--action-steps", type=int, default=0, help="Length of the queried action chunks.")
+    parser.add_argument("--no-getitems", action="store_true", help="Fetch the items of a batch one by one.")
+    parser.add_argument("--tensor-cache", action="store_true", help="Cache the numeric columns in memory.")
+    args = parser.parse_args()
+
+    delta_timestamps = None
+    if args.action_steps > 0:
+        fps = LeRobotDatasetMetadata(args.repo_id, root=args.root).fps
+        delta_timestamps = {"action": [i / fps for i in range(args.action_steps)]}
+
+    start = time.perf_counter()
+    dataset = LeRobotDataset(
+        args.repo_id,
+        root=args.root,
+        delta_timestamps=delta_timestamps,
+        video_backend=args.video_backend,
+        frame_store=args.frame_store,
+        frame_store_resolution=args.frame_store_resolution,
+        frame_store_dir=args.frame_store_dir,
+        tensor_cache=args.tensor_cache,
+    )
+    if args.frame_store:
+        print(f"Frame store ready in {time.perf_counter() - start:.1f}s")
+    if args.no_decoder_pool:
+        dataset.video_decoder_pool = _NoDecoderPool(dataset.video_backend)
+    if args.no_getitems:
+        # The DataLoader only calls `__getitems__` when it is truthy
+        dataset.__getitems__ = None
+
+    print(f"{'num_workers':>11}  {'samples/s':>9}")
+    for num_workers in args.num_workers:
+        throughput = measure_throughput(dataset, num_workers, args.batch_size, args.num_batches)
+        print(f"{num_workers:>11}  {throughput:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
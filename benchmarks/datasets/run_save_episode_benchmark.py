@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measure how `LeRobotDataset.save_episode` scales with the number of episodes already in the dataset.
+
+Records `--num-episodes` synthetic episodes (SO-101 sized state and action, optionally small camera frames)
+into a fresh dataset and reports the save time per group of episodes. The time per episode should stay flat
+as the dataset grows.
+
+Example:
+    python benchmarks/datasets/run_save_episode_benchmark.py --num-episodes 500 --frames-per-episode 300
+"""
+
+import argparse
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from lerobot.common.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.common.utils.tracing import percentile
+
+
+def make_features(num_motors: int, camera_shape: tuple[int, int, int] | None) -> dict:
+    features = {
+        "action": {"dtype": "float32", "shape": (num_motors,), "names": None},
+        "observation.state": {"dtype": "float32", "shape": (num_motors,), "names": None},
+    }
+    if camera_shape is not None:
+        features["observation.images.right"] = {
+            "dtype": "video",
+            "shape": camera_shape,
+            "names": ["height", "width", "channels"],
+        }
+    return features
+
+
+def run_benchmark(
+    root: Path,
+    num_episodes: int,
+    frames_per_episode: int,
+    num_motors: int = 6,
+    camera_shape: tuple[int, int, int] | None = None,
+    streaming_encoding: bool = True,
+) -> list[float]:
+    """Returns the duration of every `save_episode` call, in seconds."""
+    dataset = LeRobotDataset.create(
+        repo_id="benchmark/save_episode",
+        fps=30,
+        features=make_features(num_motors, camera_shape),
+        root=root,
+        use_videos=True,
+        image_writer_threads=4 if camera_shape is not None else 0,
+        streaming_encoding=streaming_encoding,
+    )
+    rng = np.random.default_rng(0)
+    durations = []
+    try:
+        for _ in range(num_episodes):
+            for _ in range(frames_per_episode):
+                frame = {
+                    "action": rng.random(num_motors, dtype=np.float32),
+                    "observation.state": rng.random(num_motors, dtype=np.float32),
+                }
+                if camera_shape is not None:
+                    frame["observation.images.right"] = rng.integers(0, 256, camera_shape, dtype=np.uint8)
+                dataset.add_frame(frame, task="Cut the Cheeto")
+
+            start = time.perf_counter()
+            dataset.save_episode()
+            durations.append(time.perf_counter() - start)
+    finally:
+        dataset.stop_image_writer()
+    return durations
+
+
+def print_report(durations: list[float], group_size: int):
+    print(f"{'episodes':>12}  {'mean_ms':>8}  {'p50_ms':>8}  {'p95_ms':>8}")
+    for start in range(0, len(durations), group_size):
+        group = [d * 1e3 for d in durations[start : start + group_size]]
+        label = f"{start}-{start + len(group) - 1}"
+        print(
+            f"{label:>12}  {np.mean(group):8.1f}  {percentile(group, 50):8.1f}  {percentile(group, 95):8.1f}"
+        )
+
+    # Ratio of the last group over the first one: close to 1 when saving doesn't depend on the dataset size
+    first = np.mean(durations[:group_size])
+    last = np.mean(durations[-group_size:])
+    print(f"\nlast / first group: {last / first:.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--num-episodes", type=int, default=200)
+    parser.add_argument("--frames-per-episode", type=int, default=300)
+    parser.add_argument("--group-size", type=int, default=25, help="Episodes per line of the report.")
+    parser.add_argument(
+        "--camera-shape",
+        type=int,
+        nargs=3,
+        metavar=("HEIGHT", "WIDTH", "CHANNELS"),
+        help="Also record one camera of this shape (e.g. 96 128 3). Encoding then dominates the save time.",
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        help="Directory of the benchmark dataset. Defaults to a temporary directory, removed afterwards.",
+    )
+    args = parser.parse_args()
+
+    root = args.root if args.root is not None else Path(tempfile.mkdtemp()) / "dataset"
+    try:
+        durations = run_benchmark(
+            root,
+            args.num_episodes,
+            args.frames_per_episode,
+            camera_shape=tuple(args.camera_shape) if args.camera_shape else None,
+        )
+    finally:
+        if args.root is None:
+            shutil.rmtree(root.parent)
+    print_report(durations, args.group_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,8 @@
 # limitations under the License.
 """Assess the performance of video decoding in various configurations.
 
-This script will benchmark different video encoding and decoding parameters.
+This script will benchmark different video encoding and decoding parameters, or the encoding presets of
+`LeRobotDataset` with `--presets`.
 See the provided README.md or run `python benchmark/video/run_video_benchmark.py --help` for usage info.
 """
 
@@ -23,8 +24,10 @@ import argparse
 import datetime as dt
 import random
 import shutil
+import time
 from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, fields
 from pathlib import Path
 
 import einops
@@ -37,8 +40,10 @@ from tqdm import tqdm
 
 from lerobot.common.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.common.datasets.video_utils import (
+    VideoEncodingConfig,
     decode_video_frames_torchvision,
     encode_video_frames,
+    get_video_encoding_config,
 )
 from lerobot.common.utils.benchmark import TimeBenchmark
 
@@ -52,6 +57,22 @@ BASE_ENCODING = OrderedDict(
         # ("fastdecode", 0),
     ]
 )
+ENCODING_KEYS = [f.name for f in fields(VideoEncodingConfig)]
+METRICS_HEADERS = [
+    "timestamps_mode",
+    "backend",
+    "encode_time_s",
+    "encode_cpu_time_s",
+    "video_size_bytes",
+    "images_size_bytes",
+    "video_images_size_ratio",
+    "avg_load_time_video_ms",
+    "avg_load_time_images_ms",
+    "video_images_load_time_ratio",
+    "avg_mse",
+    "avg_psnr",
+    "avg_ssim",
+]
 
 
 # TODO(rcadene, aliberts): move to `utils.py` folder when we want to refactor
@@ -113,6 +134,15 @@ def save_first_episode(imgs_dir: Path, dataset: LeRobotDataset) -> None:
         return
 
     imgs_dir.mkdir(parents=True, exist_ok=True)
+    if len(dataset.meta.video_keys) > 0:
+        # Video datasets (e.g. our recordings): the decoded frames of the first camera serve as originals
+        key = dataset.meta.video_keys[0]
+        desc = f"saving {dataset.repo_id} first episode frames"
+        for i in tqdm(range(ep_num_images), desc=desc, leave=False):
+            frame_hwc = (dataset[i][key].permute(1, 2, 0) * 255).round().type(torch.uint8).numpy()
+            PIL.Image.fromarray(frame_hwc).save(str(imgs_dir / f"frame_{i:06d}.png"))
+        return
+
     hf_dataset = dataset.hf_dataset.with_format(None)
 
     # We only save images from the first camera
@@ -251,19 +281,16 @@ def benchmark_encoding_decoding(
 ) -> list[dict]:
     fps = dataset.fps
 
+    # Only measured when the video is encoded by this run
+    encode_times = {"encode_time_s": None, "encode_cpu_time_s": None}
     if overwrite or not video_path.is_file():
         tqdm.write(f"encoding {video_path}")
-        encode_video_frames(
-            imgs_dir=imgs_dir,
-            video_path=video_path,
-            fps=fps,
-            vcodec=encoding_cfg["vcodec"],
-            pix_fmt=encoding_cfg["pix_fmt"],
-            g=encoding_cfg.get("g"),
-            crf=encoding_cfg.get("crf"),
-            # fast_decode=encoding_cfg.get("fastdecode"),
-            overwrite=True,
-        )
+        encode_kwargs = {key: value for key, value in encoding_cfg.items() if key in ENCODING_KEYS}
+        start_time, start_cpu_time = time.perf_counter(), time.process_time()
+        encode_video_frames(imgs_dir, video_path, fps, overwrite=True, **encode_kwargs)
+        # CPU time of all the threads of the process (encoder threads included), reading the images included
+        encode_times["encode_time_s"] = time.perf_counter() - start_time
+        encode_times["encode_cpu_time_s"] = time.process_time() - start_cpu_time
 
     ep_num_images = dataset.episode_data_index["to"][0].item()
     width, height = tuple(dataset[0][dataset.meta.camera_keys[0]].shape[-2:])
@@ -300,6 +327,7 @@ def benchmark_encoding_decoding(
                     "timestamps_mode": timestamps_mode,
                     "backend": backend,
                 },
+                **encode_times,
                 **encoding_cfg,
             )
             benchmark_table.append(benchmark_row)
@@ -307,6 +335,51 @@ def benchmark_encoding_decoding(
     return benchmark_table
 
 
+def benchmark_presets(
+    output_dir: Path,
+    repo_ids: list[str],
+    presets: list[str],
+    encoding_threads: int | None,
+    decoding_cfg: dict,
+    num_samples: int,
+    num_workers: int,
+    save_frames: bool,
+) -> Path:
+    """
+    Encodes the first episode of each dataset with each of the encoding presets of `LeRobotDataset` (always
+    re-encoded, so that encoding times are measured), and benchmarks their decoding. Video datasets (e.g.
+    our recordings) are accepted: their decoded frames serve as the original images.
+    """
+    benchmark_table = []
+    for repo_id in tqdm(repo_ids, desc="encodings (datasets)"):
+        dataset = LeRobotDataset(repo_id, video_backend="pyav")
+        imgs_dir = output_dir / "images" / dataset.repo_id.replace("/", "_")
+        save_first_episode(imgs_dir, dataset)
+        for preset in tqdm(presets, desc="encodings (presets)", leave=False):
+            encoding_cfg = {
+                "encoding_preset": preset,
+                **asdict(get_video_encoding_config(preset, encoding_threads)),
+            }
+            video_path = output_dir / "videos" / f"preset_{preset}" / f"{repo_id.replace('/', '_')}.mp4"
+            benchmark_table += benchmark_encoding_decoding(
+                dataset,
+                video_path,
+                imgs_dir,
+                encoding_cfg,
+                decoding_cfg,
+                num_samples,
+                num_workers,
+                save_frames,
+                overwrite=True,
+            )
+
+    headers = ["repo_id", "resolution", "num_pixels", "encoding_preset", *ENCODING_KEYS, *METRICS_HEADERS]
+    now = dt.datetime.now()
+    csv_path = output_dir / f"{now:%Y-%m-%d}_{now:%H-%M-%S}_presets_{num_samples}-samples.csv"
+    pd.DataFrame(benchmark_table, columns=headers).to_csv(csv_path, header=True, index=False)
+    return csv_path
+
+
 def main(
     output_dir: Path,
     repo_ids: list[str],
@@ -320,7 +393,25 @@ def main(
     num_samples: int,
     num_workers: int,
     save_frames: bool,
+    presets: list[str] | None = None,
+    encoding_threads: int | None = None,
 ):
+    if presets:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        decoding_cfg = {"timestamps_modes": timestamps_modes, "backends": backends}
+        csv_path = benchmark_presets(
+            output_dir,
+            repo_ids,
+            presets,
+            encoding_threads,
+            decoding_cfg,
+            num_samples,
+            num_workers,
+            save_frames,
+        )
+        print(pd.read_csv(csv_path).to_string(index=False))
+        return
+
     check_datasets_formats(repo_ids)
     encoding_benchmarks = {
         "g": g,
@@ -333,19 +424,7 @@ def main(
     }
     headers = ["repo_id", "resolution", "num_pixels"]
     headers += list(BASE_ENCODING.keys())
-    headers += [
-        "timestamps_mode",
-        "backend",
-        "video_size_bytes",
-        "images_size_bytes",
-        "video_images_size_ratio",
-        "avg_load_time_video_ms",
-        "avg_load_time_images_ms",
-        "video_images_load_time_ratio",
-        "avg_mse",
-        "avg_psnr",
-        "avg_ssim",
-    ]
+    headers += METRICS_HEADERS
     file_paths = []
     for video_codec in tqdm(vcodec, desc="encodings (vcodec)"):
         for pixel_format in tqdm(pix_fmt, desc="encodings (pix_fmt)", leave=False):
@@ -449,6 +528,20 @@ if __name__ == "__main__":
     #         "For libx264 and libx265/hevc, only 1 is possible. "
     #         "For libsvtav1, 1, 2 or 3 are possible values with a higher number meaning a faster decoding optimization",
     # )
+    parser.add_argument(
+        "--presets",
+        type=str,
+        nargs="*",
+        default=None,
+        help="Benchmark these encoding presets of LeRobotDataset (e.g. svtav1 svtav1-fast x264-ultrafast) "
+        "instead of the --vcodec/--pix-fmt/--g/--crf grid, and report their encoding times.",
+    )
+    parser.add_argument(
+        "--encoding-threads",
+        type=int,
+        default=None,
+        help="Number of encoder threads for the --presets (default: chosen by the encoder).",
+    )
     parser.add_argument(
         "--timestamps-modes",
         type=str,
@@ -28,6 +28,7 @@ import cv2
 import numpy as np
 
 from lerobot.common.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
+from lerobot.common.utils.shared_frames import SharedFrameWriter
 
 from ..camera import Camera
 from ..utils import get_cv2_backend, get_cv2_rotation
@@ -119,6 +120,7 @@ class OpenCVCamera(Camera):
         self.frame_lock: Lock = Lock()
         self.latest_frame: np.ndarray | None = None
         self.new_frame_event: Event = Event()
+        self.frame_writer: SharedFrameWriter | None = None
 
         self.rotation: int | None = get_cv2_rotation(config.rotation)
         self.backend: int = get_cv2_backend()
@@ -167,6 +169,14 @@ class OpenCVCamera(Camera):
 
         self._configure_capture_settings()
 
+        if self.config.shared_memory_name is not None:
+            self.frame_writer = SharedFrameWriter(
+                self.config.shared_memory_name,
+                (self.height, self.width, 3),
+                num_slots=self.config.shared_memory_slots,
+                color_order=self.color_mode.value,
+            )
+
         if warmup:
             start_time = time.time()
             while time.time() - start_time < self.warmup_s:
@@ -321,6 +331,9 @@ class OpenCVCamera(Camera):
 
         processed_frame = self._postprocess_image(frame, color_mode)
 
+        if self.frame_writer is not None and (color_mode is None or color_mode == self.color_mode):
+            self.frame_writer.write(processed_frame)
+
         read_duration_ms = (time.perf_counter() - start_time) * 1e3
         logger.debug(f"{self} read took: {read_duration_ms:.1f}ms")
 
@@ -479,4 +492,8 @@ class OpenCVCamera(Camera):
             self.videocapture.release()
             self.videocapture = None
 
+        if self.frame_writer is not None:
+            self.frame_writer.close()
+            self.frame_writer = None
+
         logger.info(f"{self} disconnected.")
@@ -46,6 +46,10 @@ class OpenCVCameraConfig(CameraConfig):
         color_mode: Color mode for image output (RGB or BGR). Defaults to RGB.
         rotation: Image rotation setting (0°, 90°, 180°, or 270°). Defaults to no rotation.
         warmup_s: Time reading frames before returning from connect (in seconds)
+        shared_memory_name: If set, every frame read is also published to a shared memory ring buffer of this
+            name, so that other processes can read the camera with `SharedMemoryCamera` (or
+            `lerobot.common.utils.shared_frames.SharedFrameReader`) without opening the device.
+        shared_memory_slots: Number of frames kept in the shared memory ring buffer.
 
     Note:
         - Only 3-channel color output (RGB/BGR) is currently supported.
@@ -55,6 +59,8 @@ class OpenCVCameraConfig(CameraConfig):
     color_mode: ColorMode = ColorMode.RGB
     rotation: Cv2Rotation = Cv2Rotation.NO_ROTATION
     warmup_s: int = 1
+    shared_memory_name: str | None = None
+    shared_memory_slots: int = 8
 
     def __post_init__(self):
         if self.color_mode not in (ColorMode.RGB, ColorMode.BGR):
@@ -0,0 +1,182 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Provides the SharedMemoryCamera class for reading frames another process publishes to shared memory.
+"""
+
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+from lerobot.common.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
+from lerobot.common.utils.shared_frames import SharedFrameReader
+
+from ..camera import Camera
+from .configuration_shared_memory import ColorMode, SharedMemoryCameraConfig
+
+logger = logging.getLogger(__name__)
+
+
+class SharedMemoryCamera(Camera):
+    """
+    Reads a camera owned by another process through its shared memory ring buffer.
+
+    Only one process can open a physical camera. When that process publishes its frames (see
+    `OpenCVCameraConfig.shared_memory_name`), any number of other processes can read them with this class:
+    no device is opened, so there is no handoff delay or retry loop when switching between processes.
+
+    Example:
+        ```python
+        # Owner process
+        owner = OpenCVCamera(OpenCVCameraConfig(index_or_path=2, shared_memory_name="lerobot_camera_right"))
+        owner.connect()
+        owner.async_read()  # starts the background read thread, which publishes every frame
+
+        # Any other process
+        camera = SharedMemoryCamera(SharedMemoryCameraConfig(name="lerobot_camera_right"))
+        camera.connect()
+        frame = camera.async_read()
+        ```
+    """
+
+    def __init__(self, config: SharedMemoryCameraConfig):
+        super().__init__(config)
+
+        self.config = config
+        self.name = config.name
+        self.color_mode = config.color_mode
+        self.reader: SharedFrameReader | None = None
+        self.last_seq = 0
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.name})"
+
+    @property
+    def is_connected(self) -> bool:
+        return self.reader is not None
+
+    def connect(self, warmup: bool = True):
+        """
+        Attaches to the shared memory buffer, waiting up to `connect_timeout_s` for the publisher.
+
+        Raises:
+            DeviceAlreadyConnectedError: If the camera is already connected.
+            ConnectionError: If nothing is published under this name in time.
+            RuntimeError: If the published frames don't have the configured width and height.
+        """
+        if self.is_connected:
+            raise DeviceAlreadyConnectedError(f"{self} is already connected.")
+
+        deadline = time.perf_counter() + self.config.connect_timeout_s
+        while self.reader is None:
+            try:
+                self.reader = SharedFrameReader(self.name)
+            except FileNotFoundError as e:
+                if time.perf_counter() > deadline:
+                    raise ConnectionError(f"Nothing is published to {self}.") from e
+                time.sleep(0.05)
+
+        height, width, _ = self.reader.shape
+        if (self.width is not None and self.width != width) or (
+            self.height is not None and self.height != height
+        ):
+            self.disconnect()
+            raise RuntimeError(
+                f"{self} frames are {width}x{height}, but width={self.width} and "
+                f"height={self.height} are configured."
+            )
+        self.width, self.height = width, height
+
+        if warmup:
+            self.read()
+
+        logger.info(f"{self} connected.")
+
+    @staticmethod
+    def find_cameras() -> List[Dict[str, Any]]:
+        """Lists the frame buffers currently published on this machine (Linux only)."""
+        found = []
+        for path in sorted(Path("/dev/shm").glob("*")):
+            try:
+                reader = SharedFrameReader(path.name)
+            except (OSError, TypeError, ValueError):
+                continue
+            height, width, channels = reader.shape
+            found.append(
+                {
+                    "name": path.name,
+                    "type": "SharedMemory",
+                    "id": path.name,
+                    "default_stream_profile": {"width": width, "height": height, "channels": channels},
+                }
+            )
+            reader.close()
+        return found
+
+    def _postprocess_image(self, frame: np.ndarray, color_mode: ColorMode | None = None) -> np.ndarray:
+        requested_color_mode = self.color_mode if color_mode is None else color_mode
+        if requested_color_mode not in (ColorMode.RGB, ColorMode.BGR):
+            raise ValueError(
+                f"Invalid color mode '{requested_color_mode}'. Expected {ColorMode.RGB} or {ColorMode.BGR}."
+            )
+        if requested_color_mode.value != self.reader.color_order:
+            frame = np.ascontiguousarray(frame[..., ::-1])
+        return frame
+
+    def _read_new_frame(self, timeout_s: float, color_mode: ColorMode | None = None) -> np.ndarray:
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        frame, self.last_seq, _ = self.reader.wait_for_frame(self.last_seq, timeout_s)
+        return self._postprocess_image(frame, color_mode)
+
+    def read(self, color_mode: ColorMode | None = None) -> np.ndarray:
+        """
+        Returns the next frame published after the last one this camera returned.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            TimeoutError: If the publisher doesn't publish a new frame within a second.
+        """
+        return self._read_new_frame(1.0, color_mode)
+
+    def async_read(self, timeout_ms: float = 200) -> np.ndarray:
+        """
+        Returns the latest published frame, waiting up to `timeout_ms` if it was already returned.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+            TimeoutError: If no new frame is published within the specified timeout.
+        """
+        return self._read_new_frame(timeout_ms / 1000.0)
+
+    def disconnect(self):
+        """
+        Detaches from the shared memory buffer. The publisher and other readers are not affected.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is already disconnected.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(f"{self} not connected.")
+
+        self.reader.close()
+        self.reader = None
+        self.last_seq = 0
+
+        logger.info(f"{self} disconnected.")
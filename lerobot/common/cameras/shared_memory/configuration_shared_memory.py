@@ -0,0 +1,50 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass
+
+from ..configs import CameraConfig, ColorMode
+
+
+@CameraConfig.register_subclass("shared_memory")
+@dataclass
+class SharedMemoryCameraConfig(CameraConfig):
+    """Configuration class for cameras published to shared memory by another process.
+
+    The process owning the device publishes its frames with `OpenCVCameraConfig(shared_memory_name=...)`;
+    this camera reads them back without opening the device.
+
+    Example configuration:
+    ```python
+    SharedMemoryCameraConfig(name="lerobot_camera_right")
+    ```
+
+    Attributes:
+        name: Name of the shared memory ring buffer the frames are published to.
+        color_mode: Color mode for image output (RGB or BGR). Defaults to RGB.
+        connect_timeout_s: Time to wait for the publisher to create the buffer and publish a first frame.
+
+    Note:
+        - fps, width and height are those of the publishing camera. If set, they are checked on connect.
+    """
+
+    name: str
+    color_mode: ColorMode = ColorMode.RGB
+    connect_timeout_s: float = 5.0
+
+    def __post_init__(self):
+        if self.color_mode not in (ColorMode.RGB, ColorMode.BGR):
+            raise ValueError(
+                f"`color_mode` is expected to be {ColorMode.RGB.value} or {ColorMode.BGR.value}, but {self.color_mode} is provided."
+            )
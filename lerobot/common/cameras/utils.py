@@ -37,6 +37,11 @@ def make_cameras_from_configs(camera_configs: dict[str, CameraConfig]) -> dict[s
             from .realsense.camera_realsense import RealSenseCamera
 
             cameras[key] = RealSenseCamera(cfg)
+
+        elif cfg.type == "shared_memory":
+            from .shared_memory import SharedMemoryCamera
+
+            cameras[key] = SharedMemoryCamera(cfg)
         else:
             raise ValueError(f"The motor type '{cfg.type}' is not valid.")
 
@@ -13,10 +13,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import numpy as np
+import torch
 
 from lerobot.common.datasets.utils import load_image_as_numpy
 
+# Quantiles reported along with min/max/mean/std, under the keys "q01", "q10", ... (see `get_quantile_key`)
+QUANTILES = (0.01, 0.10, 0.50, 0.90, 0.99)
+
+
+def get_quantile_key(quantile: float) -> str:
+    return f"q{round(quantile * 100):02d}"
+
 
 def estimate_num_samples(
     dataset_len: int, min_num_samples: int = 100, max_num_samples: int = 10_000, power: float = 0.75
@@ -73,36 +84,140 @@ def sample_images(image_paths: list[str]) -> np.ndarray:
 
 
 def get_feature_stats(array: np.ndarray, axis: tuple, keepdims: bool) -> dict[str, np.ndarray]:
-    return {
+    stats = {
         "min": np.min(array, axis=axis, keepdims=keepdims),
         "max": np.max(array, axis=axis, keepdims=keepdims),
         "mean": np.mean(array, axis=axis, keepdims=keepdims),
         "std": np.std(array, axis=axis, keepdims=keepdims),
-        "count": np.array([len(array)]),
     }
+    # np.quantile interpolates between values, which isn't defined for booleans
+    values = array.astype(np.uint8) if array.dtype == bool else array
+    quantiles = np.quantile(values, QUANTILES, axis=axis, keepdims=keepdims)
+    for quantile, value in zip(QUANTILES, quantiles, strict=True):
+        stats[get_quantile_key(quantile)] = value
+    stats["count"] = np.array([len(array)])
+    return stats
+
+
+class RunningImageStats:
+    """
+    Per-channel stats of uint8 images accumulated image by image, in a single pass over each image.
+
+    Each image only adds its pixel values to a 256-bin histogram per channel, from which min, max, mean, std
+    and quantiles are then exact (no floating point accumulation, no second pass for the variance), and
+    which takes constant memory however many images are added. `count` is the number of images, and
+    `get_stats` returns the same normalized format as `compute_episode_stats`.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.histograms: np.ndarray | None = None  # (channels, 256)
+
+    def update(self, img: np.ndarray) -> None:
+        """`img` is a uint8 channel-first image."""
+        img = auto_downsample_height_width(img)
+        num_channels = img.shape[0]
+        # Offset the values of each channel so that a single bincount fills every histogram
+        offsets = np.arange(0, 256 * num_channels, 256, dtype=np.intp)[:, None]
+        values = img.reshape(num_channels, -1) + offsets
+        histograms = np.bincount(values.ravel(), minlength=256 * num_channels).reshape(num_channels, 256)
+        if self.histograms is None:
+            self.histograms = histograms
+        else:
+            self.histograms += histograms
+        self.count += 1
+
+    def get_stats(self) -> dict[str, np.ndarray]:
+        if self.count == 0:
+            raise ValueError("No image was added to the stats.")
+        values = np.arange(256, dtype=np.int64)
+        num_pixels = self.histograms.sum(axis=1)
+        total = self.histograms @ values
+        total_sq = self.histograms @ values**2
+        mean = total / num_pixels
+        # Integer sums, so that the variance doesn't suffer from cancellation
+        variance = (num_pixels * total_sq - total**2) / num_pixels**2
+
+        nonzero = self.histograms > 0
+        stats = {
+            "min": nonzero.argmax(axis=1),
+            "max": 255 - nonzero[:, ::-1].argmax(axis=1),
+            "mean": mean,
+            "std": np.sqrt(variance),
+        }
+        # Same linear interpolation between the closest ranks as `np.quantile`
+        cumulative = self.histograms.cumsum(axis=1)
+        for quantile in QUANTILES:
+            rank = quantile * (num_pixels - 1)
+            low = np.floor(rank).astype(np.int64)
+            value_low = np.array(
+                [np.searchsorted(c, r, side="right") for c, r in zip(cumulative, low, strict=True)]
+            )
+            high = np.minimum(low + 1, num_pixels - 1)
+            value_high = np.array(
+                [np.searchsorted(c, r, side="right") for c, r in zip(cumulative, high, strict=True)]
+            )
+            stats[get_quantile_key(quantile)] = value_low + (rank - low) * (value_high - value_low)
+
+        stats = {k: v.reshape(-1, 1, 1) / 255.0 for k, v in stats.items()}
+        stats["count"] = np.array([self.count])
+        return stats
+
+
+def image_to_uint8_chw(img: np.ndarray | torch.Tensor) -> np.ndarray:
+    """Image in memory (uint8, or float in [0, 1], channel first or last) as a uint8 channel-first array."""
+    if isinstance(img, torch.Tensor):
+        img = img.numpy(force=True)
+    if img.dtype != np.uint8:
+        img = np.round(img * 255).astype(np.uint8)
+    if img.shape[-1] in (1, 3, 4) and img.shape[0] not in (1, 3, 4):
+        img = img.transpose(2, 0, 1)
+    return img
+
+
+def compute_image_stats(images: list[str | Path] | np.ndarray | torch.Tensor) -> dict[str, np.ndarray]:
+    """
+    Stats of a sample of the images of an episode (see `sample_indices`), which are given either as file paths
+    or in memory (e.g. the frames of the episode buffer, or decoded frames), in any format accepted by
+    `image_to_uint8_chw`.
+    """
+    stats = RunningImageStats()
+    for idx in sample_indices(len(images)):
+        img = images[idx]
+        if isinstance(img, (str, Path)):
+            # we load as uint8 to reduce memory usage
+            img = load_image_as_numpy(img, dtype=np.uint8, channel_first=True)
+        else:
+            img = image_to_uint8_chw(img)
+        stats.update(img)
+    return stats.get_stats()
 
 
-def compute_episode_stats(episode_data: dict[str, list[str] | np.ndarray], features: dict) -> dict:
+def compute_episode_stats(
+    episode_data: dict[str, list[str] | np.ndarray], features: dict, num_workers: int = 4
+) -> dict:
+    """
+    Stats of each feature of an episode. Images (file paths or frames in memory) are by far the most
+    expensive to process: the cameras are processed concurrently by up to `num_workers` threads (image
+    decoding and numpy release the GIL). Use `num_workers=0` to process them in the calling thread.
+    """
+    image_keys = [key for key in episode_data if features[key]["dtype"] in ["image", "video"]]
+    if num_workers > 0 and len(image_keys) > 1:
+        with ThreadPoolExecutor(max_workers=min(num_workers, len(image_keys))) as executor:
+            futures = {key: executor.submit(compute_image_stats, episode_data[key]) for key in image_keys}
+            image_stats = {key: future.result() for key, future in futures.items()}
+    else:
+        image_stats = {key: compute_image_stats(episode_data[key]) for key in image_keys}
+
     ep_stats = {}
     for key, data in episode_data.items():
         if features[key]["dtype"] == "string":
             continue  # HACK: we should receive np.arrays of strings
         elif features[key]["dtype"] in ["image", "video"]:
-            ep_ft_array = sample_images(data)  # data is a list of image paths
-            axes_to_reduce = (0, 2, 3)  # keep channel dim
-            keepdims = True
+            ep_stats[key] = image_stats[key]
         else:
-            ep_ft_array = data  # data is already a np.ndarray
-            axes_to_reduce = 0  # compute stats over the first axis
-            keepdims = data.ndim == 1  # keep as np.array
-
-        ep_stats[key] = get_feature_stats(ep_ft_array, axis=axes_to_reduce, keepdims=keepdims)
-
-        # finally, we normalize and remove batch dim for images
-        if features[key]["dtype"] in ["image", "video"]:
-            ep_stats[key] = {
-                k: v if k == "count" else np.squeeze(v / 255.0, axis=0) for k, v in ep_stats[key].items()
-            }
+            # data is already a np.ndarray, compute stats over the first axis (keep 1D data as np.array)
+            ep_stats[key] = get_feature_stats(data, axis=0, keepdims=data.ndim == 1)
 
     return ep_stats
 
@@ -123,8 +238,57 @@ def _assert_type_and_shape(stats_list: list[dict[str, dict]]):
                     raise ValueError(f"Shape of '{k}' must be (3,1,1), but is {v.shape} instead.")
 
 
-def aggregate_feature_stats(stats_ft_list: list[dict[str, dict]]) -> dict[str, dict[str, np.ndarray]]:
-    """Aggregates stats for a single feature."""
+def aggregate_quantiles(stats_ft_list: list[dict[str, np.ndarray]]) -> dict[str, np.ndarray]:
+    """
+    Approximates the quantiles of a feature over several sets of values (e.g. episodes) from the min, max and
+    quantiles of each set: the CDF of each set is interpolated linearly between these points, and the CDF of
+    their union, the average of these CDFs weighted by the counts, is inverted at each quantile.
+
+    The CDF of the union is piecewise linear between the points of all sets, so it is computed in a single
+    sorted sweep over these points, for all the dimensions of the feature at once.
+    """
+    levels = np.array([0.0, *QUANTILES, 1.0])
+    quantile_keys = [get_quantile_key(q) for q in QUANTILES]
+    # (num sets, num levels, *feature shape)
+    points = np.stack([np.stack([s["min"], *[s[k] for k in quantile_keys], s["max"]]) for s in stats_ft_list])
+    shape = points.shape[2:]
+    points = points.reshape(*points.shape[:2], -1).astype(np.float64)
+    num_dims = points.shape[2]
+    counts = np.array([s["count"].item() for s in stats_ft_list], dtype=np.float64)
+
+    # Probability mass between consecutive points of each set, spread uniformly between them (or
+    # concentrated on a single value when they are equal)
+    mass = (counts / counts.sum())[:, None, None] * np.diff(levels)[None, :, None]
+    width = points[:, 1:] - points[:, :-1]
+    density = np.divide(mass, width, out=np.zeros_like(width), where=width > 0)
+    jump = np.where(width > 0, 0.0, mass)
+
+    # Sweep the start and end of every piece in increasing order, per dimension
+    x = np.concatenate([points[:, :-1].reshape(-1, num_dims), points[:, 1:].reshape(-1, num_dims)])
+    density_change = np.concatenate([density.reshape(-1, num_dims), -density.reshape(-1, num_dims)])
+    jump = np.concatenate([jump.reshape(-1, num_dims), np.zeros_like(jump).reshape(-1, num_dims)])
+    order = np.argsort(x, axis=0, kind="stable")
+    x = np.take_along_axis(x, order, axis=0)
+    density = np.maximum(np.cumsum(np.take_along_axis(density_change, order, axis=0), axis=0), 0.0)
+    cdf = np.cumsum(np.take_along_axis(jump, order, axis=0), axis=0)
+    cdf[1:] += np.cumsum(density[:-1] * np.diff(x, axis=0), axis=0)
+
+    quantiles = np.stack([np.interp(QUANTILES, cdf[:, dim], x[:, dim]) for dim in range(num_dims)], axis=1)
+    return {key: quantiles[i].reshape(shape) for i, key in enumerate(quantile_keys)}
+
+
+def has_quantiles(stats_ft_list: list[dict[str, np.ndarray]]) -> bool:
+    # Stats computed before quantiles were added don't have them
+    return all(get_quantile_key(q) in s for s in stats_ft_list for q in QUANTILES)
+
+
+def aggregate_feature_stats(
+    stats_ft_list: list[dict[str, dict]], quantiles: bool = True
+) -> dict[str, dict[str, np.ndarray]]:
+    """
+    Aggregates stats for a single feature. With `quantiles=False`, only min, max, mean, std and count are
+    aggregated: they are exact, so that stats aggregated this way can be aggregated again with new ones.
+    """
     means = np.stack([s["mean"] for s in stats_ft_list])
     variances = np.stack([s["std"] ** 2 for s in stats_ft_list])
     counts = np.stack([s["count"] for s in stats_ft_list])
@@ -143,16 +307,21 @@ def aggregate_feature_stats(stats_ft_list: list[dict[str, dict]]) -> dict[str, d
     weighted_variances = (variances + delta_means**2) * counts
     total_variance = weighted_variances.sum(axis=0) / total_count
 
-    return {
+    aggregated = {
         "min": np.min(np.stack([s["min"] for s in stats_ft_list]), axis=0),
         "max": np.max(np.stack([s["max"] for s in stats_ft_list]), axis=0),
         "mean": total_mean,
         "std": np.sqrt(total_variance),
-        "count": total_count,
     }
+    if quantiles and has_quantiles(stats_ft_list):
+        aggregated.update(aggregate_quantiles(stats_ft_list))
+    aggregated["count"] = total_count
+    return aggregated
 
 
-def aggregate_stats(stats_list: list[dict[str, dict]]) -> dict[str, dict[str, np.ndarray]]:
+def aggregate_stats(
+    stats_list: list[dict[str, dict]], quantiles: bool = True
+) -> dict[str, dict[str, np.ndarray]]:
     """Aggregate stats from multiple compute_stats outputs into a single set of stats.
 
     The final stats will have the union of all data keys from each of the stats dicts.
@@ -162,6 +331,8 @@ def aggregate_stats(stats_list: list[dict[str, dict]]) -> dict[str, dict[str, np
     - new_max = max(max_dataset_0, max_dataset_1, ...)
     - new_mean = (mean of all data, weighted by counts)
     - new_std = (std of all data)
+    - new_q01, new_q10... = (approximate quantiles of all data, see `aggregate_quantiles`), unless
+      `quantiles=False`
     """
 
     _assert_type_and_shape(stats_list)
@@ -171,6 +342,6 @@ def aggregate_stats(stats_list: list[dict[str, dict]]) -> dict[str, dict[str, np
 
     for key in data_keys:
         stats_with_key = [stats[key] for stats in stats_list if key in stats]
-        aggregated_stats[key] = aggregate_feature_stats(stats_with_key)
+        aggregated_stats[key] = aggregate_feature_stats(stats_with_key, quantiles=quantiles)
 
     return aggregated_stats
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+
+DEFAULT_CAPACITY = 1024
+
+
+class GrowableArray:
+    """
+    Column of an episode buffer: rows of a fixed shape and dtype appended one at a time.
+
+    Rows are copied into a preallocated array, which doubles its capacity when it is full, so appending a frame
+    doesn't allocate a Python object per value and `array` returns the rows without stacking them.
+    """
+
+    def __init__(self, shape: tuple[int, ...], dtype: str | np.dtype, capacity: int = DEFAULT_CAPACITY):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self._data = np.empty((capacity, *self.shape), dtype=self.dtype)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, idx):
+        return self.array[idx]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(shape={self.shape}, dtype={self.dtype}, size={self._size})"
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    @property
+    def array(self) -> np.ndarray:
+        """The appended rows (a view, not a copy)."""
+        return self._data[: self._size]
+
+    def matches(self, value: np.ndarray) -> bool:
+        """Whether `value` is a row of this column, with the exact shape and dtype."""
+        return isinstance(value, np.ndarray) and value.shape == self.shape and value.dtype == self.dtype
+
+    def append(self, value) -> None:
+        if self._size == len(self._data):
+            grown = np.empty((2 * len(self._data), *self.shape), dtype=self.dtype)
+            grown[: self._size] = self._data
+            self._data = grown
+        self._data[self._size] = value
+        self._size += 1
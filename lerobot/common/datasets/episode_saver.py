@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class AsyncEpisodeSaver:
+    """
+    Finalizes recorded episodes (parquet file, stats, videos, metadata) in a background thread, so that
+    `LeRobotDataset.save_episode` returns as soon as the episode buffer is handed over and the next episode
+    (or the reset period) can start while the previous one is written.
+
+    Episodes are finalized one at a time, in the order they were submitted. Since the dataset metadata is
+    only updated once an episode is finalized, the saver keeps track of the episode and frame indices
+    already handed out to pending episodes.
+
+    An exception raised while finalizing an episode is raised again by the next call to `submit`,
+    `raise_error` or `wait_until_done`; episodes submitted after it are not finalized.
+    """
+
+    def __init__(self, total_episodes: int, total_frames: int):
+        self.next_episode_index = total_episodes
+        self.next_frame_index = total_frames
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="episode_saver")
+        self.futures: list[Future] = []
+        self.error: Exception | None = None
+        self._stopped = False
+
+    def _run(self, fn: Callable, *args) -> Any:
+        if self.error is not None:
+            raise RuntimeError("Not finalized because a previous episode failed.") from self.error
+        try:
+            return fn(*args)
+        except Exception as e:
+            self.error = e
+            raise
+
+    def submit(self, episode_length: int, fn: Callable, *args) -> Future:
+        """Reserves the next episode index and `episode_length` frame indices, then runs `fn(*args)`."""
+        self.raise_error()
+        if self._stopped:
+            raise RuntimeError("The episode saver is stopped.")
+        self.next_episode_index += 1
+        self.next_frame_index += episode_length
+        future = self.executor.submit(self._run, fn, *args)
+        self.futures = [f for f in self.futures if not f.done()] + [future]
+        return future
+
+    def raise_error(self):
+        if self.error is not None:
+            raise RuntimeError("Saving a previous episode failed.") from self.error
+
+    @property
+    def num_pending(self) -> int:
+        return sum(not f.done() for f in self.futures)
+
+    def wait_until_done(self):
+        """Blocks until every submitted episode is finalized."""
+        for future in self.futures:
+            future.exception()
+        self.futures = []
+        self.raise_error()
+
+    def stop(self):
+        if self._stopped:
+            return
+        self._stopped = True
+        try:
+            self.wait_until_done()
+        finally:
+            self.executor.shutdown(wait=True)
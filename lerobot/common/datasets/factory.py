@@ -95,6 +95,9 @@ def make_dataset(cfg: TrainPipelineConfig) -> LeRobotDataset | MultiLeRobotDatas
             image_transforms=image_transforms,
             revision=cfg.dataset.revision,
             video_backend=cfg.dataset.video_backend,
+            frame_store=cfg.dataset.frame_store,
+            frame_store_resolution=cfg.dataset.frame_store_resolution,
+            tensor_cache=cfg.dataset.tensor_cache,
         )
     else:
         raise NotImplementedError("The MultiLeRobotDataset isn't supported for now.")
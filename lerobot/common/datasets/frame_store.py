@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import shutil
+from pathlib import Path
+
+import av
+import numpy as np
+import torch
+from torchvision.transforms.v2 import functional as F  # noqa: N812
+
+from lerobot.common.datasets.utils import load_json, write_json
+
+MANIFEST_NAME = "manifest.json"
+
+
+class DecodedFrameStore:
+    """
+    Video frames decoded once and stored on local disk as uint8 arrays (one .npy file per episode and camera),
+    read back through memory maps.
+
+    Decoding a video is much more expensive than reading its frames from the page cache, so for datasets
+    small enough to fit on disk once decoded, training reads frames from this store instead of decoding
+    them again at every epoch. Frames can be downscaled (e.g. to the input resolution of the policy) when
+    the store is built, which also reduces its size: 640x480 RGB frames take 0.9MB each.
+
+    The store is keyed on the dataset revision and resolution: it is rebuilt from scratch if either changed.
+    Each stored episode also records the size and modification time of its source video, so a video which
+    was re-recorded or re-downloaded is decoded again.
+    """
+
+    def __init__(self, store_dir: str | Path, revision: str, resolution: tuple[int, int] | None = None):
+        self.store_dir = Path(store_dir)
+        self.revision = revision
+        self.resolution = tuple(resolution) if resolution is not None else None
+        self.episodes: dict[str, dict] = {}
+        self._arrays: dict[str, np.ndarray] = {}
+        self._timestamps: dict[str, np.ndarray] = {}
+
+        manifest_path = self.store_dir / MANIFEST_NAME
+        if manifest_path.is_file():
+            manifest = load_json(manifest_path)
+            if manifest["revision"] == self.revision and manifest["resolution"] == self._resolution_json:
+                self.episodes = manifest["episodes"]
+            else:
+                logging.info(f"Frame store at {self.store_dir} is outdated, rebuilding it.")
+                shutil.rmtree(self.store_dir)
+
+    @property
+    def _resolution_json(self) -> list[int] | None:
+        return list(self.resolution) if self.resolution is not None else None
+
+    def __getstate__(self) -> dict:
+        # Memory maps are opened again in each process instead of being pickled with their content
+        state = self.__dict__.copy()
+        state["_arrays"], state["_timestamps"] = {}, {}
+        return state
+
+    @staticmethod
+    def _get_name(episode_index: int, video_key: str) -> str:
+        return f"{video_key}/episode_{episode_index:06d}"
+
+    @staticmethod
+    def _get_fingerprint(video_path: Path) -> list[int]:
+        stat = video_path.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def is_stored(self, episode_index: int, video_key: str, video_path: Path) -> bool:
+        entry = self.episodes.get(self._get_name(episode_index, video_key))
+        return entry is not None and entry["source"] == self._get_fingerprint(video_path)
+
+    def add(self, episode_index: int, video_key: str, video_path: Path, num_frames: int) -> None:
+        """Decodes the `num_frames` frames of `video_path` into the store."""
+        name = self._get_name(episode_index, video_key)
+        frames_path = self.store_dir / f"{name}.npy"
+        frames_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = frames_path.with_suffix(".tmp.npy")
+
+        timestamps = np.empty(num_frames, dtype=np.float64)
+        frames = None
+        with av.open(str(video_path)) as container:
+            stream = container.streams.video[0]
+            stream.thread_type = "AUTO"
+            time_base = float(stream.time_base)
+            for i, frame in enumerate(container.decode(stream)):
+                if i == num_frames:
+                    raise ValueError(f"{video_path} has more than the {num_frames} frames of its episode.")
+                image = torch.from_numpy(frame.to_ndarray(format="rgb24")).permute(2, 0, 1)
+                if self.resolution is not None:
+                    image = F.resize(image, list(self.resolution), antialias=True)
+                if frames is None:
+                    frames = np.lib.format.open_memmap(
+                        tmp_path, mode="w+", dtype=np.uint8, shape=(num_frames, *image.shape)
+                    )
+                frames[i] = image.numpy()
+                timestamps[i] = frame.pts * time_base
+
+        if frames is None or i + 1 != num_frames:
+            raise ValueError(f"{video_path} has fewer frames than the {num_frames} of its episode.")
+        frames.flush()
+        del frames
+        tmp_path.replace(frames_path)
+
+        self.episodes[name] = {
+            "source": self._get_fingerprint(video_path),
+            "timestamps": timestamps.tolist(),
+        }
+        self._arrays.pop(name, None)
+        self._timestamps.pop(name, None)
+
+    def write_manifest(self) -> None:
+        manifest = {"revision": self.revision, "resolution": self._resolution_json, "episodes": self.episodes}
+        write_json(manifest, self.store_dir / MANIFEST_NAME)
+
+    def _load(self, name: str) -> tuple[np.ndarray, np.ndarray]:
+        if name not in self._arrays:
+            # Copy-on-write mapping: writable (as torch expects) without ever modifying the file
+            self._arrays[name] = np.load(self.store_dir / f"{name}.npy", mmap_mode="c")
+            self._timestamps[name] = np.array(self.episodes[name]["timestamps"])
+        return self._arrays[name], self._timestamps[name]
+
+    def get_frames(
+        self, episode_index: int, video_key: str, timestamps: list[float], tolerance_s: float
+    ) -> torch.Tensor:
+        """
+        Frames of an episode at `timestamps`, as uint8 channel first frames. Consecutive frames (e.g. a single
+        timestamp) are returned as a view of the memory map, without copying them.
+        """
+        name = self._get_name(episode_index, video_key)
+        frames, frames_ts = self._load(name)
+        query_ts = np.asarray(timestamps)
+        indices = np.abs(frames_ts[None, :] - query_ts[:, None]).argmin(axis=1)
+        loaded_ts = frames_ts[indices]
+
+        min_ = np.abs(query_ts - loaded_ts)
+        is_within_tol = min_ < tolerance_s
+        assert is_within_tol.all(), (
+            f"One or several query timestamps unexpectedly violate the tolerance ({min_[~is_within_tol]} > {tolerance_s=})."
+            "It means that the closest frame that can be loaded from the video is too far away in time."
+            "This might be due to synchronization issues with timestamps during data collection."
+            "To be safe, we advise to ignore this item during training."
+            f"\nqueried timestamps: {query_ts}"
+            f"\nloaded timestamps: {loaded_ts}"
+            f"\nframe store: {self.store_dir / name}"
+        )
+
+        first = indices[0]
+        if np.array_equal(indices, np.arange(first, first + len(indices))):
+            return torch.from_numpy(frames[first : first + len(indices)])
+        return torch.from_numpy(frames[indices])
+
+
+def build_frame_store(
+    store_dir: str | Path,
+    revision: str,
+    videos: dict[tuple[int, str], tuple[Path, int]],
+    resolution: tuple[int, int] | None = None,
+) -> DecodedFrameStore:
+    """
+    Opens the frame store at `store_dir` and decodes the videos it is missing into it.
+
+    Args:
+        store_dir: Local directory of the store.
+        revision: Revision of the dataset. A store built from another revision is rebuilt.
+        videos: (episode index, video key) -> (video path, number of frames) of the videos to store.
+        resolution: (height, width) to downscale the frames to. Defaults to the resolution of the videos.
+    """
+    store = DecodedFrameStore(store_dir, revision, resolution)
+    missing = {k: v for k, v in videos.items() if not store.is_stored(*k, v[0])}
+    if missing:
+        logging.info(f"Decoding {len(missing)} videos into the frame store at {store.store_dir}")
+    for (episode_index, video_key), (video_path, num_frames) in missing.items():
+        store.add(episode_index, video_key, video_path, num_frames)
+        # Saved after each video so that an interrupted build resumes where it stopped
+        store.write_manifest()
+    return store
@@ -16,6 +16,7 @@
 import multiprocessing
 import queue
 import threading
+from collections.abc import Hashable
 from pathlib import Path
 
 import numpy as np
@@ -81,21 +82,23 @@ def write_image(image: np.ndarray | PIL.Image.Image, fpath: Path):
         print(f"Error writing image {fpath}: {e}")
 
 
-def worker_thread_loop(queue: queue.Queue):
+def worker_thread_loop(queue: queue.Queue, done_queue: queue.Queue | None = None):
     while True:
         item = queue.get()
         if item is None:
             queue.task_done()
             break
-        image_array, fpath = item
+        image_array, fpath, tag = item
         write_image(image_array, fpath)
+        if tag is not None and done_queue is not None:
+            done_queue.put(tag)
         queue.task_done()
 
 
-def worker_process(queue: queue.Queue, num_threads: int):
+def worker_process(queue: queue.Queue, num_threads: int, done_queue: queue.Queue | None = None):
     threads = []
     for _ in range(num_threads):
-        t = threading.Thread(target=worker_thread_loop, args=(queue,))
+        t = threading.Thread(target=worker_thread_loop, args=(queue, done_queue))
         t.daemon = True
         t.start()
         threads.append(t)
@@ -116,6 +119,9 @@ class AsyncImageWriter:
     The optimal number of processes and threads depends on your computer capabilities.
     We advise to use 4 threads per camera with 0 processes. If the fps is not stable, try to increase or lower
     the number of threads. If it is still not stable, try to use 1 subprocess, or more.
+
+    Images can be saved with a `tag` (e.g. their episode index), to wait for the images of that tag only,
+    while images of other tags (e.g. the next episode being recorded) keep being added.
     """
 
     def __init__(self, num_processes: int = 0, num_threads: int = 1):
@@ -125,6 +131,9 @@ class AsyncImageWriter:
         self.threads = []
         self.processes = []
         self._stopped = False
+        # Number of images not written yet, by tag
+        self._pending: dict[Hashable, int] = {}
+        self._pending_cond = threading.Condition()
 
         if num_threads <= 0 and num_processes <= 0:
             raise ValueError("Number of threads and processes must be greater than zero.")
@@ -132,28 +141,62 @@ class AsyncImageWriter:
         if self.num_processes == 0:
             # Use threading
             self.queue = queue.Queue()
+            self.done_queue = queue.Queue()
             for _ in range(self.num_threads):
-                t = threading.Thread(target=worker_thread_loop, args=(self.queue,))
+                t = threading.Thread(target=worker_thread_loop, args=(self.queue, self.done_queue))
                 t.daemon = True
                 t.start()
                 self.threads.append(t)
         else:
             # Use multiprocessing
             self.queue = multiprocessing.JoinableQueue()
+            self.done_queue = multiprocessing.Queue()
             for _ in range(self.num_processes):
-                p = multiprocessing.Process(target=worker_process, args=(self.queue, self.num_threads))
+                p = multiprocessing.Process(
+                    target=worker_process, args=(self.queue, self.num_threads, self.done_queue)
+                )
                 p.daemon = True
                 p.start()
                 self.processes.append(p)
 
-    def save_image(self, image: torch.Tensor | np.ndarray | PIL.Image.Image, fpath: Path):
+        # Counts the tagged images written by the workers
+        self._done_thread = threading.Thread(target=self._collect_done, daemon=True)
+        self._done_thread.start()
+
+    def _collect_done(self):
+        while (tag := self.done_queue.get()) is not None:
+            self._mark_done(tag)
+
+    def _mark_done(self, tag: Hashable):
+        with self._pending_cond:
+            self._pending[tag] -= 1
+            if self._pending[tag] == 0:
+                del self._pending[tag]
+                self._pending_cond.notify_all()
+
+    def save_image(
+        self, image: torch.Tensor | np.ndarray | PIL.Image.Image, fpath: Path, tag: Hashable | None = None
+    ):
         if isinstance(image, torch.Tensor):
             # Convert tensor to numpy array to minimize main process time
             image = image.cpu().numpy()
-        self.queue.put((image, fpath))
-
-    def wait_until_done(self):
-        self.queue.join()
+        if tag is not None:
+            with self._pending_cond:
+                self._pending[tag] = self._pending.get(tag, 0) + 1
+        try:
+            self.queue.put((image, fpath, tag))
+        except Exception:
+            if tag is not None:
+                self._mark_done(tag)
+            raise
+
+    def wait_until_done(self, tag: Hashable | None = None):
+        """Waits until every image is written, or only the images saved with `tag`."""
+        if tag is None:
+            self.queue.join()
+        else:
+            with self._pending_cond:
+                self._pending_cond.wait_for(lambda: tag not in self._pending)
 
     def stop(self):
         if self._stopped:
@@ -175,4 +218,10 @@ class AsyncImageWriter:
             self.queue.close()
             self.queue.join_thread()
 
+        self.done_queue.put(None)
+        self._done_thread.join()
+        if self.num_processes > 0:
+            self.done_queue.close()
+            self.done_queue.join_thread()
+
         self._stopped = True
@@ -16,6 +16,9 @@
 import contextlib
 import logging
 import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
 from typing import Callable
 
@@ -31,8 +34,20 @@ from huggingface_hub.constants import REPOCARD_NAME
 from huggingface_hub.errors import RevisionNotFoundError
 
 from lerobot.common.constants import HF_LEROBOT_HOME
-from lerobot.common.datasets.compute_stats import aggregate_stats, compute_episode_stats
+from lerobot.common.datasets.compute_stats import (
+    RunningImageStats,
+    aggregate_quantiles,
+    aggregate_stats,
+    compute_episode_stats,
+    has_quantiles,
+    image_to_uint8_chw,
+    sample_indices,
+)
+from lerobot.common.datasets.episode_buffer import GrowableArray
+from lerobot.common.datasets.episode_saver import AsyncEpisodeSaver
+from lerobot.common.datasets.frame_store import DecodedFrameStore, build_frame_store
 from lerobot.common.datasets.image_writer import AsyncImageWriter, write_image
+from lerobot.common.datasets.tensor_cache import TensorCache
 from lerobot.common.datasets.utils import (
     DEFAULT_FEATURES,
     DEFAULT_IMAGE_PATH,
@@ -58,14 +73,20 @@ from lerobot.common.datasets.utils import (
     load_info,
     load_stats,
     load_tasks,
+    take_hf_column,
     validate_episode_buffer,
+    validate_feature_dtype_and_shape,
     validate_frame,
     write_episode,
     write_episode_stats,
+    write_episodes_stats,
     write_info,
     write_json,
 )
 from lerobot.common.datasets.video_utils import (
+    StreamingVideoEncoder,
+    VideoDecoderPool,
+    VideoEncodingConfig,
     VideoFrame,
     decode_video_frames,
     encode_video_frames,
@@ -131,6 +152,24 @@ class LeRobotDatasetMetadata:
         """Codebase version used to create this dataset."""
         return packaging.version.parse(self.info["codebase_version"])
 
+    @property
+    def stats(self) -> dict[str, dict[str, np.ndarray]]:
+        """Stats of all the episodes. Quantiles are aggregated on first access after episodes were saved."""
+        if self._stale_quantiles:
+            for key, ft_stats in self._stats.items():
+                stats_ft_list = [
+                    ep_stats[key] for ep_stats in self.episodes_stats.values() if key in ep_stats
+                ]
+                if has_quantiles(stats_ft_list):
+                    ft_stats.update(aggregate_quantiles(stats_ft_list))
+            self._stale_quantiles = False
+        return self._stats
+
+    @stats.setter
+    def stats(self, stats: dict[str, dict[str, np.ndarray]]) -> None:
+        self._stats = stats
+        self._stale_quantiles = False
+
     def get_data_file_path(self, ep_index: int) -> Path:
         ep_chunk = self.get_episode_chunk(ep_index)
         fpath = self.data_path.format(episode_chunk=ep_chunk, episode_index=ep_index)
@@ -209,6 +248,11 @@ class LeRobotDatasetMetadata:
         """Total number of different tasks performed in this dataset."""
         return self.info["total_tasks"]
 
+    @property
+    def total_videos(self) -> int:
+        """Total number of video files in this dataset."""
+        return self.info["total_videos"]
+
     @property
     def total_chunks(self) -> int:
         """Total number of chunks (groups of episodes)."""
@@ -274,7 +318,12 @@ class LeRobotDatasetMetadata:
         write_episode(episode_dict, self.root)
 
         self.episodes_stats[episode_index] = episode_stats
-        self.stats = aggregate_stats([self.stats, episode_stats]) if self.stats else episode_stats
+        # Min, max, mean and std are merged exactly with those of the new episode, so that saving an episode
+        # doesn't get slower as the dataset grows. Quantiles can't be merged incrementally without their
+        # approximation error growing with every episode: they are aggregated from all the episodes the next
+        # time the stats are read.
+        self._stats = aggregate_stats([self._stats, episode_stats], quantiles=False)
+        self._stale_quantiles = True
         write_episode_stats(episode_index, episode_stats, self.root)
 
     def update_video_info(self) -> None:
@@ -342,6 +391,10 @@ class LeRobotDataset(torch.utils.data.Dataset):
         force_cache_sync: bool = False,
         download_videos: bool = True,
         video_backend: str | None = None,
+        frame_store: bool = False,
+        frame_store_resolution: tuple[int, int] | None = None,
+        frame_store_dir: str | Path | None = None,
+        tensor_cache: bool = False,
     ):
         """
         2 modes are available for instantiating this class, depending on 2 different use cases:
@@ -443,6 +496,18 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 True.
             video_backend (str | None, optional): Video backend to use for decoding videos. Defaults to torchcodec when available int the platform; otherwise, defaults to 'pyav'.
                 You can also use the 'pyav' decoder used by Torchvision, which used to be the default option, or 'video_reader' which is another decoder of Torchvision.
+            frame_store (bool, optional): Decode the videos once into a DecodedFrameStore on local disk and
+                read camera frames from it instead of decoding them for every item. Fast, but takes
+                height * width * 3 bytes per frame on disk. Defaults to False.
+            frame_store_resolution (tuple[int, int] | None, optional): (height, width) to downscale the frames
+                of the frame store to. Camera frames then have this shape instead of the one in the dataset
+                features. Defaults to None (original resolution).
+            frame_store_dir (str | Path | None, optional): Directory of the frame store. Defaults to
+                'frame_stores/{repo_id}' in the LeRobot cache directory.
+            tensor_cache (bool, optional): Load the numeric columns of hf_dataset (state, action, timestamp,
+                indices...) once into a TensorCache in shared memory, and read them from it instead of
+                converting Arrow rows for every item. Takes the size of these columns in memory. Defaults to
+                False.
         """
         super().__init__()
         self.repo_id = repo_id
@@ -453,11 +518,19 @@ class LeRobotDataset(torch.utils.data.Dataset):
         self.tolerance_s = tolerance_s
         self.revision = revision if revision else CODEBASE_VERSION
         self.video_backend = video_backend if video_backend else get_safe_default_codec()
+        self.video_decoder_pool = None
+        self.frame_store = None
+        self.tensor_cache = None
         self.delta_indices = None
+        self._episode_tables_lock = threading.Lock()
 
         # Unused attributes
         self.image_writer = None
+        self.episode_saver = None
         self.episode_buffer = None
+        self.streaming_encoding = False
+        self.video_encoding = VideoEncodingConfig()
+        self.video_encoders = {}
 
         self.root.mkdir(exist_ok=True, parents=True)
 
@@ -481,6 +554,8 @@ class LeRobotDataset(torch.utils.data.Dataset):
             self.hf_dataset = self.load_hf_dataset()
 
         self.episode_data_index = get_episode_data_index(self.meta.episodes, self.episodes)
+        if tensor_cache:
+            self.tensor_cache = TensorCache(self.hf_dataset)
 
         # Check timestamps
         timestamps = torch.stack(self.hf_dataset["timestamp"]).numpy()
@@ -493,6 +568,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
             check_delta_timestamps(self.delta_timestamps, self.fps, self.tolerance_s)
             self.delta_indices = get_delta_indices(self.delta_timestamps, self.fps)
 
+        if frame_store and len(self.meta.video_keys) > 0:
+            self.frame_store = self.build_frame_store(frame_store_resolution, frame_store_dir)
+
     def push_to_hub(
         self,
         branch: str | None = None,
@@ -618,10 +696,37 @@ class LeRobotDataset(torch.utils.data.Dataset):
         """Frames per second used during data collection."""
         return self.meta.fps
 
+    @property
+    def hf_dataset(self) -> datasets.Dataset | None:
+        """
+        Frames of the selected episodes. Episodes saved with `save_episode` are only concatenated to it when
+        it is accessed, so that saving an episode doesn't depend on the size of the dataset.
+        """
+        # Episodes saved in the background may be appended meanwhile
+        with self._episode_tables_lock:
+            new_tables, self._new_episode_tables = self._new_episode_tables, []
+        if new_tables:
+            self._hf_dataset = concatenate_datasets([self._hf_dataset, *new_tables])
+            self._hf_dataset.set_transform(hf_transform_to_torch)
+            if self.tensor_cache is not None:
+                self.tensor_cache = TensorCache(self._hf_dataset)
+        return self._hf_dataset
+
+    @hf_dataset.setter
+    def hf_dataset(self, hf_dataset: datasets.Dataset | None) -> None:
+        self._hf_dataset = hf_dataset
+        with self._episode_tables_lock:
+            self._new_episode_tables = []
+        if self.tensor_cache is not None:
+            self.tensor_cache = TensorCache(hf_dataset)
+
     @property
     def num_frames(self) -> int:
         """Number of frames in selected episodes."""
-        return len(self.hf_dataset) if self.hf_dataset is not None else self.meta.total_frames
+        if self._hf_dataset is None:
+            return self.meta.total_frames
+        with self._episode_tables_lock:
+            return len(self._hf_dataset) + sum(len(table) for table in self._new_episode_tables)
 
     @property
     def num_episodes(self) -> int:
@@ -635,62 +740,169 @@ class LeRobotDataset(torch.utils.data.Dataset):
     @property
     def hf_features(self) -> datasets.Features:
         """Features of the hf_dataset."""
-        if self.hf_dataset is not None:
-            return self.hf_dataset.features
+        if self._hf_dataset is not None:
+            return self._hf_dataset.features
         else:
             return get_hf_features_from_features(self.features)
 
-    def _get_query_indices(self, idx: int, ep_idx: int) -> tuple[dict[str, list[int | bool]]]:
+    def _get_query_indices(self, idx: int, ep_idx: int) -> tuple[dict[str, torch.Tensor]]:
         ep_start = self.episode_data_index["from"][ep_idx]
         ep_end = self.episode_data_index["to"][ep_idx]
-        query_indices = {
-            key: [max(ep_start.item(), min(ep_end.item() - 1, idx + delta)) for delta in delta_idx]
-            for key, delta_idx in self.delta_indices.items()
-        }
-        padding = {  # Pad values outside of current episode range
-            f"{key}_is_pad": torch.BoolTensor(
-                [(idx + delta < ep_start.item()) | (idx + delta >= ep_end.item()) for delta in delta_idx]
-            )
-            for key, delta_idx in self.delta_indices.items()
-        }
+        query_indices = {}
+        padding = {}
+        for key, delta_idx in self.delta_indices.items():
+            q_idx = idx + torch.tensor(delta_idx)
+            # Pad values outside of current episode range
+            padding[f"{key}_is_pad"] = (q_idx < ep_start) | (q_idx >= ep_end)
+            query_indices[key] = q_idx.clamp(ep_start, ep_end - 1)
         return query_indices, padding
 
     def _get_query_timestamps(
         self,
         current_ts: float,
-        query_indices: dict[str, list[int]] | None = None,
+        query_indices: dict[str, list[int] | torch.Tensor] | None = None,
     ) -> dict[str, list[float]]:
         query_timestamps = {}
         for key in self.meta.video_keys:
             if query_indices is not None and key in query_indices:
-                timestamps = self.hf_dataset.select(query_indices[key])["timestamp"]
-                query_timestamps[key] = torch.stack(timestamps).tolist()
+                q_idx = np.asarray(query_indices[key])
+                query_timestamps[key] = self._take_hf_column("timestamp", q_idx).tolist()
             else:
                 query_timestamps[key] = [current_ts]
 
         return query_timestamps
 
-    def _query_hf_dataset(self, query_indices: dict[str, list[int]]) -> dict:
+    def _query_hf_dataset(self, query_indices: dict[str, list[int] | torch.Tensor]) -> dict:
         return {
-            key: torch.stack(self.hf_dataset.select(q_idx)[key])
+            key: self._take_hf_column(key, np.asarray(q_idx))
             for key, q_idx in query_indices.items()
             if key not in self.meta.video_keys
         }
 
+    def build_frame_store(
+        self, resolution: tuple[int, int] | None = None, store_dir: str | Path | None = None
+    ) -> DecodedFrameStore:
+        """Decodes the videos of the selected episodes which aren't already in the frame store into it."""
+        if store_dir is None:
+            store_dir = HF_LEROBOT_HOME / "frame_stores" / self.repo_id
+        episodes = self.episodes if self.episodes is not None else range(self.meta.total_episodes)
+        videos = {
+            (ep_idx, vid_key): (
+                self.root / self.meta.get_video_file_path(ep_idx, vid_key),
+                self.meta.episodes[ep_idx]["length"],
+            )
+            for ep_idx in episodes
+            for vid_key in self.meta.video_keys
+        }
+        return build_frame_store(store_dir, self.revision, videos, resolution)
+
     def _query_videos(self, query_timestamps: dict[str, list[float]], ep_idx: int) -> dict[str, torch.Tensor]:
         """Note: When using data workers (e.g. DataLoader with num_workers>0), do not call this function
         in the main process (e.g. by using a second Dataloader with num_workers=0). It will result in a
         Segmentation Fault. This probably happens because a memory reference to the video loader is created in
         the main process and a subprocess fails to access it.
+
+        With the "torchcodec" and "pyav" backends, decoders and recently decoded frames are kept between calls
+        by `video_decoder_pool` (one per process). With a `frame_store`, frames are read from it instead.
         """
         item = {}
         for vid_key, query_ts in query_timestamps.items():
-            video_path = self.root / self.meta.get_video_file_path(ep_idx, vid_key)
-            frames = decode_video_frames(video_path, query_ts, self.tolerance_s, self.video_backend)
-            item[vid_key] = frames.squeeze(0)
+            item[vid_key] = self._decode_frames(ep_idx, vid_key, query_ts).squeeze(0)
 
         return item
 
+    def _decode_frames(
+        self,
+        ep_idx: int,
+        vid_key: str,
+        timestamps: list[float],
+        decoder_pool: VideoDecoderPool | None = None,
+    ) -> torch.Tensor:
+        """Frames of a camera of an episode at `timestamps`, as float32 in [0, 1] (channel first).
+
+        Decoders can't be used by several threads at once: threads decoding concurrently pass their own
+        `decoder_pool` instead of using `video_decoder_pool`.
+        """
+        if self.frame_store is not None:
+            frames = self.frame_store.get_frames(ep_idx, vid_key, timestamps, self.tolerance_s)
+            # convert to float32 in [0,1] range like the video decoders (the only copy of the frames)
+            return frames.type(torch.float32) / 255
+
+        if decoder_pool is None:
+            if self.video_decoder_pool is None and self.video_backend in ["torchcodec", "pyav"]:
+                self.video_decoder_pool = VideoDecoderPool(self.video_backend)
+            decoder_pool = self.video_decoder_pool
+
+        video_path = self.root / self.meta.get_video_file_path(ep_idx, vid_key)
+        if decoder_pool is not None:
+            return decoder_pool.decode(video_path, timestamps, self.tolerance_s)
+        return decode_video_frames(video_path, timestamps, self.tolerance_s, self.video_backend)
+
+    def _compute_stored_episode_stats(self, ep_idx: int, ep_start: int, ep_end: int) -> dict:
+        """Stats of an episode of the dataset (rows `ep_start` to `ep_end`), computed like those of a
+        recorded episode: on all its frames for numeric features, and on a sample of them for cameras."""
+        indices = np.arange(ep_start, ep_end)
+        sampled = indices[sample_indices(len(indices))]
+        decoder_pool = None
+        if self.video_backend in ["torchcodec", "pyav"] and len(self.meta.video_keys) > 0:
+            decoder_pool = VideoDecoderPool(self.video_backend)
+
+        ep_stats, ep_data = {}, {}
+        for key, ft in self.features.items():
+            if ft["dtype"] not in ["image", "video"]:
+                ep_data[key] = self._take_hf_column(key, indices).numpy()
+                continue
+            # Decoded by chunks, so that at most a few dozen frames are in memory at once
+            image_stats = RunningImageStats()
+            for chunk in np.array_split(sampled, -(-len(sampled) // 32)):
+                if ft["dtype"] == "video":
+                    timestamps = self._take_hf_column("timestamp", chunk).tolist()
+                    frames = self._decode_frames(ep_idx, key, timestamps, decoder_pool)
+                else:
+                    frames = self._take_hf_column(key, chunk)
+                for frame in frames:
+                    image_stats.update(image_to_uint8_chw(frame))
+            ep_stats[key] = image_stats.get_stats()
+
+        if decoder_pool is not None:
+            decoder_pool.close()
+        ep_stats.update(compute_episode_stats(ep_data, self.features, num_workers=0))
+        return ep_stats
+
+    def recompute_stats(self, num_workers: int = 4) -> dict[str, dict[str, np.ndarray]]:
+        """
+        Recomputes the stats of the selected episodes from their data and videos, e.g. for a dataset recorded
+        before quantiles were part of the stats, and writes them in the metadata.
+
+        Episodes are processed in parallel by `num_workers` threads (video decoding, image decoding and numpy
+        release the GIL), each with its own video decoders. Returns the stats aggregated over these episodes.
+        """
+        if self.meta._version < packaging.version.parse("v2.1"):
+            raise NotImplementedError("Stats can only be recomputed for datasets of version v2.1 or above.")
+        episodes = self.episodes if self.episodes is not None else range(self.meta.total_episodes)
+        ep_ranges = [
+            (ep_idx, self.episode_data_index["from"][i].item(), self.episode_data_index["to"][i].item())
+            for i, ep_idx in enumerate(episodes)
+        ]
+        logging.info(f"Computing the stats of {len(ep_ranges)} episodes")
+        if num_workers > 0:
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                ep_stats = list(
+                    executor.map(self._compute_stored_episode_stats, *zip(*ep_ranges, strict=True))
+                )
+        else:
+            ep_stats = [self._compute_stored_episode_stats(*args) for args in ep_ranges]
+
+        for (ep_idx, _, _), stats in zip(ep_ranges, ep_stats, strict=True):
+            self.meta.episodes_stats[ep_idx] = stats
+        self.meta.stats = aggregate_stats(list(self.meta.episodes_stats.values()))
+        write_episodes_stats(self.meta.episodes_stats, self.root)
+
+        if self.episodes is not None:
+            self.stats = aggregate_stats(ep_stats)
+            return self.stats
+        return self.meta.stats
+
     def _add_padding_keys(self, item: dict, padding: dict[str, list[bool]]) -> dict:
         for key, val in padding.items():
             item[key] = torch.BoolTensor(val)
@@ -699,8 +911,29 @@ class LeRobotDataset(torch.utils.data.Dataset):
     def __len__(self):
         return self.num_frames
 
+    def __getstate__(self) -> dict:
+        # Locks can't be pickled, e.g. to load the dataset in DataLoader workers
+        state = self.__dict__.copy()
+        del state["_episode_tables_lock"]
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._episode_tables_lock = threading.Lock()
+
+    def _get_row(self, idx: int) -> dict:
+        hf_dataset = self.hf_dataset  # also updates the tensor cache with the episodes saved since
+        if self.tensor_cache is None:
+            return hf_dataset[idx]
+
+        item = self.tensor_cache.get_row(idx)
+        other_columns = [key for key in hf_dataset.column_names if key not in self.tensor_cache]
+        if other_columns:
+            item.update(hf_dataset.select_columns(other_columns)[idx])
+        return item
+
     def __getitem__(self, idx) -> dict:
-        item = self.hf_dataset[idx]
+        item = self._get_row(idx)
         ep_idx = item["episode_index"].item()
 
         query_indices = None
@@ -728,6 +961,82 @@ class LeRobotDataset(torch.utils.data.Dataset):
 
         return item
 
+    def _take_hf_column(self, key: str, indices: np.ndarray) -> torch.Tensor:
+        """Values of the column `key` at `indices` (of any shape), stacked in a tensor of shape
+        (*indices.shape, *feature_shape)."""
+        hf_dataset = self.hf_dataset  # also updates the tensor cache with the episodes saved since
+        if self.tensor_cache is not None and key in self.tensor_cache:
+            return self.tensor_cache.take(key, indices)
+
+        flat_indices = indices.reshape(-1)
+        values = take_hf_column(hf_dataset, key, flat_indices)
+        if values is None:
+            values = torch.stack(hf_dataset.select_columns(key)[flat_indices.tolist()][key])
+        return values.reshape(*indices.shape, *values.shape[1:])
+
+    def __getitems__(self, indices: list[int]) -> list[dict]:
+        """
+        Items of a whole batch, as returned by `__getitem__`. The DataLoader calls this method instead of
+        `__getitem__` when it is defined.
+
+        The query indices of the batch are computed at once with NumPy, each column is gathered with a single
+        take on the Arrow table, and the frames queried from a video file by the items of the batch are
+        decoded together.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        columns = {key: self._take_hf_column(key, indices) for key in self.hf_dataset.column_names}
+        items = [{key: values[i] for key, values in columns.items()} for i in range(len(indices))]
+        ep_indices = columns["episode_index"].numpy()
+
+        query_indices = {}
+        if self.delta_indices is not None:
+            ep_start = self.episode_data_index["from"].numpy()[ep_indices][:, None]
+            ep_end = self.episode_data_index["to"].numpy()[ep_indices][:, None]
+            for key, delta_idx in self.delta_indices.items():
+                q_idx = indices[:, None] + np.asarray(delta_idx)[None, :]
+                # Pad values outside of current episode range
+                padding = torch.from_numpy((q_idx < ep_start) | (q_idx >= ep_end))
+                query_indices[key] = np.clip(q_idx, ep_start, ep_end - 1)
+                values = None
+                if key not in self.meta.video_keys:
+                    values = self._take_hf_column(key, query_indices[key])
+                for i, item in enumerate(items):
+                    item[f"{key}_is_pad"] = padding[i]
+                    if values is not None:
+                        item[key] = values[i]
+
+        # The decoder pool decodes any set of frames of a file in a single pass. Other backends decode every
+        # frame between the first and last timestamps, and the frame store doesn't decode anything, so with
+        # them the frames of each item are read separately.
+        decode_per_file = self.frame_store is None and self.video_backend in ["torchcodec", "pyav"]
+        for vid_key in self.meta.video_keys:
+            if vid_key in query_indices:
+                query_ts = self._take_hf_column("timestamp", query_indices[vid_key]).numpy()
+            else:
+                query_ts = columns["timestamp"].numpy()[:, None]
+            groups = ep_indices if decode_per_file else np.arange(len(indices))
+            for group in np.unique(groups):
+                members = np.flatnonzero(groups == group)
+                timestamps = np.unique(query_ts[members])
+                frames = self._decode_frames(int(ep_indices[members[0]]), vid_key, timestamps.tolist())
+                positions = np.searchsorted(timestamps, query_ts[members])
+                for i, pos in zip(members, positions, strict=True):
+                    if np.array_equal(pos, np.arange(pos[0], pos[0] + len(pos))):
+                        # Consecutive frames (e.g. a single timestamp): a view instead of a copy
+                        items[i][vid_key] = frames[pos[0] : pos[0] + len(pos)].squeeze(0)
+                    else:
+                        items[i][vid_key] = frames[pos].squeeze(0)
+
+        for item in items:
+            if self.image_transforms is not None:
+                for cam in self.meta.camera_keys:
+                    item[cam] = self.image_transforms(item[cam])
+
+            # Add task as a string
+            item["task"] = self.meta.tasks[item["task_index"].item()]
+
+        return items
+
     def __repr__(self):
         feature_keys = list(self.features)
         return (
@@ -739,46 +1048,89 @@ class LeRobotDataset(torch.utils.data.Dataset):
             "})',\n"
         )
 
+    def _get_next_indices(self) -> tuple[int, int]:
+        """Index of the next episode and of its first frame, counting the episodes still being saved."""
+        if self.episode_saver is not None:
+            return self.episode_saver.next_episode_index, self.episode_saver.next_frame_index
+        return self.meta.total_episodes, self.meta.total_frames
+
     def create_episode_buffer(self, episode_index: int | None = None) -> dict:
-        current_ep_idx = self.meta.total_episodes if episode_index is None else episode_index
+        current_ep_idx = self._get_next_indices()[0] if episode_index is None else episode_index
         ep_buffer = {}
         # size and task are special cases that are not in self.features
         ep_buffer["size"] = 0
         ep_buffer["task"] = []
-        for key in self.features:
-            ep_buffer[key] = current_ep_idx if key == "episode_index" else []
+        for key, ft in self.features.items():
+            if key == "episode_index":
+                ep_buffer[key] = current_ep_idx
+            elif key in ["timestamp", "frame_index"]:
+                # Python scalars, stored as 1D columns
+                ep_buffer[key] = GrowableArray((), ft["dtype"])
+            elif key in DEFAULT_FEATURES or ft["dtype"] in ["image", "video", "string"]:
+                ep_buffer[key] = []
+            else:
+                ep_buffer[key] = GrowableArray(ft["shape"], ft["dtype"])
         return ep_buffer
 
+    def _frame_matches_episode_buffer(self, frame: dict) -> bool:
+        """
+        Cheap check of `frame` against the columns of the episode buffer, whose shapes and dtypes are fixed
+        when the episode starts. `validate_frame` is only needed to explain a mismatch.
+        """
+        if len(frame) != len(self.features.keys() - DEFAULT_FEATURES.keys()):
+            return False
+        for key, value in frame.items():
+            column = self.episode_buffer.get(key)
+            if isinstance(column, GrowableArray):
+                if not column.matches(value):
+                    return False
+            elif (
+                column is None
+                or key in DEFAULT_FEATURES
+                or validate_feature_dtype_and_shape(key, self.features[key], value)
+            ):
+                return False
+        return True
+
     def _get_image_file_path(self, episode_index: int, image_key: str, frame_index: int) -> Path:
         fpath = DEFAULT_IMAGE_PATH.format(
             image_key=image_key, episode_index=episode_index, frame_index=frame_index
         )
         return self.root / fpath
 
-    def _save_image(self, image: torch.Tensor | np.ndarray | PIL.Image.Image, fpath: Path) -> None:
+    def _save_image(
+        self,
+        image: torch.Tensor | np.ndarray | PIL.Image.Image,
+        fpath: Path,
+        episode_index: int | None = None,
+    ) -> None:
         if self.image_writer is None:
             if isinstance(image, torch.Tensor):
                 image = image.cpu().numpy()
             write_image(image, fpath)
         else:
-            self.image_writer.save_image(image=image, fpath=fpath)
+            self.image_writer.save_image(image=image, fpath=fpath, tag=episode_index)
 
     def add_frame(self, frame: dict, task: str, timestamp: float | None = None) -> None:
         """
         This function only adds the frame to the episode_buffer. Apart from images — which are written in a
-        temporary directory — nothing is written to disk. To save those frames, the 'save_episode()' method
-        then needs to be called.
+        temporary directory, or fed to the video encoders with `streaming_encoding` — nothing is written to
+        disk. To save those frames, the 'save_episode()' method then needs to be called.
         """
+        if self.episode_saver is not None:
+            self.episode_saver.raise_error()
+
         # Convert torch to numpy if needed
         for name in frame:
             if isinstance(frame[name], torch.Tensor):
                 frame[name] = frame[name].numpy()
 
-        validate_frame(frame, self.features)
-
         if self.episode_buffer is None:
             self.episode_buffer = self.create_episode_buffer()
 
+        if not self._frame_matches_episode_buffer(frame):
+            validate_frame(frame, self.features)
+
         # Automatically add frame_index and timestamp to episode buffer
         frame_index = self.episode_buffer["size"]
         if timestamp is None:
@@ -794,61 +1146,102 @@ class LeRobotDataset(torch.utils.data.Dataset):
                     f"An element of the frame is not in the features. '{key}' not in '{self.features.keys()}'."
                 )
 
-            if self.features[key]["dtype"] in ["image", "video"]:
+            if self.features[key]["dtype"] == "video" and self.streaming_encoding:
+                if frame_index == 0:
+                    self._start_video_encoder(key, self.episode_buffer["episode_index"])
+                self.video_encoders[key].add_frame(frame[key])
+                self.episode_buffer[key].append(str(self.video_encoders[key].video_path))
+            elif self.features[key]["dtype"] in ["image", "video"]:
                 img_path = self._get_image_file_path(
                     episode_index=self.episode_buffer["episode_index"], image_key=key, frame_index=frame_index
                 )
                 if frame_index == 0:
                     img_path.parent.mkdir(parents=True, exist_ok=True)
-                self._save_image(frame[key], img_path)
+                self._save_image(frame[key], img_path, self.episode_buffer["episode_index"])
                 self.episode_buffer[key].append(str(img_path))
             else:
                 self.episode_buffer[key].append(frame[key])
 
         self.episode_buffer["size"] += 1
 
-    def save_episode(self, episode_data: dict | None = None) -> None:
+    def save_episode(self, episode_data: dict | None = None) -> Future | None:
         """
         This will save to disk the current episode in self.episode_buffer.
 
+        When the episode saver is started (see `start_episode_saver`), only the episode buffer is processed
+        here: writing the parquet file, computing the stats, encoding the videos and updating the metadata
+        happen in the background, and the returned future completes once the episode is saved. An error
+        raised in the background is raised again by the next call to `add_frame` or `save_episode`.
+
         Args:
             episode_data (dict | None, optional): Dict containing the episode data to save. If None, this will
                 save the current episode in self.episode_buffer, which is filled with 'add_frame'. Defaults to
                 None.
         """
+        if self.episode_saver is not None:
+            self.episode_saver.raise_error()
+
         if not episode_data:
             episode_buffer = self.episode_buffer
 
-        validate_episode_buffer(episode_buffer, self.meta.total_episodes, self.features)
+        total_episodes, total_frames = self._get_next_indices()
+        validate_episode_buffer(episode_buffer, total_episodes, self.features)
 
         # size and task are special cases that won't be added to hf_dataset
         episode_length = episode_buffer.pop("size")
         tasks = episode_buffer.pop("task")
-        episode_tasks = list(set(tasks))
         episode_index = episode_buffer["episode_index"]
 
-        episode_buffer["index"] = np.arange(self.meta.total_frames, self.meta.total_frames + episode_length)
+        episode_buffer["index"] = np.arange(total_frames, total_frames + episode_length)
         episode_buffer["episode_index"] = np.full((episode_length,), episode_index)
 
-        # Add new tasks to the tasks dictionary
-        for task in episode_tasks:
-            task_index = self.meta.get_task_index(task)
-            if task_index is None:
-                self.meta.add_task(task)
-
-        # Given tasks in natural language, find their corresponding task indices
-        episode_buffer["task_index"] = np.array([self.meta.get_task_index(task) for task in tasks])
-
         for key, ft in self.features.items():
             # index, episode_index, task_index are already processed above, and image and video
             # are processed separately by storing image path and frame info as meta data
             if key in ["index", "episode_index", "task_index"] or ft["dtype"] in ["image", "video"]:
                 continue
-            episode_buffer[key] = np.stack(episode_buffer[key])
+            column = episode_buffer[key]
+            episode_buffer[key] = column.array if isinstance(column, GrowableArray) else np.stack(column)
+
+        video_encoders, self.video_encoders = self.video_encoders, {}
+        finalize_args = (episode_buffer, episode_index, episode_length, tasks, video_encoders)
+        future = None
+        if self.episode_saver is None:
+            self._finalize_episode(*finalize_args, in_background=False)
+        else:
+            future = self.episode_saver.submit(episode_length, self._finalize_episode, *finalize_args, True)
+
+        if not episode_data:  # Reset the buffer
+            self.episode_buffer = self.create_episode_buffer()
 
-        self._wait_image_writer()
+        return future
+
+    def _finalize_episode(
+        self,
+        episode_buffer: dict,
+        episode_index: int,
+        episode_length: int,
+        tasks: list[str],
+        video_encoders: dict[str, StreamingVideoEncoder],
+        in_background: bool,
+    ) -> None:
+        # The metadata is only updated here, so that it is only modified by the episode saver's thread while
+        # the next episode is recorded
+        episode_tasks = list(set(tasks))
+        for task in episode_tasks:
+            if self.meta.get_task_index(task) is None:
+                self.meta.add_task(task)
+        # Given tasks in natural language, find their corresponding task indices
+        episode_buffer["task_index"] = np.array([self.meta.get_task_index(task) for task in tasks])
+
+        # The images of the next episode may already be queued
+        self._wait_image_writer(episode_index)
+        streamed_stats = self._finish_video_encoders(video_encoders)
         self._save_episode_table(episode_buffer, episode_index)
-        ep_stats = compute_episode_stats(episode_buffer, self.features)
+        ep_stats = compute_episode_stats(
+            {key: data for key, data in episode_buffer.items() if key not in streamed_stats}, self.features
+        )
+        ep_stats.update(streamed_stats)
 
         if len(self.meta.video_keys) > 0:
             video_paths = self.encode_episode_videos(episode_index)
@@ -858,8 +1251,8 @@ class LeRobotDataset(torch.utils.data.Dataset):
         # `meta.save_episode` be executed after encoding the videos
         self.meta.save_episode(episode_index, episode_length, episode_tasks, ep_stats)
 
-        ep_data_index = get_episode_data_index(self.meta.episodes, [episode_index])
-        ep_data_index_np = {k: t.numpy() for k, t in ep_data_index.items()}
+        # Indices of the episode within `episode_buffer`
+        ep_data_index_np = {"from": np.array([0]), "to": np.array([episode_length])}
         check_timestamps_sync(
             episode_buffer["timestamp"],
             episode_buffer["episode_index"],
@@ -868,39 +1261,47 @@ class LeRobotDataset(torch.utils.data.Dataset):
             self.tolerance_s,
         )
 
-        video_files = list(self.root.rglob("*.mp4"))
-        assert len(video_files) == self.num_episodes * len(self.meta.video_keys)
-
-        parquet_files = list(self.root.rglob("*.parquet"))
-        assert len(parquet_files) == self.num_episodes
-
-        # delete images
-        img_dir = self.root / "images"
-        if img_dir.is_dir():
-            shutil.rmtree(self.root / "images")
-
-        if not episode_data:  # Reset the buffer
-            self.episode_buffer = self.create_episode_buffer()
+        # Only check the files of this episode: scanning the dataset root would get slower with every episode
+        assert (self.root / self.meta.get_data_file_path(episode_index)).is_file()
+        for key in self.meta.video_keys:
+            assert (self.root / self.meta.get_video_file_path(episode_index, key)).is_file()
+        assert self.meta.total_videos == self.meta.total_episodes * len(self.meta.video_keys)
+
+        if not in_background:
+            # delete images
+            img_dir = self.root / "images"
+            if img_dir.is_dir():
+                shutil.rmtree(self.root / "images")
+        else:
+            # The next episode may already be writing its images
+            self._delete_episode_images(episode_index)
 
     def _save_episode_table(self, episode_buffer: dict, episode_index: int) -> None:
         episode_dict = {key: episode_buffer[key] for key in self.hf_features}
         ep_dataset = datasets.Dataset.from_dict(episode_dict, features=self.hf_features, split="train")
-        ep_dataset = embed_images(ep_dataset)
-        self.hf_dataset = concatenate_datasets([self.hf_dataset, ep_dataset])
-        self.hf_dataset.set_transform(hf_transform_to_torch)
+        if len(self.meta.image_keys) > 0:
+            ep_dataset = embed_images(ep_dataset)
+        with self._episode_tables_lock:
+            self._new_episode_tables.append(ep_dataset)
         ep_data_path = self.root / self.meta.get_data_file_path(ep_index=episode_index)
         ep_data_path.parent.mkdir(parents=True, exist_ok=True)
         ep_dataset.to_parquet(ep_data_path)
 
+    def _delete_episode_images(self, episode_index: int) -> None:
+        for cam_key in self.meta.camera_keys:
+            img_dir = self._get_image_file_path(
+                episode_index=episode_index, image_key=cam_key, frame_index=0
+            ).parent
+            if img_dir.is_dir():
+                shutil.rmtree(img_dir)
+
     def clear_episode_buffer(self) -> None:
         episode_index = self.episode_buffer["episode_index"]
+        for encoder in self.video_encoders.values():
+            encoder.cancel()
+        self.video_encoders = {}
         if self.image_writer is not None:
-            for cam_key in self.meta.camera_keys:
-                img_dir = self._get_image_file_path(
-                    episode_index=episode_index, image_key=cam_key, frame_index=0
-                ).parent
-                if img_dir.is_dir():
-                    shutil.rmtree(img_dir)
+            self._delete_episode_images(episode_index)
 
         # Reset the buffer
         self.episode_buffer = self.create_episode_buffer()
@@ -925,10 +1326,49 @@ class LeRobotDataset(torch.utils.data.Dataset):
             self.image_writer.stop()
             self.image_writer = None
 
-    def _wait_image_writer(self) -> None:
-        """Wait for asynchronous image writer to finish."""
+    def start_episode_saver(self) -> None:
+        """Save the next episodes in the background (see `save_episode`)."""
+        if self.episode_saver is not None:
+            raise RuntimeError("The episode saver is already started.")
+        self.episode_saver = AsyncEpisodeSaver(self.meta.total_episodes, self.meta.total_frames)
+
+    def stop_episode_saver(self) -> None:
+        """
+        Wait until the episodes are saved and go back to saving them synchronously. Raises the error of the
+        first episode that couldn't be saved, if any.
+        """
+        if self.episode_saver is not None:
+            try:
+                self.episode_saver.stop()
+            finally:
+                self.episode_saver = None
+
+    def wait_episode_saver(self) -> None:
+        """Wait until the episodes handed to the episode saver are saved."""
+        if self.episode_saver is not None:
+            self.episode_saver.wait_until_done()
+
+    def _wait_image_writer(self, episode_index: int | None = None) -> None:
+        """Wait for asynchronous image writer to finish, or only to write the images of `episode_index`."""
         if self.image_writer is not None:
-            self.image_writer.wait_until_done()
+            self.image_writer.wait_until_done(episode_index)
+
+    def _start_video_encoder(self, video_key: str, episode_index: int) -> None:
+        if video_key in self.video_encoders:
+            # Left over from an episode that was neither saved nor cleared
+            self.video_encoders.pop(video_key).cancel()
+        video_path = self.root / self.meta.get_video_file_path(episode_index, video_key)
+        self.video_encoders[video_key] = StreamingVideoEncoder(
+            video_path, self.fps, **asdict(self.video_encoding)
+        )
+
+    def _finish_video_encoders(self, encoders: dict[str, StreamingVideoEncoder]) -> dict[str, dict]:
+        """Wait for the streaming video encoders to finish their episode, returns their image stats."""
+        ep_stats = {}
+        for key, encoder in encoders.items():
+            encoder.finish()
+            ep_stats[key] = encoder.stats.get_stats()
+        return ep_stats
 
     def encode_videos(self) -> None:
         """
@@ -941,11 +1381,12 @@ class LeRobotDataset(torch.utils.data.Dataset):
 
     def encode_episode_videos(self, episode_index: int) -> dict:
         """
-        Use ffmpeg to convert frames stored as png into mp4 videos.
-        Note: `encode_video_frames` is a blocking call. Making it asynchronous shouldn't speedup encoding,
-        since video encoding with ffmpeg is already using multithreading.
+        Use ffmpeg to convert frames stored as png into mp4 videos, with the settings of `video_encoding`.
+        The videos of the cameras are encoded concurrently, one thread each: encoders don't scale linearly
+        with their number of threads (and some, like x264 with "zerolatency", use few), and reading the PNG
+        images is single-threaded.
         """
-        video_paths = {}
+        video_paths, to_encode = {}, {}
         for key in self.meta.video_keys:
             video_path = self.root / self.meta.get_video_file_path(episode_index, key)
             video_paths[key] = str(video_path)
@@ -955,7 +1396,19 @@ class LeRobotDataset(torch.utils.data.Dataset):
             img_dir = self._get_image_file_path(
                 episode_index=episode_index, image_key=key, frame_index=0
             ).parent
-            encode_video_frames(img_dir, video_path, self.fps, overwrite=True)
+            to_encode[img_dir] = video_path
+
+        if to_encode:
+            encoding_kwargs = asdict(self.video_encoding)
+            with ThreadPoolExecutor(max_workers=len(to_encode)) as executor:
+                futures = [
+                    executor.submit(
+                        encode_video_frames, img_dir, video_path, self.fps, overwrite=True, **encoding_kwargs
+                    )
+                    for img_dir, video_path in to_encode.items()
+                ]
+                for future in futures:
+                    future.result()
 
         return video_paths
 
@@ -972,8 +1425,18 @@ class LeRobotDataset(torch.utils.data.Dataset):
         image_writer_processes: int = 0,
         image_writer_threads: int = 0,
         video_backend: str | None = None,
+        streaming_encoding: bool = False,
+        async_save: bool = False,
+        video_encoding: VideoEncodingConfig | None = None,
     ) -> "LeRobotDataset":
-        """Create a LeRobot Dataset from scratch in order to record data."""
+        """
+        Create a LeRobot Dataset from scratch in order to record data.
+
+        With `streaming_encoding`, video frames are encoded while they are added instead of being written as
+        PNG images and encoded in `save_episode` (see `StreamingVideoEncoder`). With `async_save`, episodes
+        are saved in the background (see `start_episode_saver`). `video_encoding` sets the encoder and its
+        options (see `VIDEO_ENCODING_PRESETS`), in both cases.
+        """
         obj = cls.__new__(cls)
         obj.meta = LeRobotDatasetMetadata.create(
             repo_id=repo_id,
@@ -988,20 +1451,31 @@ class LeRobotDataset(torch.utils.data.Dataset):
         obj.revision = None
         obj.tolerance_s = tolerance_s
         obj.image_writer = None
+        obj.streaming_encoding = streaming_encoding
+        obj.video_encoding = video_encoding if video_encoding is not None else VideoEncodingConfig()
+        obj.video_encoders = {}
 
         if image_writer_processes or image_writer_threads:
             obj.start_image_writer(image_writer_processes, image_writer_threads)
 
+        obj.episode_saver = None
+        if async_save:
+            obj.start_episode_saver()
+
         # TODO(aliberts, rcadene, alexander-soare): Merge this with OnlineBuffer/DataBuffer
         obj.episode_buffer = obj.create_episode_buffer()
 
         obj.episodes = None
+        obj.tensor_cache = None
+        obj._episode_tables_lock = threading.Lock()
         obj.hf_dataset = obj.create_hf_dataset()
         obj.image_transforms = None
         obj.delta_timestamps = None
         obj.delta_indices = None
         obj.episode_data_index = None
         obj.video_backend = video_backend if video_backend is not None else get_safe_default_codec()
+        obj.video_decoder_pool = None
+        obj.frame_store = None
         return obj
 
 
@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import datasets
+import numpy as np
+import torch
+
+from lerobot.common.datasets.utils import take_hf_column
+
+
+class TensorCache:
+    """
+    Numeric columns of a `datasets.Dataset` (state, action, timestamp, indices...) loaded once into
+    contiguous tensors, so that rows are read by tensor indexing instead of converting Arrow rows with
+    `hf_transform_to_torch` at every access.
+
+    Other columns (e.g. images) aren't cached. The tensors are moved to shared memory, so that DataLoader
+    workers read them without copying them, whether they are forked or spawned.
+    """
+
+    def __init__(self, hf_dataset: datasets.Dataset):
+        self.num_rows = len(hf_dataset)
+        indices = np.arange(self.num_rows)
+        self.columns: dict[str, torch.Tensor] = {}
+        for key in hf_dataset.column_names:
+            values = take_hf_column(hf_dataset, key, indices)
+            if values is not None:
+                self.columns[key] = values.share_memory_()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.columns
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    @property
+    def nbytes(self) -> int:
+        return sum(values.nbytes for values in self.columns.values())
+
+    def get_row(self, idx: int) -> dict[str, torch.Tensor]:
+        # Copied, so that modifying an item in place doesn't modify the cache
+        return {key: values[idx].clone() for key, values in self.columns.items()}
+
+    def take(self, key: str, indices: torch.Tensor | np.ndarray | list[int]) -> torch.Tensor:
+        """Values of the column `key` at `indices` (of any shape), as a new tensor."""
+        return self.columns[key][torch.as_tensor(indices, dtype=torch.long)]
@@ -28,6 +28,8 @@ import datasets
 import jsonlines
 import numpy as np
 import packaging.version
+import pyarrow as pa
+import pyarrow.compute as pc
 import torch
 from datasets.table import embed_table_storage
 from huggingface_hub import DatasetCard, DatasetCardData, HfApi
@@ -229,6 +231,15 @@ def write_episode_stats(episode_index: int, episode_stats: dict, local_dir: Path
     append_jsonlines(episode_stats, local_dir / EPISODES_STATS_PATH)
 
 
+def write_episodes_stats(episodes_stats: dict[int, dict], local_dir: Path):
+    """Rewrites the stats of all episodes, e.g. after they were recomputed."""
+    episodes_stats = [
+        {"episode_index": ep_idx, "stats": serialize_dict(ep_stats)}
+        for ep_idx, ep_stats in sorted(episodes_stats.items())
+    ]
+    write_jsonlines(episodes_stats, local_dir / EPISODES_STATS_PATH)
+
+
 def load_episodes_stats(local_dir: Path) -> dict:
     episodes_stats = load_jsonlines(local_dir / EPISODES_STATS_PATH)
     return {
@@ -273,6 +284,40 @@ def hf_transform_to_torch(items_dict: dict[torch.Tensor | None]):
     return items_dict
 
 
+def take_hf_column(hf_dataset: datasets.Dataset, key: str, indices: np.ndarray) -> torch.Tensor | None:
+    """Gathers the values of the column `key` at `indices` with a single take on the underlying Arrow table,
+    converted to a tensor like `hf_transform_to_torch` does (floats to float32, integers to int64).
+
+    Only numeric columns and fixed size lists of them are supported: returns None for other columns (e.g.
+    images), which have to go through `hf_dataset` instead.
+    """
+    column = hf_dataset.data.column(key)
+    shape = []
+    value_type = column.type
+    while pa.types.is_fixed_size_list(value_type):
+        shape.append(value_type.list_size)
+        value_type = value_type.value_type
+    if not (
+        pa.types.is_integer(value_type) or pa.types.is_floating(value_type) or pa.types.is_boolean(value_type)
+    ):
+        return None
+
+    indices = pa.array(np.asarray(indices, dtype=np.int64))
+    if hf_dataset._indices is not None:
+        indices = hf_dataset._indices.column(0).take(indices)
+    values = column.take(indices)
+    for _ in shape:
+        values = pc.list_flatten(values)
+    if pa.types.is_floating(value_type):
+        dtype = np.float32
+    elif pa.types.is_integer(value_type):
+        dtype = np.int64
+    else:
+        dtype = np.bool_
+    # astype copies the (read-only) Arrow buffers
+    return torch.from_numpy(values.to_numpy().reshape(len(indices), *shape).astype(dtype))
+
+
 def is_valid_version(version: str) -> bool:
     try:
         packaging.version.parse(version)
@@ -16,18 +16,25 @@
 import glob
 import importlib
 import logging
+import os
+import queue
+import threading
 import warnings
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any, ClassVar
 
 import av
+import numpy as np
 import pyarrow as pa
 import torch
 import torchvision
 from datasets.features.features import register_feature
 from PIL import Image
 
+from lerobot.common.datasets.compute_stats import RunningImageStats
+
 
 def get_safe_default_codec():
     if importlib.util.find_spec("torchcodec"):
@@ -242,6 +249,302 @@ def decode_video_frames_torchcodec(
     return closest_frames
 
 
+class VideoDecoderPool:
+    """
+    Keeps video decoders open between queries, along with the frames they recently decoded.
+
+    `decode_video_frames` opens the video and seeks from a key frame for every query. When consecutive
+    queries hit the same videos (e.g. the cameras of neighbouring samples of an episode), this pool reuses:
+    - the open decoder of each video, up to `max_open_decoders` videos (least recently used ones are closed),
+    - the decoded frames, up to `max_cached_frames` frames. With "pyav", every frame decoded on the way to
+      the requested ones is cached, and a decoder continues forward from its last frame instead of seeking
+      when the requested frame is at most `max_forward_frames` frames (and one key frame interval) ahead.
+
+    Decoders can't be shared between processes: a pool used in a forked process (e.g. a DataLoader worker)
+    starts empty there, so each worker has its own.
+
+    Frames are returned like `decode_video_frames` does: float32 in [0, 1], channel first.
+    """
+
+    def __init__(
+        self,
+        backend: str | None = None,
+        max_open_decoders: int = 8,
+        max_cached_frames: int = 64,
+        max_forward_frames: int = 30,
+    ):
+        self.backend = backend if backend is not None else get_safe_default_codec()
+        if self.backend not in ["torchcodec", "pyav"]:
+            raise ValueError(f"Unsupported video backend for the decoder pool: {self.backend}")
+        self.max_open_decoders = max_open_decoders
+        self.max_cached_frames = max_cached_frames
+        self.max_forward_frames = max_forward_frames
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._decoders: OrderedDict[str, Any] = OrderedDict()
+        # (video path, frame index) -> (uint8 frame, timestamp in s)
+        self._frames: OrderedDict[tuple[str, int], tuple[torch.Tensor, float]] = OrderedDict()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_decoders"], state["_frames"]
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._reset()
+
+    def close(self):
+        if self._pid == os.getpid():
+            for decoder in self._decoders.values():
+                if self.backend == "pyav":
+                    decoder.container.close()
+        self._reset()
+
+    def _get_decoder(self, video_path: str):
+        if self._pid != os.getpid():
+            # Inherited from the parent process: its decoders can't be used here
+            self._reset()
+
+        decoder = self._decoders.get(video_path)
+        if decoder is not None:
+            self._decoders.move_to_end(video_path)
+            return decoder
+
+        if self.backend == "torchcodec":
+            from torchcodec.decoders import VideoDecoder
+
+            decoder = VideoDecoder(video_path, device="cpu", seek_mode="approximate")
+        else:
+            decoder = _PyAVDecoder(video_path)
+        self._decoders[video_path] = decoder
+        if len(self._decoders) > self.max_open_decoders:
+            _, evicted = self._decoders.popitem(last=False)
+            if self.backend == "pyav":
+                evicted.container.close()
+        return decoder
+
+    def _cache_frame(self, video_path: str, frame_index: int, frame: torch.Tensor, timestamp: float):
+        self._frames[(video_path, frame_index)] = (frame, timestamp)
+        self._frames.move_to_end((video_path, frame_index))
+        while len(self._frames) > self.max_cached_frames:
+            self._frames.popitem(last=False)
+
+    def _decode_missing(self, video_path: str, decoder, frame_indices: list[int]) -> dict:
+        """Decodes `frame_indices` (sorted) and returns them. Every decoded frame is also cached."""
+        if self.backend == "torchcodec":
+            frames_batch = decoder.get_frames_at(indices=frame_indices)
+            pts_seconds = frames_batch.pts_seconds.tolist()
+            decoded = {
+                idx: (frame, pts)
+                for idx, frame, pts in zip(frame_indices, frames_batch.data, pts_seconds, strict=True)
+            }
+            for idx, (frame, timestamp) in decoded.items():
+                self._cache_frame(video_path, idx, frame, timestamp)
+            return decoded
+
+        decoded = {}
+        for target in frame_indices:
+            if target in decoded:
+                continue  # decoded on the way to a previous target
+            # Past the next key frame, seeking costs less than decoding every frame on the way
+            max_forward = self.max_forward_frames
+            if decoder.gop_size is not None:
+                max_forward = min(max_forward, decoder.gop_size)
+            if not (0 < target - decoder.last_index <= max_forward):
+                decoder.seek(target)
+            for idx, frame, timestamp in decoder.decode_until(target):
+                self._cache_frame(video_path, idx, frame, timestamp)
+                if idx in frame_indices:
+                    decoded[idx] = (frame, timestamp)
+        return decoded
+
+    def decode(self, video_path: Path | str, timestamps: list[float], tolerance_s: float) -> torch.Tensor:
+        """Frames of `video_path` at `timestamps` (float32 in [0, 1], channel first)."""
+        video_path = str(video_path)
+        decoder = self._get_decoder(video_path)
+        fps = decoder.metadata.average_fps if self.backend == "torchcodec" else decoder.fps
+        frame_indices = [round(ts * fps) for ts in timestamps]
+
+        loaded = {}
+        for idx in frame_indices:
+            if (video_path, idx) in self._frames:
+                self._frames.move_to_end((video_path, idx))
+                loaded[idx] = self._frames[(video_path, idx)]
+        missing = sorted(set(frame_indices) - loaded.keys())
+        if missing:
+            loaded.update(self._decode_missing(video_path, decoder, missing))
+
+        loaded_frames, loaded_ts = [], []
+        for idx in frame_indices:
+            if idx not in loaded:
+                raise IndexError(f"Frame {idx} is beyond the end of {video_path}.")
+            loaded_frames.append(loaded[idx][0])
+            loaded_ts.append(loaded[idx][1])
+
+        query_ts = torch.tensor(timestamps)
+        loaded_ts = torch.tensor(loaded_ts)
+        min_ = (query_ts - loaded_ts).abs()
+        is_within_tol = min_ < tolerance_s
+        assert is_within_tol.all(), (
+            f"One or several query timestamps unexpectedly violate the tolerance ({min_[~is_within_tol]} > {tolerance_s=})."
+            "It means that the closest frame that can be loaded from the video is too far away in time."
+            "This might be due to synchronization issues with timestamps during data collection."
+            "To be safe, we advise to ignore this item during training."
+            f"\nqueried timestamps: {query_ts}"
+            f"\nloaded timestamps: {loaded_ts}"
+            f"\nvideo: {video_path}"
+            f"\nbackend: {self.backend}"
+        )
+
+        # convert to float32 in [0,1] range (channel first)
+        return torch.stack(loaded_frames).type(torch.float32) / 255
+
+
+class _PyAVDecoder:
+    """Video stream decoded forward from a position, with seeking to the key frame before a target frame."""
+
+    def __init__(self, video_path: str):
+        self.container = av.open(video_path)
+        self.stream = self.container.streams.video[0]
+        self.stream.thread_type = "AUTO"
+        self.fps = float(self.stream.average_rate)
+        self.time_base = float(self.stream.time_base)
+        self.last_index = -1
+        # Largest interval between key frames seen so far
+        self.gop_size = None
+        self._last_key_index = None
+        self._frames = self.container.decode(self.stream)
+
+    def seek(self, frame_index: int):
+        # Seeks to the closest key frame before the target
+        self.container.seek(round(frame_index / self.fps / self.time_base), stream=self.stream)
+        self._frames = self.container.decode(self.stream)
+        self.last_index = -1
+        self._last_key_index = None
+
+    def decode_until(self, target: int):
+        """Yields (frame index, uint8 CHW frame, timestamp in s) of the frames decoded up to `target`."""
+        for frame in self._frames:
+            timestamp = frame.pts * self.time_base
+            self.last_index = round(timestamp * self.fps)
+            if frame.key_frame:
+                if self._last_key_index is not None:
+                    interval = self.last_index - self._last_key_index
+                    self.gop_size = max(interval, self.gop_size or 0)
+                self._last_key_index = self.last_index
+            rgb = torch.from_numpy(frame.to_ndarray(format="rgb24")).permute(2, 0, 1)
+            yield self.last_index, rgb, timestamp
+            if self.last_index >= target:
+                return
+
+
+SUPPORTED_VCODECS = ["h264", "hevc", "libsvtav1", "h264_nvenc", "hevc_nvenc"]
+
+
+def check_vcodec(vcodec: str) -> None:
+    # Check encoder availability
+    if vcodec not in SUPPORTED_VCODECS:
+        raise ValueError(
+            f"Unsupported video codec: {vcodec}. Supported codecs are: {', '.join(SUPPORTED_VCODECS)}."
+        )
+
+
+def check_pix_fmt(vcodec: str, pix_fmt: str) -> str:
+    # Encoders/pixel formats incompatibility check
+    if vcodec in ["libsvtav1", "hevc", "h264_nvenc", "hevc_nvenc"] and pix_fmt == "yuv444p":
+        logging.warning(
+            f"Incompatible pixel format 'yuv444p' for codec {vcodec}, auto-selecting format 'yuv420p'"
+        )
+        pix_fmt = "yuv420p"
+    return pix_fmt
+
+
+def get_video_options(
+    vcodec: str,
+    g: int | None,
+    crf: int | None,
+    fast_decode: int,
+    preset: int | str | None = None,
+    tune: str | None = None,
+    threads: int | None = None,
+) -> dict[str, str]:
+    video_options = {}
+    svtav1_params = []
+    tunes = [tune] if tune is not None else []
+
+    if g is not None:
+        video_options["g"] = str(g)
+
+    if crf is not None:
+        # NVENC has no constant rate factor, its constant quality mode is the equivalent
+        video_options["cq" if vcodec.endswith("_nvenc") else "crf"] = str(crf)
+
+    if fast_decode:
+        if vcodec == "libsvtav1":
+            svtav1_params.append(f"fast-decode={fast_decode}")
+        else:
+            tunes.append("fastdecode")
+
+    if preset is not None:
+        video_options["preset"] = str(preset)
+
+    if threads is not None:
+        if vcodec == "libsvtav1":
+            svtav1_params.append(f"lp={threads}")
+        elif not vcodec.endswith("_nvenc"):
+            video_options["threads"] = str(threads)
+
+    if svtav1_params:
+        video_options["svtav1-params"] = ":".join(svtav1_params)
+    if tunes:
+        video_options["tune"] = ",".join(tunes)
+
+    return video_options
+
+
+@dataclass
+class VideoEncodingConfig:
+    """
+    Encoder settings of the videos of a dataset. The defaults give small videos which are fast to decode at
+    random frames, at the cost of encoding speed: faster presets (see `VIDEO_ENCODING_PRESETS`) are useful
+    when encoding can't keep up with recording. See `benchmarks/video/README.md` for their trade-offs.
+    """
+
+    vcodec: str = "libsvtav1"
+    pix_fmt: str = "yuv420p"
+    g: int | None = 2
+    crf: int | None = 30
+    fast_decode: int = 0
+    # Speed preset of the encoder: 0 (slowest) to 13 (fastest) for libsvtav1, "ultrafast" to "veryslow"
+    # for h264 and hevc, "p1" (fastest) to "p7" for NVENC. None uses the encoder's default.
+    preset: int | str | None = None
+    # Tuning of h264/hevc/NVENC encoders, e.g. "zerolatency" (h264) or "ll" (NVENC) to encode without
+    # buffering frames.
+    tune: str | None = None
+    # Number of encoding threads of each video. None lets the encoder use all the cores.
+    threads: int | None = None
+
+
+VIDEO_ENCODING_PRESETS = {
+    "svtav1": VideoEncodingConfig(),
+    "svtav1-fast": VideoEncodingConfig(preset=10),
+    "x264-ultrafast": VideoEncodingConfig(vcodec="h264", crf=23, preset="ultrafast", tune="zerolatency"),
+    "nvenc-h264": VideoEncodingConfig(vcodec="h264_nvenc", crf=23, preset="p1", tune="ll"),
+}
+
+
+def get_video_encoding_config(preset: str = "svtav1", threads: int | None = None) -> VideoEncodingConfig:
+    if preset not in VIDEO_ENCODING_PRESETS:
+        raise ValueError(
+            f"Unknown video encoding preset: {preset}. "
+            f"Available presets: {', '.join(VIDEO_ENCODING_PRESETS)}."
+        )
+    return replace(VIDEO_ENCODING_PRESETS[preset], threads=threads)
+
+
 def encode_video_frames(
     imgs_dir: Path | str,
     video_path: Path | str,
@@ -251,25 +554,21 @@ def encode_video_frames(
     g: int | None = 2,
     crf: int | None = 30,
     fast_decode: int = 0,
+    preset: int | str | None = None,
+    tune: str | None = None,
+    threads: int | None = None,
     log_level: int | None = av.logging.ERROR,
     overwrite: bool = False,
 ) -> None:
     """More info on ffmpeg arguments tuning on `benchmark/video/README.md`"""
-    # Check encoder availability
-    if vcodec not in ["h264", "hevc", "libsvtav1"]:
-        raise ValueError(f"Unsupported video codec: {vcodec}. Supported codecs are: h264, hevc, libsvtav1.")
+    check_vcodec(vcodec)
 
     video_path = Path(video_path)
     imgs_dir = Path(imgs_dir)
 
     video_path.parent.mkdir(parents=True, exist_ok=overwrite)
 
-    # Encoders/pixel formats incompatibility check
-    if (vcodec == "libsvtav1" or vcodec == "hevc") and pix_fmt == "yuv444p":
-        logging.warning(
-            f"Incompatible pixel format 'yuv444p' for codec {vcodec}, auto-selecting format 'yuv420p'"
-        )
-        pix_fmt = "yuv420p"
+    pix_fmt = check_pix_fmt(vcodec, pix_fmt)
 
     # Get input frames
     template = "frame_" + ("[0-9]" * 6) + ".png"
@@ -284,18 +583,7 @@ def encode_video_frames(
     width, height = dummy_image.size
 
     # Define video codec options
-    video_options = {}
-
-    if g is not None:
-        video_options["g"] = str(g)
-
-    if crf is not None:
-        video_options["crf"] = str(crf)
-
-    if fast_decode:
-        key = "svtav1-params" if vcodec == "libsvtav1" else "tune"
-        value = f"fast-decode={fast_decode}" if vcodec == "libsvtav1" else "fastdecode"
-        video_options[key] = value
+    video_options = get_video_options(vcodec, g, crf, fast_decode, preset, tune, threads)
 
     # Set logging level
     if log_level is not None:
@@ -330,6 +618,149 @@ def encode_video_frames(
         raise OSError(f"Video encoding did not work. File not found: {video_path}.")
 
 
+def image_to_rgb24(image: np.ndarray | Image.Image) -> np.ndarray:
+    """Converts an image as accepted by `LeRobotDataset.add_frame` to a (H, W, 3) uint8 array."""
+    if isinstance(image, Image.Image):
+        return np.asarray(image.convert("RGB"))
+    if image.shape[0] == 3:
+        # Transpose from pytorch convention (C, H, W) to (H, W, C)
+        image = image.transpose(1, 2, 0)
+    if image.dtype != np.uint8:
+        image = (image * 255).astype(np.uint8)
+    return np.ascontiguousarray(image)
+
+
+class StreamingVideoEncoder:
+    """
+    Encodes frames into `video_path` while they are recorded, instead of saving them as PNG images and
+    encoding them once the episode is over with `encode_video_frames`. The video is complete as soon as
+    `finish` returns.
+
+    `add_frame` only puts the frame in a queue; a background thread opens the output stream with the size
+    of the first frame and encodes the frames as they come. The queue holds at most `max_queue_size` frames:
+    if the encoder can't keep up, `add_frame` blocks instead of buffering the whole episode in memory.
+    Per-channel image stats are accumulated along the way (`stats`), since no image is left on disk to
+    compute them from.
+
+    Errors of the encoding thread are raised by the next call to `add_frame` or `finish`.
+    """
+
+    def __init__(
+        self,
+        video_path: Path | str,
+        fps: int,
+        vcodec: str = "libsvtav1",
+        pix_fmt: str = "yuv420p",
+        g: int | None = 2,
+        crf: int | None = 30,
+        fast_decode: int = 0,
+        preset: int | str | None = None,
+        tune: str | None = None,
+        threads: int | None = None,
+        max_queue_size: int = 64,
+        log_level: int | None = av.logging.ERROR,
+    ):
+        check_vcodec(vcodec)
+        self.video_path = Path(video_path)
+        self.fps = fps
+        self.vcodec = vcodec
+        self.pix_fmt = check_pix_fmt(vcodec, pix_fmt)
+        self.video_options = get_video_options(vcodec, g, crf, fast_decode, preset, tune, threads)
+        self.log_level = log_level
+        self.stats = RunningImageStats()
+        self.num_frames = 0
+        self.error: Exception | None = None
+        self._closed = False
+        self._cancelled = False
+
+        if log_level is not None:
+            logging.getLogger("libav").setLevel(log_level)
+
+        self.video_path.parent.mkdir(parents=True, exist_ok=True)
+        self.queue = queue.Queue(maxsize=max_queue_size)
+        self.thread = threading.Thread(
+            target=self._encode_loop, name=f"encoder-{self.video_path.name}", daemon=True
+        )
+        self.thread.start()
+
+    def _open(self, width: int, height: int):
+        output = av.open(str(self.video_path), "w")
+        output_stream = output.add_stream(self.vcodec, self.fps, options=self.video_options)
+        output_stream.pix_fmt = self.pix_fmt
+        output_stream.width = width
+        output_stream.height = height
+        return output, output_stream
+
+    def _encode_loop(self):
+        output = output_stream = None
+        while True:
+            image = self.queue.get()
+            if image is None:
+                break
+            if self.error is not None or self._cancelled:
+                # Keep consuming so that `add_frame` never blocks on a full queue
+                continue
+            try:
+                rgb = image_to_rgb24(image)
+                if output is None:
+                    output, output_stream = self._open(width=rgb.shape[1], height=rgb.shape[0])
+                packet = output_stream.encode(av.VideoFrame.from_ndarray(rgb, format="rgb24"))
+                if packet:
+                    output.mux(packet)
+                self.stats.update(rgb.transpose(2, 0, 1))
+            except Exception as e:
+                self.error = e
+
+        if output is None:
+            return
+        try:
+            if self.error is None and not self._cancelled:
+                # Flush the encoder
+                packet = output_stream.encode()
+                if packet:
+                    output.mux(packet)
+        except Exception as e:
+            self.error = e
+        finally:
+            output.close()
+
+    def _raise_error(self):
+        if self.error is not None:
+            raise RuntimeError(f"Video encoding of {self.video_path} failed.") from self.error
+
+    def add_frame(self, image: np.ndarray | Image.Image) -> None:
+        """Queues `image` (HWC or CHW, uint8 or float in [0, 1], or PIL) for encoding."""
+        if self._closed:
+            raise RuntimeError(f"The encoder of {self.video_path} is already closed.")
+        self._raise_error()
+        self.queue.put(image)
+        self.num_frames += 1
+
+    def _close(self):
+        if not self._closed:
+            self._closed = True
+            self.queue.put(None)
+            self.thread.join()
+            if self.log_level is not None:
+                av.logging.restore_default_callback()
+
+    def finish(self) -> Path:
+        """Encodes the remaining frames, closes the video and returns its path."""
+        self._close()
+        self._raise_error()
+        if self.num_frames == 0:
+            raise ValueError(f"No frame was added to {self.video_path}.")
+        if not self.video_path.exists():
+            raise OSError(f"Video encoding did not work. File not found: {self.video_path}.")
+        return self.video_path
+
+    def cancel(self) -> None:
+        """Drops the queued frames and deletes the partial video."""
+        self._cancelled = True
+        self._close()
+        self.video_path.unlink(missing_ok=True)
+
+
 @dataclass
 class VideoFrame:
     # TODO(rcadene, lhoestq): move to Hugging Face `datasets` repo
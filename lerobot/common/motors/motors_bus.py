@@ -20,6 +20,7 @@
 # https://github.com/astral-sh/ruff/issues/3711
 
 import abc
+import itertools
 import logging
 from contextlib import contextmanager
 from dataclasses import dataclass
@@ -28,6 +29,7 @@ from functools import cached_property
 from pprint import pformat
 from typing import Protocol, TypeAlias
 
+import numpy as np
 import serial
 from deepdiff import DeepDiff
 from tqdm import tqdm
@@ -99,6 +101,70 @@ class Motor:
     norm_mode: MotorNormMode
 
 
+@dataclass
+class CalibrationTable:
+    """
+    Calibration of motors compiled into coefficients, one column per motor, so that the values of several
+    motors are (un)normalized at once by the same array operations, whatever their norm mode:
+    ```
+    normalized = ((clip(raw, lo, hi) - sub) * mul / div) * scale + offset
+    raw = int(((clip(normalized * sign + shift, lo, hi) + add) * mul / div) * scale + offset)
+    ```
+    The coefficients reproduce the floating point operations of each norm mode exactly.
+    """
+
+    normalize_coefs: tuple[np.ndarray, ...]  # lo, hi, sub, mul, div, scale, offset
+    unnormalize_coefs: tuple[np.ndarray, ...]  # sign, shift, lo, hi, add, mul, div, scale, offset
+
+    @classmethod
+    def from_calibration(
+        cls,
+        motors: dict[str, Motor],
+        calibration: dict[str, MotorCalibration],
+        resolution_table: dict[str, int],
+        apply_drive_mode: bool,
+        names: list[str],
+    ) -> "CalibrationTable":
+        normalize_coefs, unnormalize_coefs = [], []
+        for motor in names:
+            min_, max_ = calibration[motor].range_min, calibration[motor].range_max
+            if max_ == min_:
+                raise ValueError(f"Invalid calibration for motor '{motor}': min and max are equal.")
+
+            # Inverting the direction negates the scale, and reflects the range around its other end
+            sign = -1 if apply_drive_mode and calibration[motor].drive_mode else 1
+            norm_mode = motors[motor].norm_mode
+            if norm_mode is MotorNormMode.RANGE_M100_100:
+                normalize_coefs.append((min_, max_, min_, 1, max_ - min_, sign * 200, sign * -100))
+                unnormalize_coefs.append((sign, 0, -100, 100, 100, 1, 200, max_ - min_, min_))
+            elif norm_mode is MotorNormMode.RANGE_0_100:
+                shift = 100 if sign < 0 else 0
+                normalize_coefs.append((min_, max_, min_, 1, max_ - min_, sign * 100, shift))
+                unnormalize_coefs.append((sign, shift, 0, 100, 0, 1, 100, max_ - min_, min_))
+            elif norm_mode is MotorNormMode.DEGREES:
+                mid = (min_ + max_) / 2
+                max_res = resolution_table[motors[motor].model] - 1
+                normalize_coefs.append((-np.inf, np.inf, mid, 360, max_res, 1, 0))
+                unnormalize_coefs.append((1, 0, -np.inf, np.inf, 0, max_res, 360, 1, mid))
+            else:
+                raise NotImplementedError
+
+        return cls(
+            normalize_coefs=tuple(np.array(normalize_coefs, dtype=np.float64).T.copy()),
+            unnormalize_coefs=tuple(np.array(unnormalize_coefs, dtype=np.float64).T.copy()),
+        )
+
+    def normalize(self, raw: np.ndarray) -> np.ndarray:
+        lo, hi, sub, mul, div, scale, offset = self.normalize_coefs
+        return (np.minimum(np.maximum(raw, lo), hi) - sub) * mul / div * scale + offset
+
+    def unnormalize(self, normalized: np.ndarray) -> np.ndarray:
+        sign, shift, lo, hi, add, mul, div, scale, offset = self.unnormalize_coefs
+        raw = (np.minimum(np.maximum(normalized * sign + shift, lo), hi) + add) * mul / div * scale + offset
+        # Truncated towards zero, like `int()`
+        return np.trunc(raw).astype(np.int64)
+
+
 class JointOutOfRangeError(Exception):
     def __init__(self, message="Joint is out of range"):
         self.message = message
@@ -268,6 +334,8 @@ class MotorsBus(abc.ABC):
     ):
         self.port = port
         self.motors = motors
+        # Compiled calibration, for each tuple of motor ids passed to `_normalize`/`_unnormalize`
+        self._calibration_tables: dict[tuple[int, ...], CalibrationTable] = {}
         self.calibration = calibration if calibration else {}
 
         self.port_handler: PortHandler
@@ -281,6 +349,17 @@ class MotorsBus(abc.ABC):
         self._id_to_name_dict = {m.id: motor for motor, m in self.motors.items()}
         self._model_nb_to_model_dict = {v: k for k, v in self.model_number_table.items()}
 
+        # (motor ids, address, length) the sync reader/writer are set up for
+        self._sync_reader_setup: tuple[tuple[int, ...], int, int] | None = None
+        self._sync_writer_setup: tuple[tuple[int, ...], int, int] | None = None
+        # Packet timeout (ms) of a sync read request sent ahead by a pipelined read, whose response hasn't
+        # been received yet
+        self._pending_sync_read: float | None = None
+        # Result of a pending sync read whose response was received early to use the bus for something else
+        # (e.g. a sync write between two pipelined reads). Its data is left in the sync reader for the next
+        # pipelined read of the same registers.
+        self._drained_sync_read: int | None = None
+
         self._validate_motors()
 
     def __len__(self):
@@ -294,6 +373,19 @@ class MotorsBus(abc.ABC):
             ")',\n"
         )
 
+    @property
+    def calibration(self) -> dict[str, MotorCalibration]:
+        """
+        Calibration of the motors. It is compiled into `CalibrationTable`s on first use: assign a new
+        dictionary rather than modifying it in place for the change to be taken into account.
+        """
+        return self._calibration
+
+    @calibration.setter
+    def calibration(self, calibration: dict[str, MotorCalibration]) -> None:
+        self._calibration = calibration
+        self._calibration_tables = {}
+
     @cached_property
     def _has_different_ctrl_tables(self) -> bool:
         if len(self.models) < 2:
@@ -466,6 +558,8 @@ class MotorsBus(abc.ABC):
                 f"{self.__class__.__name__}('{self.port}') is not connected. Try running `{self.__class__.__name__}.connect()` first."
             )
 
+        self._drain_pending_sync_read()
+        self._drained_sync_read = None
         if disable_torque:
             self.port_handler.clearPort()
             self.port_handler.is_using = False
@@ -772,64 +866,31 @@ class MotorsBus(abc.ABC):
 
         return mins, maxes
 
-    def _normalize(self, ids_values: dict[int, int]) -> dict[int, float]:
+    def _compile_calibration(self, motor_ids: tuple[int, ...]) -> CalibrationTable:
         if not self.calibration:
             raise RuntimeError(f"{self} has no calibration registered.")
 
-        normalized_values = {}
-        for id_, val in ids_values.items():
-            motor = self._id_to_name(id_)
-            min_ = self.calibration[motor].range_min
-            max_ = self.calibration[motor].range_max
-            drive_mode = self.apply_drive_mode and self.calibration[motor].drive_mode
-            if max_ == min_:
-                raise ValueError(f"Invalid calibration for motor '{motor}': min and max are equal.")
-
-            bounded_val = min(max_, max(min_, val))
-            if self.motors[motor].norm_mode is MotorNormMode.RANGE_M100_100:
-                norm = (((bounded_val - min_) / (max_ - min_)) * 200) - 100
-                normalized_values[id_] = -norm if drive_mode else norm
-            elif self.motors[motor].norm_mode is MotorNormMode.RANGE_0_100:
-                norm = ((bounded_val - min_) / (max_ - min_)) * 100
-                normalized_values[id_] = 100 - norm if drive_mode else norm
-            elif self.motors[motor].norm_mode is MotorNormMode.DEGREES:
-                mid = (min_ + max_) / 2
-                max_res = self.model_resolution_table[self._id_to_model(id_)] - 1
-                normalized_values[id_] = (val - mid) * 360 / max_res
-            else:
-                raise NotImplementedError
+        table = CalibrationTable.from_calibration(
+            self.motors,
+            self.calibration,
+            self.model_resolution_table,
+            self.apply_drive_mode,
+            names=[self._id_to_name(id_) for id_ in motor_ids],
+        )
+        self._calibration_tables[motor_ids] = table
+        return table
 
-        return normalized_values
+    def _normalize(self, ids_values: dict[int, int]) -> dict[int, float]:
+        ids = tuple(ids_values)
+        table = self._calibration_tables.get(ids) or self._compile_calibration(ids)
+        raw = np.fromiter(ids_values.values(), dtype=np.float64, count=len(ids))
+        return dict(zip(ids, table.normalize(raw).tolist(), strict=True))
 
     def _unnormalize(self, ids_values: dict[int, float]) -> dict[int, int]:
-        if not self.calibration:
-            raise RuntimeError(f"{self} has no calibration registered.")
-
-        unnormalized_values = {}
-        for id_, val in ids_values.items():
-            motor = self._id_to_name(id_)
-            min_ = self.calibration[motor].range_min
-            max_ = self.calibration[motor].range_max
-            drive_mode = self.apply_drive_mode and self.calibration[motor].drive_mode
-            if max_ == min_:
-                raise ValueError(f"Invalid calibration for motor '{motor}': min and max are equal.")
-
-            if self.motors[motor].norm_mode is MotorNormMode.RANGE_M100_100:
-                val = -val if drive_mode else val
-                bounded_val = min(100.0, max(-100.0, val))
-                unnormalized_values[id_] = int(((bounded_val + 100) / 200) * (max_ - min_) + min_)
-            elif self.motors[motor].norm_mode is MotorNormMode.RANGE_0_100:
-                val = 100 - val if drive_mode else val
-                bounded_val = min(100.0, max(0.0, val))
-                unnormalized_values[id_] = int((bounded_val / 100) * (max_ - min_) + min_)
-            elif self.motors[motor].norm_mode is MotorNormMode.DEGREES:
-                mid = (min_ + max_) / 2
-                max_res = self.model_resolution_table[self._id_to_model(id_)] - 1
-                unnormalized_values[id_] = int((val * max_res / 360) + mid)
-            else:
-                raise NotImplementedError
-
-        return unnormalized_values
+        ids = tuple(ids_values)
+        table = self._calibration_tables.get(ids) or self._compile_calibration(ids)
+        normalized = np.fromiter(ids_values.values(), dtype=np.float64, count=len(ids))
+        return dict(zip(ids, table.unnormalize(normalized).tolist(), strict=True))
 
     @abc.abstractmethod
     def _encode_sign(self, data_name: str, ids_values: dict[int, int]) -> dict[int, int]:
@@ -879,6 +940,7 @@ class MotorsBus(abc.ABC):
             int | None: Motor model number or `None` on failure.
         """
         id_ = self._get_motor_id(motor)
+        self._drain_pending_sync_read()
         for n_try in range(1 + num_retry):
             model_number, comm, error = self.packet_handler.ping(self.port_handler, id_)
             if self._is_comm_success(comm):
@@ -970,6 +1032,7 @@ class MotorsBus(abc.ABC):
         else:
             raise ValueError(length)
 
+        self._drain_pending_sync_read()
         for n_try in range(1 + num_retry):
             value, comm, error = read_fn(self.port_handler, motor_id, address)
             if self._is_comm_success(comm):
@@ -1033,6 +1096,7 @@ class MotorsBus(abc.ABC):
         err_msg: str = "",
     ) -> tuple[int, int]:
         data = self._serialize_data(value, length)
+        self._drain_pending_sync_read()
         for n_try in range(1 + num_retry):
             comm, error = self.packet_handler.writeTxRx(self.port_handler, motor_id, addr, length, data)
             if self._is_comm_success(comm):
@@ -1056,6 +1120,7 @@ class MotorsBus(abc.ABC):
         *,
         normalize: bool = True,
         num_retry: int = 0,
+        pipelined: bool = False,
     ) -> dict[str, Value]:
         """Read the same register from several motors at once.
 
@@ -1064,6 +1129,12 @@ class MotorsBus(abc.ABC):
             motors (str | list[str] | None, optional): Motors to query. `None` (default) reads every motor.
             normalize (bool, optional): Normalisation flag.  Defaults to `True`.
             num_retry (int, optional): Retry attempts.  Defaults to `0`.
+            pipelined (bool, optional): If `True`, the request of the next read is sent as soon as the
+                response of this one is received, so that the motors answer it while the caller processes the
+                values. The next identical pipelined read then only waits for what remains of the response,
+                which was requested at the end of this call: the values it returns are as old as the time
+                elapsed between the two calls. Any other transaction on the bus first waits for the pending
+                response. Defaults to `False`.
 
         Returns:
             dict[str, Value]: Mapping *motor name → value*.
@@ -1087,7 +1158,7 @@ class MotorsBus(abc.ABC):
 
         err_msg = f"Failed to sync read '{data_name}' on {ids=} after {num_retry + 1} tries."
         ids_values, _ = self._sync_read(
-            addr, length, ids, num_retry=num_retry, raise_on_error=True, err_msg=err_msg
+            addr, length, ids, num_retry=num_retry, raise_on_error=True, err_msg=err_msg, pipelined=pipelined
         )
 
         ids_values = self._decode_sign(data_name, ids_values)
@@ -1097,6 +1168,67 @@ class MotorsBus(abc.ABC):
 
         return {self._id_to_name(id_): value for id_, value in ids_values.items()}
 
+    def bulk_read(
+        self,
+        data_names: list[str],
+        motors: str | list[str] | None = None,
+        *,
+        normalize: bool = True,
+        num_retry: int = 0,
+        pipelined: bool = False,
+    ) -> dict[str, dict[str, Value]]:
+        """Read several registers from several motors in a single sync read.
+
+        The registers are read as one block spanning from the first to the last of them, so they should be
+        close to each other in the control table (e.g. `"Present_Position"`, `"Present_Velocity"` and
+        `"Present_Current"` on both Feetech and Dynamixel motors).
+
+        Args:
+            data_names (list[str]): Register names.
+            motors (str | list[str] | None, optional): Motors to query. `None` (default) reads every motor.
+            normalize (bool, optional): Normalisation flag.  Defaults to `True`.
+            num_retry (int, optional): Retry attempts.  Defaults to `0`.
+            pipelined (bool, optional): See :pymeth:`sync_read`. Defaults to `False`.
+
+        Returns:
+            dict[str, dict[str, Value]]: Mapping *register name → motor name → value*.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(
+                f"{self.__class__.__name__}('{self.port}') is not connected. You need to run `{self.__class__.__name__}.connect()`."
+            )
+
+        self._assert_protocol_is_compatible("sync_read")
+
+        names = self._get_motors_list(motors)
+        ids = [self.motors[motor].id for motor in names]
+        models = [self.motors[motor].model for motor in names]
+
+        if self._has_different_ctrl_tables:
+            for data_name in data_names:
+                assert_same_address(self.model_ctrl_table, models, data_name)
+
+        model = next(iter(models))
+        registers = {name: get_address(self.model_ctrl_table, model, name) for name in data_names}
+        # A single sync read of the block of registers spanning them all
+        addr = min(reg_addr for reg_addr, _ in registers.values())
+        length = max(reg_addr + reg_length for reg_addr, reg_length in registers.values()) - addr
+
+        err_msg = f"Failed to sync read {data_names} on {ids=} after {num_retry + 1} tries."
+        self._sync_read_packet(
+            addr, length, ids, num_retry=num_retry, raise_on_error=True, err_msg=err_msg, pipelined=pipelined
+        )
+
+        values = {}
+        for data_name, (reg_addr, reg_length) in registers.items():
+            ids_values = {id_: self.sync_reader.getData(id_, reg_addr, reg_length) for id_ in ids}
+            ids_values = self._decode_sign(data_name, ids_values)
+            if normalize and data_name in self.normalized_data:
+                ids_values = self._normalize(ids_values)
+            values[data_name] = {self._id_to_name(id_): value for id_, value in ids_values.items()}
+
+        return values
+
     def _sync_read(
         self,
         addr: int,
@@ -1106,43 +1238,102 @@ class MotorsBus(abc.ABC):
         num_retry: int = 0,
         raise_on_error: bool = True,
         err_msg: str = "",
+        pipelined: bool = False,
     ) -> tuple[dict[int, int], int]:
-        self._setup_sync_reader(motor_ids, addr, length)
-        for n_try in range(1 + num_retry):
-            comm = self.sync_reader.txRxPacket()
-            if self._is_comm_success(comm):
-                break
-            logger.debug(
-                f"Failed to sync read @{addr=} ({length=}) on {motor_ids=} ({n_try=}): "
-                + self.packet_handler.getTxRxResult(comm)
-            )
-
-        if not self._is_comm_success(comm) and raise_on_error:
-            raise ConnectionError(f"{err_msg} {self.packet_handler.getTxRxResult(comm)}")
-
+        comm = self._sync_read_packet(
+            addr,
+            length,
+            motor_ids,
+            num_retry=num_retry,
+            raise_on_error=raise_on_error,
+            err_msg=err_msg,
+            pipelined=pipelined,
+        )
         values = {id_: self.sync_reader.getData(id_, addr, length) for id_ in motor_ids}
         return values, comm
 
+    def _sync_read_packet(
+        self,
+        addr: int,
+        length: int,
+        motor_ids: list[int],
+        *,
+        num_retry: int = 0,
+        raise_on_error: bool = True,
+        err_msg: str = "",
+        pipelined: bool = False,
+    ) -> int:
+        """Receives the response of a sync read into `self.sync_reader`, from which the values are read."""
+        setup = (tuple(motor_ids), addr, length)
+        comm = None
+        if pipelined and setup == self._sync_reader_setup:
+            if self._pending_sync_read is not None:
+                # The request was sent at the end of the previous read, only its response is left to receive
+                comm = self._receive_pending_sync_read()
+            elif self._drained_sync_read is not None:
+                # The response was already received, before using the bus in between
+                comm, self._drained_sync_read = self._drained_sync_read, None
+            if comm is not None and not self._is_comm_success(comm):
+                logger.debug(
+                    f"Failed to receive pipelined sync read @{addr=} ({length=}) on {motor_ids=}: "
+                    + self.packet_handler.getTxRxResult(comm)
+                )
+
+        if comm is None or not self._is_comm_success(comm):
+            self._drain_pending_sync_read()
+            # Overwritten by the new response
+            self._drained_sync_read = None
+            self._setup_sync_reader(motor_ids, addr, length)
+            for n_try in range(1 + num_retry):
+                comm = self.sync_reader.txRxPacket()
+                if self._is_comm_success(comm):
+                    break
+                logger.debug(
+                    f"Failed to sync read @{addr=} ({length=}) on {motor_ids=} ({n_try=}): "
+                    + self.packet_handler.getTxRxResult(comm)
+                )
+
+            if not self._is_comm_success(comm) and raise_on_error:
+                raise ConnectionError(f"{err_msg} {self.packet_handler.getTxRxResult(comm)}")
+
+        if pipelined:
+            # Sending the next request leaves the data received untouched: the motors answer it while the
+            # caller processes this one
+            self._send_sync_read()
+
+        return comm
+
+    def _send_sync_read(self) -> None:
+        comm = self.sync_reader.txPacket()
+        if self._is_comm_success(comm):
+            self._pending_sync_read = self.port_handler.packet_timeout
+        else:
+            logger.debug(f"Failed to send pipelined sync read: {self.packet_handler.getTxRxResult(comm)}")
+
+    def _receive_pending_sync_read(self) -> int:
+        # The timeout started when the request was sent, possibly long ago: it is restarted now
+        self.port_handler.setPacketTimeoutMillis(self._pending_sync_read)
+        self._pending_sync_read = None
+        return self.sync_reader.rxPacket()
+
+    def _drain_pending_sync_read(self) -> None:
+        """Waits for the response of a pipelined sync read, if any, before using the bus for anything else."""
+        if self._pending_sync_read is not None:
+            self._drained_sync_read = self._receive_pending_sync_read()
+
     def _setup_sync_reader(self, motor_ids: list[int], addr: int, length: int) -> None:
+        # Reading the same register of the same motors as the previous call (e.g. the present position at
+        # every step of a control loop) reuses the current setup
+        setup = (tuple(motor_ids), addr, length)
+        if setup == self._sync_reader_setup:
+            return
+
         self.sync_reader.clearParam()
         self.sync_reader.start_address = addr
         self.sync_reader.data_length = length
         for id_ in motor_ids:
             self.sync_reader.addParam(id_)
-
-    # TODO(aliberts, pkooij): Implementing something like this could get even much faster read times if need be.
-    # Would have to handle the logic of checking if a packet has been sent previously though but doable.
-    # This could be at the cost of increase latency between the moment the data is produced by the motors and
-    # the moment it is used by a policy.
-    # def _async_read(self, motor_ids: list[int], address: int, length: int):
-    #     if self.sync_reader.start_address != address or self.sync_reader.data_length != length or ...:
-    #         self._setup_sync_reader(motor_ids, address, length)
-    #     else:
-    #         self.sync_reader.rxPacket()
-    #         self.sync_reader.txPacket()
-
-    #     for id_ in motor_ids:
-    #         value = self.sync_reader.getData(id_, address, length)
+        self._sync_reader_setup = setup
 
     def sync_write(
         self,
@@ -1186,15 +1377,77 @@ class MotorsBus(abc.ABC):
         err_msg = f"Failed to sync write '{data_name}' with {ids_values=} after {num_retry + 1} tries."
         self._sync_write(addr, length, ids_values, num_retry=num_retry, raise_on_error=True, err_msg=err_msg)
 
+    def bulk_write(
+        self,
+        values: dict[str, Value | dict[str, Value]],
+        *,
+        normalize: bool = True,
+        num_retry: int = 0,
+    ) -> None:
+        """Write several registers on multiple motors in a single sync write.
+
+        The registers are written as one block, so they must be contiguous in the control table (e.g.
+        `"P_Coefficient"`, `"D_Coefficient"` and `"I_Coefficient"` on Feetech motors). Like
+        :pymeth:`sync_write`, this doesn't expect a response status packet.
+
+        Args:
+            values (dict[str, Value | dict[str, Value]]): Mapping *register name → values*, where values are
+                either a single value (applied to every motor) or a mapping *motor name → value*. All the
+                registers must be written on the same motors.
+            normalize (bool, optional): If `True` (default) convert values from the user range to raw units.
+            num_retry (int, optional): Retry attempts.  Defaults to `0`.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(
+                f"{self.__class__.__name__}('{self.port}') is not connected. You need to run `{self.__class__.__name__}.connect()`."
+            )
+
+        registers_values = {name: self._get_ids_values_dict(vals) for name, vals in values.items()}
+        ids = list(next(iter(registers_values.values())))
+        if any(set(ids_values) != set(ids) for ids_values in registers_values.values()):
+            raise ValueError(f"All the registers must be written on the same motors, got {values}.")
+
+        models = [self._id_to_model(id_) for id_ in ids]
+        if self._has_different_ctrl_tables:
+            for data_name in registers_values:
+                assert_same_address(self.model_ctrl_table, models, data_name)
+
+        model = next(iter(models))
+        # (address, length, name) of each register, in the order of the control table
+        registers = sorted((*get_address(self.model_ctrl_table, model, name), name) for name in values)
+        for (prev_addr, prev_length, prev_name), (reg_addr, _, data_name) in itertools.pairwise(registers):
+            if reg_addr != prev_addr + prev_length:
+                raise ValueError(
+                    f"'{prev_name}' and '{data_name}' aren't contiguous in the control table of '{model}'."
+                )
+
+        ids_data = {id_: [] for id_ in ids}
+        for _, reg_length, data_name in registers:
+            ids_values = registers_values[data_name]
+            if normalize and data_name in self.normalized_data:
+                ids_values = self._unnormalize(ids_values)
+            ids_values = self._encode_sign(data_name, ids_values)
+            for id_ in ids:
+                ids_data[id_] += self._serialize_data(ids_values[id_], reg_length)
+
+        addr, length = registers[0][0], len(ids_data[ids[0]])
+        err_msg = f"Failed to sync write {list(values)} on {ids=} after {num_retry + 1} tries."
+        self._sync_write(addr, length, ids_data, num_retry=num_retry, raise_on_error=True, err_msg=err_msg)
+
     def _sync_write(
         self,
         addr: int,
         length: int,
-        ids_values: dict[int, int],
+        ids_values: dict[int, int] | dict[int, list[int]],
         num_retry: int = 0,
         raise_on_error: bool = True,
         err_msg: str = "",
     ) -> int:
+        """
+        `ids_values` are either values of the register at `addr`, or the bytes of the block of registers
+        starting at `addr`.
+        """
+        self._drain_pending_sync_read()
         self._setup_sync_writer(ids_values, addr, length)
         for n_try in range(1 + num_retry):
             comm = self.sync_writer.txPacket()
@@ -1210,10 +1463,22 @@ class MotorsBus(abc.ABC):
 
         return comm
 
-    def _setup_sync_writer(self, ids_values: dict[int, int], addr: int, length: int) -> None:
+    def _setup_sync_writer(
+        self, ids_values: dict[int, int] | dict[int, list[int]], addr: int, length: int
+    ) -> None:
+        def serialize(value: int | list[int]) -> list[int]:
+            return value if isinstance(value, list) else self._serialize_data(value, length)
+
+        # Only the values change when writing the same register of the same motors as the previous call
+        setup = (tuple(ids_values), addr, length)
+        if setup == self._sync_writer_setup:
+            for id_, value in ids_values.items():
+                self.sync_writer.changeParam(id_, serialize(value))
+            return
+
         self.sync_writer.clearParam()
         self.sync_writer.start_address = addr
         self.sync_writer.data_length = length
         for id_, value in ids_values.items():
-            data = self._serialize_data(value, length)
-            self.sync_writer.addParam(id_, data)
+            self.sync_writer.addParam(id_, serialize(value))
+        self._sync_writer_setup = setup
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+
+# Copyright 2024 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+from pathlib import Path
+
+import torch
+from torch import Tensor, nn
+
+from lerobot.common.policies.factory import get_policy_class
+from lerobot.common.policies.pretrained import PreTrainedPolicy
+from lerobot.configs.policies import PreTrainedConfig
+
+
+class CachedBackbone(nn.Module):
+    """Vision backbone shared by several policies.
+
+    At inference (grad disabled, eval mode), the outputs of the last `max_entries` distinct inputs are kept
+    and returned again when the same frame comes back, so policies reading the same observation pay for the
+    backbone only once. Policies run the backbone once per camera, so `max_entries` should be at least the
+    number of cameras.
+
+    Note: wrapping changes the backbone parameter names (`backbone.*` -> `backbone.module.*`), so policies
+    in a registry are meant for inference and should not be saved with `save_pretrained`.
+    """
+
+    def __init__(self, module: nn.Module, max_entries: int = 4):
+        super().__init__()
+        self.module = module
+        self.max_entries = max_entries
+        # (input, output) pairs, least recently used first
+        self._cache: list[tuple[Tensor, object]] = []
+
+    def clear_cache(self):
+        self._cache = []
+
+    def _lookup(self, x: Tensor):
+        for i, (cached_input, output) in enumerate(self._cache):
+            if (
+                cached_input.shape == x.shape
+                and cached_input.dtype == x.dtype
+                and cached_input.device == x.device
+                and torch.equal(cached_input, x)
+            ):
+                self._cache.append(self._cache.pop(i))
+                return output
+        return None
+
+    def forward(self, x: Tensor):
+        use_cache = not self.training and not torch.is_grad_enabled()
+        if use_cache and (output := self._lookup(x)) is not None:
+            return output
+
+        output = self.module(x)
+        if use_cache:
+            # Copy so that in-place updates of the caller's tensor can't validate a stale output
+            self._cache.append((x.clone(), output))
+            del self._cache[: -self.max_entries]
+        else:
+            self.clear_cache()
+        return output
+
+
+def _get_backbone(policy: PreTrainedPolicy) -> nn.Module | None:
+    model = getattr(policy, "model", None)
+    return getattr(model, "backbone", None)
+
+
+def _same_weights(a: nn.Module, b: nn.Module) -> bool:
+    if type(a) is not type(b):
+        return False
+    a_state, b_state = a.state_dict(), b.state_dict()
+    if a_state.keys() != b_state.keys():
+        return False
+    return all(
+        a_state[k].shape == b_state[k].shape
+        and a_state[k].device == b_state[k].device
+        and torch.equal(a_state[k], b_state[k])
+        for k in a_state
+    )
+
+
+class PolicyRegistry:
+    """Keeps several pretrained policies resident on their device and switches between them.
+
+    Switching is a dictionary lookup followed by `policy.reset()` (which clears e.g. ACT's action queue), so
+    it takes well under a millisecond. Policies exposing their vision backbone as `policy.model.backbone`
+    (ACT) share a single `CachedBackbone` whenever their backbone weights are identical, so memory does
+    not grow with the number of subtask policies trained from the same frozen backbone.
+
+    Example:
+        registry = PolicyRegistry()
+        registry.load("move", "outputs/train/act_cc_v10_full_run/checkpoints/100000/pretrained_model")
+        registry.load("cut", "outputs/train/act_cc_v11_full_run/checkpoints/100000/pretrained_model")
+        policy = registry.activate("move")
+    """
+
+    def __init__(self, device: str | None = None, share_backbones: bool = True):
+        self.device = device
+        self.share_backbones = share_backbones
+        self.policies: dict[str, PreTrainedPolicy] = {}
+        self.shared_backbones: list[CachedBackbone] = []
+        self.active_name: str | None = None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.policies
+
+    def __getitem__(self, name: str) -> PreTrainedPolicy:
+        return self.policies[name]
+
+    def __len__(self) -> int:
+        return len(self.policies)
+
+    @property
+    def names(self) -> list[str]:
+        return list(self.policies)
+
+    @property
+    def active(self) -> PreTrainedPolicy | None:
+        return None if self.active_name is None else self.policies[self.active_name]
+
+    def load(self, name: str, pretrained_path: str | Path) -> PreTrainedPolicy:
+        """Load a policy from a `pretrained_model` directory (or hub repo) and register it under `name`.
+
+        Input/output features and normalization stats are read from the checkpoint itself.
+        """
+        cfg = PreTrainedConfig.from_pretrained(pretrained_path)
+        cfg.pretrained_path = pretrained_path
+        if self.device is not None:
+            cfg.device = self.device
+        policy_cls = get_policy_class(cfg.type)
+        policy = policy_cls.from_pretrained(pretrained_path, config=cfg)
+        return self.add(name, policy)
+
+    def add(self, name: str, policy: PreTrainedPolicy) -> PreTrainedPolicy:
+        if name in self.policies:
+            raise KeyError(f"A policy named '{name}' is already registered.")
+
+        policy.eval()
+        if self.share_backbones:
+            self._share_backbone(name, policy)
+        self.policies[name] = policy
+        return policy
+
+    def _share_backbone(self, name: str, policy: PreTrainedPolicy):
+        backbone = _get_backbone(policy)
+        if backbone is None:
+            return
+        if isinstance(backbone, CachedBackbone):
+            backbone = backbone.module
+
+        for shared in self.shared_backbones:
+            if _same_weights(shared.module, backbone):
+                policy.model.backbone = shared
+                logging.info(f"Policy '{name}' shares its vision backbone with a previously loaded policy.")
+                return
+
+        shared = CachedBackbone(backbone)
+        policy.model.backbone = shared
+        self.shared_backbones.append(shared)
+
+    def activate(self, name: str) -> PreTrainedPolicy:
+        """Make `name` the active policy and reset its internal state (action queues, ensemblers)."""
+        policy = self.policies[name]
+        policy.reset()
+        self.active_name = name
+        return policy
+
+    def select_action(self, batch: dict[str, Tensor]) -> Tensor:
+        if self.active is None:
+            raise RuntimeError("No active policy. Call `activate(name)` first.")
+        return self.active.select_action(batch)
+
+    def clear_caches(self):
+        for shared in self.shared_backbones:
+            shared.clear_cache()
@@ -34,6 +34,11 @@ class SO101FollowerConfig(RobotConfig):
     # the number of motors in your follower arms.
     max_relative_target: int | None = None
 
+    # Also observe the present velocity and current of the motors (`<motor>.vel` and `<motor>.current`, in raw
+    # units). They are read together with the present position, in a single bus transaction.
+    observe_velocity: bool = False
+    observe_current: bool = False
+
     # cameras
     cameras: dict[str, CameraConfig] = field(default_factory=dict)
 
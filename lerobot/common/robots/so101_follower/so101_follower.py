@@ -59,11 +59,24 @@ class SO101Follower(Robot):
             calibration=self.calibration,
         )
         self.cameras = make_cameras_from_configs(config.cameras)
+        # Registers read by `get_observation`, and the suffix of their features
+        self.observed_registers = {"Present_Position": "pos"}
+        if config.observe_velocity:
+            self.observed_registers["Present_Velocity"] = "vel"
+        if config.observe_current:
+            self.observed_registers["Present_Current"] = "current"
+        # Present position read by the last observation, until the next action is sent
+        self._present_pos: dict[str, float] | None = None
 
     @property
     def _motors_ft(self) -> dict[str, type]:
         return {f"{motor}.pos": float for motor in self.bus.motors}
 
+    @property
+    def _observed_motors_ft(self) -> dict[str, type]:
+        suffixes = self.observed_registers.values()
+        return {f"{motor}.{suffix}": float for suffix in suffixes for motor in self.bus.motors}
+
     @property
     def _cameras_ft(self) -> dict[str, tuple]:
         return {
@@ -72,7 +85,7 @@ class SO101Follower(Robot):
 
     @cached_property
     def observation_features(self) -> dict[str, type | tuple]:
-        return {**self._motors_ft, **self._cameras_ft}
+        return {**self._observed_motors_ft, **self._cameras_ft}
 
     @cached_property
     def action_features(self) -> dict[str, type]:
@@ -134,15 +147,26 @@ class SO101Follower(Robot):
         print("Calibration saved to", self.calibration_fpath)
 
     def configure(self) -> None:
+        # Set P_Coefficient to lower value to avoid shakiness (Default is 32)
+        # Set I_Coefficient and D_Coefficient to default value 0 and 32
+        coefficients = {"P_Coefficient": 16, "D_Coefficient": 32, "I_Coefficient": 0}
+        settings = {"Operating_Mode": OperatingMode.POSITION.value, **coefficients}
         with self.bus.torque_disabled():
             self.bus.configure_motors()
-            for motor in self.bus.motors:
-                self.bus.write("Operating_Mode", motor, OperatingMode.POSITION.value)
-                # Set P_Coefficient to lower value to avoid shakiness (Default is 32)
-                self.bus.write("P_Coefficient", motor, 16)
-                # Set I_Coefficient and D_Coefficient to default value 0 and 32
-                self.bus.write("I_Coefficient", motor, 0)
-                self.bus.write("D_Coefficient", motor, 32)
+            self.bus.sync_write("Operating_Mode", OperatingMode.POSITION.value)
+            self.bus.bulk_write(coefficients)
+            # Motors don't acknowledge sync writes: read the registers back in one round trip, so that a
+            # write lost on the bus doesn't go unnoticed
+            values = self.bus.bulk_read(list(settings), normalize=False)
+
+        mismatches = [
+            f"{motor}.{name}={value} (expected {settings[name]})"
+            for name, motor_values in values.items()
+            for motor, value in motor_values.items()
+            if value != settings[name]
+        ]
+        if mismatches:
+            raise RuntimeError(f"{self} failed to configure its motors: {', '.join(mismatches)}")
 
     def setup_motors(self) -> None:
         for motor in reversed(self.bus.motors):
@@ -154,10 +178,15 @@ class SO101Follower(Robot):
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
-        # Read arm position
+        # Read arm position, and velocity and current if observed
         start = time.perf_counter()
-        obs_dict = self.bus.sync_read("Present_Position")
-        obs_dict = {f"{motor}.pos": val for motor, val in obs_dict.items()}
+        registers = self.bus.bulk_read(list(self.observed_registers))
+        obs_dict = {
+            f"{motor}.{suffix}": val
+            for data_name, suffix in self.observed_registers.items()
+            for motor, val in registers[data_name].items()
+        }
+        self._present_pos = registers["Present_Position"]
         dt_ms = (time.perf_counter() - start) * 1e3
         logger.debug(f"{self} read state: {dt_ms:.1f}ms")
 
@@ -189,9 +218,12 @@ class SO101Follower(Robot):
         goal_pos = {key.removesuffix(".pos"): val for key, val in action.items() if key.endswith(".pos")}
 
         # Cap goal position when too far away from present position.
-        # /!\ Slower fps expected due to reading from the follower.
+        # /!\ Slower fps expected due to reading from the follower, unless an observation was read since the
+        # last action.
+        present_pos, self._present_pos = self._present_pos, None
         if self.config.max_relative_target is not None:
-            present_pos = self.bus.sync_read("Present_Position")
+            if present_pos is None:
+                present_pos = self.bus.sync_read("Present_Position")
             goal_present_pos = {key: (g_pos, present_pos[key]) for key, g_pos in goal_pos.items()}
             goal_pos = ensure_safe_goal_position(goal_present_pos, self.config.max_relative_target)
 
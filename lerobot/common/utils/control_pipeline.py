@@ -0,0 +1,281 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Control loop whose stages (sensing, deciding, acting, recording/displaying) run concurrently.
+
+In a sequential loop, any stage running long (a policy forward pass, a rerun logging spike, a slow image
+write) delays the next observation and pushes the loop below its target fps. `PipelinedControlLoop` runs
+each stage in its own thread instead, connected by `LatestValue` channels: a stage always works on the most
+recent output of the previous one and never queues up behind it, and only the sensing stage is scheduled.
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from lerobot.common.utils.scheduler import (
+    PeriodicScheduler,
+    SchedulerConfig,
+    SchedulerStats,
+    format_summary,
+    summarize_durations,
+)
+from lerobot.common.utils.tracing import span
+
+
+class LatestValue:
+    """
+    Single-slot channel: `put` never blocks and replaces the previous value, whether it was read or not, and
+    `get` waits for a value newer than the last one the reader has seen. Readers which fall behind skip the
+    intermediate values instead of processing a backlog.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._value = None
+        self._seq = 0
+        self._closed = False
+
+    def put(self, value: Any) -> None:
+        with self._cond:
+            self._value = value
+            self._seq += 1
+            self._cond.notify_all()
+
+    def get(self, after: int = 0, timeout: float | None = None) -> tuple[int, Any] | None:
+        """
+        The newest value and its sequence number, once there is a value newer than the `after`-th one.
+        Returns None once the channel is closed and has nothing newer, or after `timeout` seconds.
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._seq > after or self._closed, timeout):
+                return None
+            if self._seq <= after:
+                return None
+            return self._seq, self._value
+
+    def close(self) -> None:
+        """Wakes up the readers: they get the last value if they haven't seen it yet, then None."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+@dataclass
+class Tick:
+    """One period of the control loop: `index` is the number of periods since the start of the loop."""
+
+    index: int
+    # Time of the tick relative to the start of the loop, `index / fps`, regardless of scheduling delays
+    timestamp: float
+    deadline: float  # `time.perf_counter()` time at which the tick was scheduled
+    observation: dict
+    # Anything else the sensing stage computes for the next stages (e.g. a dataset frame)
+    data: dict = field(default_factory=dict)
+
+
+class PipelineStats:
+    """Per-stage timings of a `PipelinedControlLoop`, all in seconds."""
+
+    def __init__(self, fps: int):
+        self.fps = fps
+        self.durations: dict[str, list[float]] = {}
+        # Deadline of a tick to the end of sending its action
+        self.latency: list[float] = []
+        # Ticks recorded with the action of a previous tick, because no action was computed from them
+        self.stale_ticks = 0
+        self.num_ticks = 0
+        # Timing of the sensing stage, the only scheduled one
+        self.schedule = SchedulerStats(fps)
+
+    def add_duration(self, stage: str, duration_s: float) -> None:
+        self.durations.setdefault(stage, []).append(duration_s)
+
+    def report(self) -> dict[str, Any]:
+        report = {
+            **self.schedule.report(),
+            "num_ticks": self.num_ticks,
+            "stale_ticks": self.stale_ticks,
+        }
+        for name, values in [("latency", self.latency), *self.durations.items()]:
+            if values:
+                report[name] = summarize_durations(values)
+        return report
+
+    def format(self) -> str:
+        lines = [self.schedule.format(), f"  {self.stale_ticks} stale ticks"]
+        for name, values in [("latency", self.latency), *self.durations.items()]:
+            if values:
+                lines.append(format_summary(name, summarize_durations(values)))
+        return "\n".join(lines)
+
+
+class PipelinedControlLoop:
+    """
+    Runs a control loop as concurrent stages, each in its own thread:
+    - sense: `sense(index)` returns the observation of the tick and the data needed downstream (e.g. the
+      teleoperator action, or a dataset frame). It is the only scheduled stage, paced by a
+      `PeriodicScheduler` on absolute deadlines so that ticks don't drift. When sensing runs past the next
+      deadlines, these ticks are skipped.
+    - decide: `decide(tick)` computes the action of the newest tick. Ticks arriving while an action is being
+      computed are skipped: a slow policy lowers the action rate, not the observation rate.
+    - act: `act(tick, action)` sends the newest action and returns the action actually sent.
+    - record: `record(tick, sent_action)` is called for every sensed tick, in order, with the last action
+      sent for it or, if none was computed from it, the action sent before it (a "stale" tick). Ticks sensed
+      before the first action are dropped. Calls are queued, so a slow sink (e.g. image writing) never
+      blocks the other stages, and no tick is lost.
+    - display: `display(tick, sent_action)` is called for the newest sent action, skipping the others.
+
+    `sense` and `act` never run at the same time (`io_lock`), since they usually share the robot's bus.
+    Without a `decide` stage, the action is `tick.data["action"]`, as set by `sense`.
+    """
+
+    def __init__(
+        self,
+        fps: int,
+        sense: Callable[[int], tuple[dict, dict]],
+        act: Callable[[Tick, dict], dict],
+        decide: Callable[[Tick], dict] | None = None,
+        record: Callable[[Tick, dict], None] | None = None,
+        display: Callable[[Tick, dict], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+        scheduler_config: SchedulerConfig | None = None,
+    ):
+        self.fps = fps
+        self.sense = sense
+        self.decide = decide
+        self.act = act
+        self.record = record
+        self.display = display
+        self.should_stop = should_stop if should_stop is not None else lambda: False
+        # Applies to the sensing thread (real-time priority, CPU affinity)
+        self.scheduler_config = scheduler_config
+        self.io_lock = threading.Lock()
+
+    def run(self, duration_s: float) -> PipelineStats:
+        """Runs the loop for `duration_s` seconds (or until `should_stop`), returns its timings."""
+        stats = PipelineStats(self.fps)
+        ticks, actions, sent = LatestValue(), LatestValue(), LatestValue()
+        records: queue.Queue = queue.Queue()
+        stop = threading.Event()
+        errors: list[Exception] = []
+
+        # Ticks waiting to be recorded, since the decide and act stages may skip some
+        sensed: dict[int, Tick] = {}
+
+        def run_stage(name: str, target: Callable[[], None], on_exit: list[Callable[[], None]]):
+            try:
+                target()
+            except Exception as e:
+                logging.error(f"Control loop stage '{name}' failed: {e}")
+                errors.append(e)
+                stop.set()
+            finally:
+                # Let the next stages finish their work and stop
+                for callback in on_exit:
+                    callback()
+
+        def sense_loop():
+            with PeriodicScheduler(self.fps, self.scheduler_config) as scheduler:
+                stats.schedule = scheduler.stats
+                while scheduler.timestamp < duration_s and not (stop.is_set() or self.should_stop()):
+                    index, begin = scheduler.index, time.perf_counter()
+                    with span("sense", "control_loop", index=index), self.io_lock:
+                        observation, data = self.sense(index)
+                    stats.add_duration("sense", time.perf_counter() - begin)
+                    stats.num_ticks += 1
+                    tick = Tick(index, scheduler.timestamp, scheduler.deadline, observation, data)
+                    if self.record is not None:
+                        sensed[index] = tick
+                    ticks.put(tick)
+                    scheduler.wait()
+
+        def decide_loop():
+            seq = 0
+            while (item := ticks.get(seq)) is not None:
+                seq, tick = item
+                begin = time.perf_counter()
+                with span("decide", "control_loop", index=tick.index):
+                    action = self.decide(tick)
+                stats.add_duration("decide", time.perf_counter() - begin)
+                actions.put((tick, action))
+
+        def act_loop():
+            seq, last_recorded, last_sent = 0, -1, None
+            source = actions if self.decide is not None else ticks
+            while (item := source.get(seq)) is not None:
+                seq, value = item
+                tick, action = value if self.decide is not None else (value, value.data["action"])
+                begin = time.perf_counter()
+                with span("act", "control_loop", index=tick.index), self.io_lock:
+                    sent_action = self.act(tick, action)
+                end = time.perf_counter()
+                stats.add_duration("act", end - begin)
+                stats.latency.append(end - tick.deadline)
+                sent.put((tick, sent_action))
+                if self.record is None:
+                    continue
+                # Skipped ticks are recorded with the action in effect when they were sensed. Ticks missed by
+                # the scheduler were never sensed.
+                for index in range(last_recorded + 1, tick.index):
+                    skipped = sensed.pop(index, None)
+                    if skipped is not None and last_sent is not None:
+                        records.put((skipped, last_sent))
+                        stats.stale_ticks += 1
+                records.put((sensed.pop(tick.index), sent_action))
+                last_recorded, last_sent = tick.index, sent_action
+
+        def record_loop():
+            while (item := records.get()) is not None:
+                begin = time.perf_counter()
+                with span("record", "control_loop", index=item[0].index):
+                    self.record(*item)
+                stats.add_duration("record", time.perf_counter() - begin)
+
+        def display_loop():
+            seq = 0
+            while (item := sent.get(seq)) is not None:
+                seq, (tick, sent_action) = item
+                begin = time.perf_counter()
+                with span("display", "control_loop", index=tick.index):
+                    self.display(tick, sent_action)
+                stats.add_duration("display", time.perf_counter() - begin)
+
+        stages = [
+            ("sense", sense_loop, [ticks.close]),
+            ("act", act_loop, [sent.close, lambda: records.put(None)]),
+        ]
+        if self.decide is not None:
+            stages.append(("decide", decide_loop, [actions.close]))
+        if self.record is not None:
+            stages.append(("record", record_loop, []))
+        if self.display is not None:
+            stages.append(("display", display_loop, []))
+
+        threads = [
+            threading.Thread(target=run_stage, args=stage, name=f"control_loop_{stage[0]}", daemon=True)
+            for stage in stages
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if errors:
+            raise errors[0]
+        return stats
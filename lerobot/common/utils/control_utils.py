@@ -18,10 +18,12 @@
 
 
 import logging
+import threading
 import traceback
 from contextlib import nullcontext
 from copy import copy
 from functools import cache
+from typing import Any, Callable
 
 import numpy as np
 import torch
@@ -32,6 +34,7 @@ from lerobot.common.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.common.datasets.utils import DEFAULT_FEATURES
 from lerobot.common.policies.pretrained import PreTrainedPolicy
 from lerobot.common.robots import Robot
+from lerobot.common.utils.tracing import traced
 
 
 def log_control_info(robot: Robot, dt_s, episode_index=None, frame_index=None, fps=None):
@@ -97,6 +100,7 @@ def is_headless():
         return True
 
 
+@traced("predict_action", "policy")
 def predict_action(
     observation: dict[str, np.ndarray],
     policy: PreTrainedPolicy,
@@ -176,6 +180,122 @@ def init_keyboard_listener():
     return listener, events
 
 
+class AsyncSuccessDetector:
+    """Runs a success classifier on live observations in a background thread and requests an early exit.
+
+    Every `every_n_steps` control steps, the current observation is handed to `classifier` on a long-lived
+    worker thread (a step is skipped if the previous classification is still running, so the control loop
+    never blocks). `classifier` returns the probability that the subtask is done; once it reaches `threshold`
+    on `patience` consecutive classifications, `events["exit_early"]` is set and `record_loop` stops at its
+    next step. Call `close()` to stop the worker once the detector isn't needed anymore.
+
+    Args:
+        classifier: Callable taking an observation dict (as returned by `robot.get_observation()`) and
+            returning a success probability in [0, 1].
+        every_n_steps: Classify one observation every `every_n_steps` control steps.
+        threshold: Success probability needed for a classification to count as confident.
+        patience: Number of consecutive confident classifications needed before exiting.
+        min_steps: Never request an exit before this many control steps, e.g. to skip the start of a subtask
+            where the previous subtask's end state is still visible.
+    """
+
+    def __init__(
+        self,
+        classifier: Callable[[dict[str, Any]], float],
+        every_n_steps: int = 10,
+        threshold: float = 0.9,
+        patience: int = 2,
+        min_steps: int = 0,
+    ):
+        if every_n_steps < 1 or patience < 1:
+            raise ValueError("`every_n_steps` and `patience` must be at least 1.")
+        self.classifier = classifier
+        self.every_n_steps = every_n_steps
+        self.threshold = threshold
+        self.patience = patience
+        self.min_steps = min_steps
+
+        self._lock = threading.Lock()
+        # Signals a new job to the worker, and the end of a job to `wait()`
+        self._cond = threading.Condition(self._lock)
+        self._job: tuple | None = None
+        self._busy = False
+        self._closed = False
+        self._worker: threading.Thread | None = None
+        self._generation = 0
+        self.reset()
+
+    def reset(self):
+        """Start a new subtask. A classification still running from the previous one is discarded."""
+        with self._lock:
+            self._generation += 1
+            self.step = 0
+            self.consecutive = 0
+            self.last_probability: float | None = None
+            self.triggered = False
+
+    def __call__(self, observation: dict[str, Any], events: dict) -> None:
+        """Called once per control step with the latest observation. Never blocks."""
+        step = self.step
+        self.step += 1
+        if self.triggered or step % self.every_n_steps != 0:
+            return
+
+        with self._cond:
+            if self._busy or self._closed:
+                return
+            self._busy = True
+            self._job = (copy(observation), events, step, self._generation)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._work, name="success_detector", daemon=True)
+                self._worker.start()
+            self._cond.notify_all()
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._job is not None or self._closed)
+                if self._closed:
+                    return
+                job, self._job = self._job, None
+            self._classify(*job)
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+    def _classify(self, observation: dict[str, Any], events: dict, step: int, generation: int) -> None:
+        try:
+            probability = float(self.classifier(observation))
+        except Exception as e:
+            logging.warning(f"Success classifier failed: {e}")
+            return
+
+        with self._lock:
+            if generation != self._generation:
+                return
+            self.last_probability = probability
+            self.consecutive = self.consecutive + 1 if probability >= self.threshold else 0
+            if self.consecutive >= self.patience and step >= self.min_steps and not self.triggered:
+                logging.info(
+                    f"Subtask classified as done at step {step} (p={probability:.3f}), exiting early."
+                )
+                self.triggered = True
+                events["exit_early"] = True
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Wait for the classification in flight, if any (mostly useful for tests)."""
+        with self._cond:
+            self._cond.wait_for(lambda: not self._busy, timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Stops the worker, after the classification in flight if any."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._worker is not None:
+            self._worker.join(timeout)
+
+
 def sanity_check_dataset_name(repo_id, policy_cfg):
     _, dataset_name = repo_id.split("/")
     # either repo_id doesnt start with "eval_" and there is no policy
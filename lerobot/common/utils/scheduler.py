@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import math
+import os
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from lerobot.common.utils.robot_utils import busy_wait
+
+# Upper edges of the jitter histogram bins, in milliseconds
+JITTER_BINS_MS = (0.1, 0.5, 1.0, 2.0, 5.0, 10.0)
+
+
+@dataclass
+class SchedulerConfig:
+    # Real-time priority (1-99, SCHED_FIFO) of the control loop thread, on Linux. Requires CAP_SYS_NICE or
+    # an rtprio limit (see `ulimit -r`), otherwise a warning is logged and the loop runs with its default
+    # priority.
+    realtime_priority: int | None = None
+    # CPUs to pin the control loop thread to, on Linux (e.g. `[3]`, a core isolated with `isolcpus`).
+    cpu_affinity: list[int] | None = None
+
+    def __post_init__(self):
+        if self.realtime_priority is not None and not 1 <= self.realtime_priority <= 99:
+            raise ValueError(f"`realtime_priority` must be between 1 and 99, got {self.realtime_priority}.")
+
+
+def summarize_durations(values: list[float]) -> dict[str, float]:
+    """Median, 95th percentile and maximum of durations in seconds, in milliseconds."""
+    values_ms = np.array(values) * 1e3
+    return {
+        "p50_ms": float(np.percentile(values_ms, 50)),
+        "p95_ms": float(np.percentile(values_ms, 95)),
+        "max_ms": float(values_ms.max()),
+    }
+
+
+def format_summary(name: str, summary: dict[str, float]) -> str:
+    return (
+        f"  {name:<10} p50 {summary['p50_ms']:7.2f}ms  p95 {summary['p95_ms']:7.2f}ms  "
+        f"max {summary['max_ms']:7.2f}ms"
+    )
+
+
+class SchedulerStats:
+    """Timing of the ticks of a `PeriodicScheduler`, all in seconds."""
+
+    def __init__(self, fps: int):
+        self.fps = fps
+        # Wake-up time minus deadline, for each tick after the first one
+        self.jitter: list[float] = []
+        # End of the work of a tick minus the deadline of the next one, for each tick (0 when on time)
+        self.overrun: list[float] = []
+        # Deadlines skipped because the work of a tick ended after them
+        self.missed_deadlines = 0
+        self.num_ticks = 0
+        self.elapsed_s = 0.0
+
+    def report(self) -> dict[str, Any]:
+        report = {
+            "num_ticks": self.num_ticks,
+            "fps": (self.num_ticks - 1) / self.elapsed_s if self.elapsed_s > 0 else float("nan"),
+            "missed_deadlines": self.missed_deadlines,
+            "overruns": sum(overrun > 0 for overrun in self.overrun),
+        }
+        if self.jitter:
+            report["jitter"] = summarize_durations(self.jitter)
+            counts, _ = np.histogram(np.array(self.jitter) * 1e3, bins=[0, *JITTER_BINS_MS, np.inf])
+            labels = [f"<{edge:g}ms" for edge in JITTER_BINS_MS] + [f">={JITTER_BINS_MS[-1]:g}ms"]
+            report["jitter_histogram"] = dict(zip(labels, counts.tolist(), strict=True))
+        if self.overrun:
+            report["overrun"] = summarize_durations(self.overrun)
+        return report
+
+    def format(self) -> str:
+        report = self.report()
+        lines = [
+            f"{report['num_ticks']} ticks at {report['fps']:.1f}/{self.fps} fps, "
+            f"{report['missed_deadlines']} missed deadlines, {report['overruns']} overruns"
+        ]
+        for name in ["jitter", "overrun"]:
+            if name in report:
+                lines.append(format_summary(name, report[name]))
+        if "jitter_histogram" in report:
+            histogram = "  ".join(f"{label}: {count}" for label, count in report["jitter_histogram"].items())
+            lines.append(f"  jitter     {histogram}")
+        return "\n".join(lines)
+
+
+class PeriodicScheduler:
+    """
+    Paces a control loop at `fps` on absolute deadlines `start + index / fps`: unlike sleeping `1 / fps` minus
+    the duration of the loop body, the timing error of a tick doesn't carry over to the next ones.
+
+    A tick starts when the scheduler is entered, and `wait()` sleeps until the deadline of the next one. When
+    the work of a tick runs past one or more deadlines, these ticks are skipped (`missed_deadlines`) and the
+    loop resumes at the latest deadline, instead of running the missed ticks back to back.
+
+    ```python
+    with PeriodicScheduler(fps=30) as scheduler:
+        while scheduler.timestamp < duration_s:
+            ...  # one step of the loop
+            scheduler.wait()
+    logging.info(scheduler.stats.format())
+    ```
+
+    On Linux, the thread entering the scheduler can be given a real-time priority and pinned to CPUs for the
+    duration of the loop (`SchedulerConfig`). Its previous settings are restored on exit.
+    """
+
+    def __init__(self, fps: int, config: SchedulerConfig | None = None):
+        self.fps = fps
+        self.period = 1 / fps
+        self.config = config if config is not None else SchedulerConfig()
+        self.stats = SchedulerStats(fps)
+        self.index = 0
+        self.start_t: float | None = None
+        self._restore_priority = None
+        self._restore_affinity = None
+
+    @property
+    def deadline(self) -> float:
+        """`time.perf_counter()` time at which the current tick was scheduled."""
+        return self.start_t + self.index * self.period
+
+    @property
+    def timestamp(self) -> float:
+        """Time of the current tick relative to the start of the loop."""
+        return self.index / self.fps
+
+    def start(self) -> None:
+        self._apply_config()
+        self.start_t = time.perf_counter()
+        self.index = 0
+        self.stats.num_ticks = 1
+
+    def wait(self) -> int:
+        """Ends the current tick, sleeps until the deadline of the next one and returns its index."""
+        now = time.perf_counter()
+        next_deadline = self.deadline + self.period
+        self.stats.overrun.append(max(now - next_deadline, 0.0))
+        # The latest deadline which has passed, or the next one
+        index = max(self.index + 1, math.floor((now - self.start_t) / self.period))
+        self.stats.missed_deadlines += index - self.index - 1
+        self.index = index
+
+        busy_wait(self.deadline - time.perf_counter())
+        wake_t = time.perf_counter()
+        self.stats.jitter.append(max(wake_t - self.deadline, 0.0))
+        self.stats.num_ticks += 1
+        self.stats.elapsed_s = wake_t - self.start_t
+        return self.index
+
+    def stop(self) -> None:
+        self._restore_config()
+
+    def __enter__(self) -> "PeriodicScheduler":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
+
+    def _apply_config(self) -> None:
+        if self.config.cpu_affinity is not None:
+            if hasattr(os, "sched_setaffinity"):
+                try:
+                    affinity = os.sched_getaffinity(0)
+                    os.sched_setaffinity(0, self.config.cpu_affinity)
+                    self._restore_affinity = affinity
+                except OSError as e:
+                    logging.warning(f"Couldn't pin the control loop to CPUs {self.config.cpu_affinity}: {e}")
+            else:
+                logging.warning("CPU affinity is only supported on Linux, ignoring `cpu_affinity`.")
+
+        if self.config.realtime_priority is not None:
+            if hasattr(os, "sched_setscheduler"):
+                try:
+                    policy, param = os.sched_getscheduler(0), os.sched_getparam(0)
+                    os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self.config.realtime_priority))
+                    self._restore_priority = (policy, param)
+                except OSError as e:
+                    logging.warning(
+                        f"Couldn't set the real-time priority of the control loop to "
+                        f"{self.config.realtime_priority} (missing CAP_SYS_NICE or rtprio limit?): {e}"
+                    )
+            else:
+                logging.warning("Real-time priority is only supported on Linux, ignoring it.")
+
+    def _restore_config(self) -> None:
+        if self._restore_priority is not None:
+            os.sched_setscheduler(0, *self._restore_priority)
+            self._restore_priority = None
+        if self._restore_affinity is not None:
+            os.sched_setaffinity(0, self._restore_affinity)
+            self._restore_affinity = None
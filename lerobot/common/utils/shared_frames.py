@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Shared-memory ring buffer of camera frames.
+
+The process owning a camera publishes every frame it reads with a `SharedFrameWriter`; any number of other
+processes (e.g. a YOLO verifier, a viewer) attach a `SharedFrameReader` to the same name and read the latest
+frames without opening the device.
+
+Layout of the shared memory block:
+- header: magic, height, width, channels, number of slots, color order, sequence number of the latest frame,
+- per slot: the sequence number written before and after the frame (a seqlock) and its capture timestamp,
+- the frames themselves.
+
+Frames returned with `copy=False` are views into the ring: they stay valid until the writer laps the ring
+(`num_slots - 1` more frames), so copy them if they are kept around.
+
+Only numpy and the standard library are used so that processes without LeRobot's dependencies can read frames.
+"""
+
+import contextlib
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+MAGIC = 0x4C524652414D4553  # "LRFRAMES"
+HEADER_FIELDS = 8
+SLOT_FIELDS = 4
+ALIGN = 64
+
+# Header field indices
+_MAGIC, _HEIGHT, _WIDTH, _CHANNELS, _NUM_SLOTS, _COLOR, _LATEST = range(7)
+# Slot field indices
+_SEQ_BEGIN, _SEQ_END, _TIMESTAMP_NS = range(3)
+
+COLOR_ORDERS = ("rgb", "bgr")
+
+# Blocks written by this process, tracked by its resource tracker until the writer unlinks them
+_written_names: set[str] = set()
+
+
+def _align(n: int) -> int:
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+def _layout(num_slots: int) -> tuple[int, int]:
+    """Returns the byte offsets of the slot metadata and of the first frame."""
+    meta_offset = _align(HEADER_FIELDS * 8)
+    frames_offset = meta_offset + _align(num_slots * SLOT_FIELDS * 8)
+    return meta_offset, frames_offset
+
+
+class _SharedFrames:
+    def _map(self, num_slots: int, shape: tuple[int, int, int]):
+        buf = self.shm.buf
+        meta_offset, frames_offset = _layout(num_slots)
+        self._header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=buf)
+        self._slots = np.ndarray((num_slots, SLOT_FIELDS), dtype=np.int64, buffer=buf, offset=meta_offset)
+        self._frames = np.ndarray((num_slots, *shape), dtype=np.uint8, buffer=buf, offset=frames_offset)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return tuple(int(x) for x in self._header[_HEIGHT : _CHANNELS + 1])
+
+    @property
+    def num_slots(self) -> int:
+        return int(self._header[_NUM_SLOTS])
+
+    @property
+    def color_order(self) -> str:
+        return COLOR_ORDERS[int(self._header[_COLOR])]
+
+    @property
+    def latest_seq(self) -> int:
+        """Sequence number of the last published frame (0 if none was published yet)."""
+        return int(self._header[_LATEST])
+
+    def _release(self):
+        # Drop the numpy views first: the memory can't be unmapped while they are alive.
+        self._header = self._slots = self._frames = None
+        # Frames read with `copy=False` may still be referenced; the mapping is then freed along with them.
+        with contextlib.suppress(BufferError):
+            self.shm.close()
+
+
+class SharedFrameWriter(_SharedFrames):
+    """Publishes frames of a fixed shape to the shared memory block `name`, replacing any stale block."""
+
+    def __init__(self, name: str, shape: tuple[int, int, int], num_slots: int = 8, color_order: str = "rgb"):
+        if color_order not in COLOR_ORDERS:
+            raise ValueError(f"`color_order` must be one of {COLOR_ORDERS}, got '{color_order}'.")
+        _, frames_offset = _layout(num_slots)
+        size = frames_offset + num_slots * int(np.prod(shape))
+        try:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Left behind by a process that crashed before unlinking it.
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+
+        _written_names.add(self.shm.name)
+        self._map(num_slots, shape)
+        self._slots[:] = 0
+        self._header[:] = [MAGIC, *shape, num_slots, COLOR_ORDERS.index(color_order), 0, 0]
+
+    def write(self, frame: np.ndarray) -> int:
+        """Copies `frame` into the next slot and returns its sequence number."""
+        if frame.shape != self._frames.shape[1:]:
+            raise ValueError(
+                f"Frame shape {frame.shape} doesn't match the shared buffer {self._frames.shape[1:]}."
+            )
+        seq = self.latest_seq + 1
+        slot = self._slots[seq % self.num_slots]
+        slot[_SEQ_BEGIN] = seq
+        self._frames[seq % self.num_slots] = frame
+        slot[_TIMESTAMP_NS] = time.time_ns()
+        slot[_SEQ_END] = seq
+        self._header[_LATEST] = seq
+        return seq
+
+    def close(self):
+        """Closes and removes the block. Attached readers keep their mapping until they close."""
+        self._release()
+        self.shm.unlink()
+        _written_names.discard(self.shm.name)
+
+
+class SharedFrameReader(_SharedFrames):
+    """Reads the frames published under `name`. Raises FileNotFoundError if nothing publishes there."""
+
+    def __init__(self, name: str):
+        self.shm = shared_memory.SharedMemory(name=name)
+        # Before Python 3.13, attaching registers the block with this process' resource tracker, which would
+        # unlink it when this process exits, under the writer's feet.
+        if self.shm.name not in _written_names:
+            resource_tracker.unregister(self.shm._name, "shared_memory")
+
+        header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=self.shm.buf)
+        is_frame_buffer = header[_MAGIC] == MAGIC
+        shape = tuple(int(x) for x in header[_HEIGHT : _CHANNELS + 1])
+        num_slots = int(header[_NUM_SLOTS])
+        del header
+        if not is_frame_buffer:
+            self.shm.close()
+            raise ValueError(f"Shared memory block '{name}' is not a frame buffer.")
+        self._map(num_slots, shape)
+
+    def read_latest(self, copy: bool = True) -> tuple[np.ndarray, int, float] | None:
+        """Returns (frame, sequence number, timestamp in s) of the latest frame, or None if there is none."""
+        while True:
+            seq = self.latest_seq
+            if seq == 0:
+                return None
+            slot = self._slots[seq % self.num_slots]
+            if slot[_SEQ_BEGIN] != seq or slot[_SEQ_END] != seq:
+                # The writer lapped the ring since `seq` was read, try again with the new latest frame.
+                continue
+            frame = self._frames[seq % self.num_slots]
+            timestamp_s = int(slot[_TIMESTAMP_NS]) / 1e9
+            if copy:
+                frame = frame.copy()
+                if slot[_SEQ_BEGIN] != seq:
+                    continue
+            return frame, seq, timestamp_s
+
+    def wait_for_frame(
+        self, after_seq: int = 0, timeout_s: float = 1.0, copy: bool = True, poll_s: float = 0.001
+    ) -> tuple[np.ndarray, int, float]:
+        """Returns the latest frame once its sequence number is greater than `after_seq`."""
+        deadline = time.perf_counter() + timeout_s
+        while self.latest_seq <= after_seq:
+            if time.perf_counter() > deadline:
+                raise TimeoutError(f"No new frame published to '{self.name}' within {timeout_s}s.")
+            time.sleep(poll_s)
+        return self.read_latest(copy=copy)
+
+    def close(self):
+        self._release()
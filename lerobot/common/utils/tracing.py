@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Lightweight span tracing to a JSONL file.
+
+Tracing is off unless `enable_tracing(path)` is called or the `LEROBOT_TRACE_FILE` environment variable is set,
+in which case every process (including subprocesses inheriting the environment) appends to the same file. Each
+line is one Chrome trace "complete" event:
+
+    {"name": "predict_action", "cat": "policy", "ph": "X", "ts": 1712.0, "dur": 8.1, "pid": 42, "tid": 1, "args": {}}
+
+with `ts` and `dur` in microseconds (wall clock, so events from several processes line up). Use
+`lerobot/scripts/trace_report.py` to get p50/p95 statistics or to convert the file for chrome://tracing / Perfetto.
+
+Only the standard library is used so that this module can be imported from lightweight scripts.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+
+TRACE_FILE_ENV = "LEROBOT_TRACE_FILE"
+
+
+class Tracer:
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path is not None else None
+        self._file = None
+        self._lock = threading.Lock()
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Line-buffered append: each event is written with a single `write` call so that several processes
+            # can share the file.
+            self._file = open(self.path, "a", buffering=1)  # noqa: SIM115
+
+    @property
+    def enabled(self) -> bool:
+        return self._file is not None
+
+    def emit(self, name: str, cat: str, ts_us: float, dur_us: float, args: dict | None = None) -> None:
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": ts_us,
+            "dur": dur_us,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args or {},
+        }
+        line = json.dumps(event, default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+
+    @contextmanager
+    def span(self, name: str, cat: str = "", **args):
+        """Times the enclosed block. Extra information can be added to `args` from inside the block."""
+        if not self.enabled:
+            yield args
+            return
+        ts_us = time.time_ns() / 1e3
+        start = time.perf_counter()
+        try:
+            yield args
+        finally:
+            self.emit(name, cat, ts_us, (time.perf_counter() - start) * 1e6, args)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+_tracer: Tracer | None = None
+
+
+def get_tracer() -> Tracer:
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(os.environ.get(TRACE_FILE_ENV))
+    return _tracer
+
+
+def enable_tracing(path: str | Path) -> Tracer:
+    """Trace this process and, through `LEROBOT_TRACE_FILE`, the subprocesses it starts to `path`."""
+    global _tracer
+    if _tracer is not None:
+        _tracer.close()
+    os.environ[TRACE_FILE_ENV] = str(path)
+    _tracer = Tracer(path)
+    return _tracer
+
+
+def span(name: str, cat: str = "", **args):
+    """`with span("get_observation", "robot"): ...` on the process-wide tracer."""
+    return get_tracer().span(name, cat, **args)
+
+
+def traced(name: str | None = None, cat: str = ""):
+    """Decorator version of `span`, named after the function by default."""
+
+    def decorator(fn):
+        span_name = name or fn.__name__
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with get_tracer().span(span_name, cat):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def load_trace(path: str | Path) -> list[dict]:
+    """Reads a JSONL trace file (incomplete trailing lines from a killed process are skipped)."""
+    events = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return events
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Linear-interpolated percentile, `q` in [0, 100]."""
+    if not values:
+        return float("nan")
+    values = sorted(values)
+    pos = (len(values) - 1) * q / 100
+    low = int(pos)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (pos - low)
+
+
+def summarize_durations(durations_s: list[float]) -> dict:
+    return {
+        "count": len(durations_s),
+        "total_s": sum(durations_s),
+        "mean_s": sum(durations_s) / len(durations_s) if durations_s else float("nan"),
+        "p50_s": percentile(durations_s, 50),
+        "p95_s": percentile(durations_s, 95),
+        "max_s": max(durations_s) if durations_s else float("nan"),
+    }
+
+
+def summarize_spans(events: list[dict], key: str = "name") -> dict[tuple[str, str], dict]:
+    """Duration statistics grouped by (category, `key`), `key` being "name" or an `args` entry."""
+    groups: dict[tuple[str, str], list[float]] = {}
+    for event in events:
+        if event.get("ph") != "X":
+            continue
+        value = event.get(key) if key == "name" else event.get("args", {}).get(key)
+        if value is None:
+            continue
+        groups.setdefault((event.get("cat", ""), str(value)), []).append(event["dur"] / 1e6)
+    return {group: summarize_durations(durations) for group, durations in sorted(groups.items())}
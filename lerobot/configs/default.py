@@ -37,6 +37,12 @@ class DatasetConfig:
     revision: str | None = None
     use_imagenet_stats: bool = True
     video_backend: str = field(default_factory=get_safe_default_codec)
+    # Decode the videos once into a memory-mapped frame store on local disk instead of decoding them at
+    # every epoch, optionally downscaled to (height, width). Best suited to small datasets.
+    frame_store: bool = False
+    frame_store_resolution: tuple[int, int] | None = None
+    # Load the numeric columns (state, action, timestamp...) once into tensors in shared memory.
+    tensor_cache: bool = False
 
 
 @dataclass
@@ -36,10 +36,10 @@ python -m lerobot.record \
 """
 
 import logging
-import time
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from pprint import pformat
+from typing import Callable
 
 import numpy as np
 import rerun as rr
@@ -49,9 +49,13 @@ from lerobot.common.cameras import (  # noqa: F401
 )
 from lerobot.common.cameras.opencv.configuration_opencv import OpenCVCameraConfig  # noqa: F401
 from lerobot.common.cameras.realsense.configuration_realsense import RealSenseCameraConfig  # noqa: F401
+from lerobot.common.cameras.shared_memory.configuration_shared_memory import (  # noqa: F401
+    SharedMemoryCameraConfig,
+)
 from lerobot.common.datasets.image_writer import safe_stop_image_writer
 from lerobot.common.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.common.datasets.utils import build_dataset_frame, hw_to_dataset_features
+from lerobot.common.datasets.video_utils import VIDEO_ENCODING_PRESETS, get_video_encoding_config
 from lerobot.common.policies.factory import make_policy
 from lerobot.common.policies.pretrained import PreTrainedPolicy
 from lerobot.common.robots import (  # noqa: F401
@@ -67,14 +71,17 @@ from lerobot.common.teleoperators import (  # noqa: F401
     TeleoperatorConfig,
     make_teleoperator_from_config,
 )
+from lerobot.common.utils.control_pipeline import PipelinedControlLoop, PipelineStats, Tick
 from lerobot.common.utils.control_utils import (
+    AsyncSuccessDetector,
     init_keyboard_listener,
     is_headless,
     predict_action,
     sanity_check_dataset_name,
     sanity_check_dataset_robot_compatibility,
 )
-from lerobot.common.utils.robot_utils import busy_wait
+from lerobot.common.utils.scheduler import PeriodicScheduler, SchedulerConfig, SchedulerStats
+from lerobot.common.utils.tracing import span
 from lerobot.common.utils.utils import (
     get_safe_torch_device,
     init_logging,
@@ -120,10 +127,26 @@ class DatasetRecordConfig:
     # Too many threads might cause unstable teleoperation fps due to main thread being blocked.
     # Not enough threads might cause low camera fps.
     num_image_writer_threads_per_camera: int = 4
+    # Encode camera frames into the episode videos while recording, instead of writing them as PNG images
+    # and encoding them when the episode is saved. Removes the encoding pause between episodes.
+    streaming_encoding: bool = False
+    # Save each episode in the background as soon as its recording ends, so that writing and encoding it
+    # overlaps with the reset period. Re-recording is then only possible during the episode itself.
+    async_save: bool = False
+    # Video encoder settings: "svtav1" (default, smallest videos), "svtav1-fast", "x264-ultrafast" (fastest on
+    # CPU, larger videos) or "nvenc-h264" (NVIDIA GPU). See `VIDEO_ENCODING_PRESETS`.
+    video_encoding_preset: str = "svtav1"
+    # Number of encoding threads per camera. By default, each encoder uses all the cores.
+    video_encoding_threads: int | None = None
 
     def __post_init__(self):
         if self.single_task is None:
             raise ValueError("You need to provide a task as argument in `single_task`.")
+        if self.video_encoding_preset not in VIDEO_ENCODING_PRESETS:
+            raise ValueError(
+                f"Unknown `video_encoding_preset`: {self.video_encoding_preset}. "
+                f"Available presets: {', '.join(VIDEO_ENCODING_PRESETS)}."
+            )
 
 
 @dataclass
@@ -140,6 +163,11 @@ class RecordConfig:
     play_sounds: bool = True
     # Resume recording on an existing dataset.
     resume: bool = False
+    # Observe the robot, run the policy, send actions and write the dataset/display in concurrent threads, so
+    # that a slow policy, image writing or display doesn't lower the observation rate.
+    pipelined: bool = False
+    # Real-time priority and CPU affinity of the control loop
+    scheduler: SchedulerConfig = field(default_factory=SchedulerConfig)
 
     def __post_init__(self):
         # HACK: We parse again the cli args here to get the pretrained path if there was one.
@@ -169,7 +197,11 @@ def record_loop(
     control_time_s: int | None = None,
     single_task: str | None = None,
     display_data: bool = False,
-):
+    success_detector: AsyncSuccessDetector | None = None,
+    on_observation: Callable[[dict], None] | None = None,
+    pipelined: bool = False,
+    scheduler_config: SchedulerConfig | None = None,
+) -> SchedulerStats | PipelineStats:
     if dataset is not None and dataset.fps != fps:
         raise ValueError(f"The dataset fps should be equal to requested fps ({dataset.fps} != {fps}).")
 
@@ -177,63 +209,196 @@ def record_loop(
     if policy is not None:
         policy.reset()
 
-    timestamp = 0
-    start_episode_t = time.perf_counter()
-    while timestamp < control_time_s:
-        start_loop_t = time.perf_counter()
+    if success_detector is not None:
+        success_detector.reset()
 
-        if events["exit_early"]:
-            events["exit_early"] = False
-            break
+    # Without a dataset, the policy inputs are still built from the robot's own features
+    if dataset is not None:
+        ds_features = dataset.features
+    else:
+        ds_features = hw_to_dataset_features(robot.observation_features, "observation")
 
-        observation = robot.get_observation()
+    # Without a policy nor a teleoperator there is no action to pipeline: the sequential loop only waits
+    if pipelined and (policy is not None or teleop is not None):
+        return _pipelined_record_loop(
+            robot=robot,
+            events=events,
+            fps=fps,
+            ds_features=ds_features,
+            dataset=dataset,
+            teleop=teleop,
+            policy=policy,
+            control_time_s=control_time_s,
+            single_task=single_task,
+            display_data=display_data,
+            success_detector=success_detector,
+            on_observation=on_observation,
+            scheduler_config=scheduler_config,
+        )
 
+    with (
+        span("record_loop", "episode", fps=fps, task=single_task) as episode_args,
+        PeriodicScheduler(fps, scheduler_config) as scheduler,
+    ):
+        num_frames = 0
+        while scheduler.timestamp < control_time_s:
+            if events["exit_early"]:
+                events["exit_early"] = False
+                episode_args["exit_early"] = True
+                break
+
+            with span("get_observation", "robot"):
+                observation = robot.get_observation()
+
+            # Classifies the observation in the background and sets `events["exit_early"]` once the subtask is done
+            if success_detector is not None:
+                success_detector(observation, events)
+
+            if on_observation is not None:
+                on_observation(observation)
+
+            if policy is not None or dataset is not None:
+                observation_frame = build_dataset_frame(ds_features, observation, prefix="observation")
+
+            if policy is not None:
+                action_values = predict_action(
+                    observation_frame,
+                    policy,
+                    get_safe_torch_device(policy.config.device),
+                    policy.config.use_amp,
+                    task=single_task,
+                    robot_type=robot.robot_type,
+                )
+                action = {key: action_values[i].item() for i, key in enumerate(robot.action_features)}
+            elif policy is None and teleop is not None:
+                with span("get_action", "teleop"):
+                    action = teleop.get_action()
+            else:
+                logging.info(
+                    "No policy or teleoperator provided, skipping action generation."
+                    "This is likely to happen when resetting the environment without a teleop device."
+                    "The robot won't be at its rest position at the start of the next episode."
+                )
+                scheduler.wait()
+                continue
+
+            # Action can eventually be clipped using `max_relative_target`,
+            # so action actually sent is saved in the dataset.
+            with span("send_action", "robot"):
+                sent_action = robot.send_action(action)
+
+            if dataset is not None:
+                with span("add_frame", "dataset"):
+                    action_frame = build_dataset_frame(ds_features, sent_action, prefix="action")
+                    frame = {**observation_frame, **action_frame}
+                    dataset.add_frame(frame, task=single_task)
+
+            if display_data:
+                with span("display", "viz"):
+                    for obs, val in observation.items():
+                        if isinstance(val, float):
+                            rr.log(f"observation.{obs}", rr.Scalar(val))
+                        elif isinstance(val, np.ndarray):
+                            rr.log(f"observation.{obs}", rr.Image(val), static=True)
+                    for act, val in action.items():
+                        if isinstance(val, float):
+                            rr.log(f"action.{act}", rr.Scalar(val))
+
+            num_frames += 1
+            scheduler.wait()
+        episode_args["num_frames"] = num_frames
+        episode_args["missed_deadlines"] = scheduler.stats.missed_deadlines
+    logging.info(f"Record loop:\n{scheduler.stats.format()}")
+    return scheduler.stats
+
+
+def _pipelined_record_loop(
+    robot: Robot,
+    events: dict,
+    fps: int,
+    ds_features: dict,
+    dataset: LeRobotDataset | None,
+    teleop: Teleoperator | None,
+    policy: PreTrainedPolicy | None,
+    control_time_s: int | float,
+    single_task: str | None,
+    display_data: bool,
+    success_detector: AsyncSuccessDetector | None,
+    on_observation: Callable[[dict], None] | None,
+    scheduler_config: SchedulerConfig | None,
+) -> PipelineStats:
+    """
+    Same steps as the sequential `record_loop`, run as the stages of a `PipelinedControlLoop`: the robot is
+    observed at a steady `fps` while the policy, the dataset and the display keep up in their own threads.
+    """
+
+    def sense(index: int) -> tuple[dict, dict]:
+        with span("get_observation", "robot"):
+            observation = robot.get_observation()
+        if success_detector is not None:
+            success_detector(observation, events)
+        if on_observation is not None:
+            on_observation(observation)
+        data = {}
         if policy is not None or dataset is not None:
-            observation_frame = build_dataset_frame(dataset.features, observation, prefix="observation")
-
-        if policy is not None:
-            action_values = predict_action(
-                observation_frame,
-                policy,
-                get_safe_torch_device(policy.config.device),
-                policy.config.use_amp,
-                task=single_task,
-                robot_type=robot.robot_type,
-            )
-            action = {key: action_values[i].item() for i, key in enumerate(robot.action_features)}
-        elif policy is None and teleop is not None:
-            action = teleop.get_action()
-        else:
-            logging.info(
-                "No policy or teleoperator provided, skipping action generation."
-                "This is likely to happen when resetting the environment without a teleop device."
-                "The robot won't be at its rest position at the start of the next episode."
-            )
-            continue
+            data["observation_frame"] = build_dataset_frame(ds_features, observation, prefix="observation")
+        if policy is None:
+            with span("get_action", "teleop"):
+                data["action"] = teleop.get_action()
+        return observation, data
+
+    def decide(tick: Tick) -> dict:
+        action_values = predict_action(
+            tick.data["observation_frame"],
+            policy,
+            get_safe_torch_device(policy.config.device),
+            policy.config.use_amp,
+            task=single_task,
+            robot_type=robot.robot_type,
+        )
+        return {key: action_values[i].item() for i, key in enumerate(robot.action_features)}
 
-        # Action can eventually be clipped using `max_relative_target`,
-        # so action actually sent is saved in the dataset.
-        sent_action = robot.send_action(action)
+    def act(tick: Tick, action: dict) -> dict:
+        with span("send_action", "robot"):
+            return robot.send_action(action)
 
-        if dataset is not None:
-            action_frame = build_dataset_frame(dataset.features, sent_action, prefix="action")
-            frame = {**observation_frame, **action_frame}
-            dataset.add_frame(frame, task=single_task)
+    def record(tick: Tick, sent_action: dict) -> None:
+        with span("add_frame", "dataset"):
+            action_frame = build_dataset_frame(ds_features, sent_action, prefix="action")
+            dataset.add_frame({**tick.data["observation_frame"], **action_frame}, task=single_task)
 
-        if display_data:
-            for obs, val in observation.items():
+    def display(tick: Tick, sent_action: dict) -> None:
+        with span("display", "viz"):
+            for obs, val in tick.observation.items():
                 if isinstance(val, float):
                     rr.log(f"observation.{obs}", rr.Scalar(val))
                 elif isinstance(val, np.ndarray):
                     rr.log(f"observation.{obs}", rr.Image(val), static=True)
-            for act, val in action.items():
+            for act, val in sent_action.items():
                 if isinstance(val, float):
                     rr.log(f"action.{act}", rr.Scalar(val))
 
-        dt_s = time.perf_counter() - start_loop_t
-        busy_wait(1 / fps - dt_s)
-
-        timestamp = time.perf_counter() - start_episode_t
+    def should_stop() -> bool:
+        if events["exit_early"]:
+            events["exit_early"] = False
+            return True
+        return False
+
+    loop = PipelinedControlLoop(
+        fps,
+        sense,
+        act,
+        decide=decide if policy is not None else None,
+        record=record if dataset is not None else None,
+        display=display if display_data else None,
+        should_stop=should_stop,
+        scheduler_config=scheduler_config,
+    )
+    with span("record_loop", "episode", fps=fps, task=single_task, pipelined=True) as episode_args:
+        stats = loop.run(control_time_s)
+        episode_args["num_frames"] = stats.num_ticks
+    logging.info(f"Pipelined record loop:\n{stats.format()}")
+    return stats
 
 
 @parser.wrap()
@@ -249,12 +414,19 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
     action_features = hw_to_dataset_features(robot.action_features, "action", cfg.dataset.video)
     obs_features = hw_to_dataset_features(robot.observation_features, "observation", cfg.dataset.video)
     dataset_features = {**action_features, **obs_features}
+    video_encoding = get_video_encoding_config(
+        cfg.dataset.video_encoding_preset, cfg.dataset.video_encoding_threads
+    )
 
     if cfg.resume:
         dataset = LeRobotDataset(
             cfg.dataset.repo_id,
             root=cfg.dataset.root,
         )
+        dataset.streaming_encoding = cfg.dataset.streaming_encoding
+        dataset.video_encoding = video_encoding
+        if cfg.dataset.async_save:
+            dataset.start_episode_saver()
 
         if hasattr(robot, "cameras") and len(robot.cameras) > 0:
             dataset.start_image_writer(
@@ -274,6 +446,9 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
             use_videos=cfg.dataset.video,
             image_writer_processes=cfg.dataset.num_image_writer_processes,
             image_writer_threads=cfg.dataset.num_image_writer_threads_per_camera * len(robot.cameras),
+            streaming_encoding=cfg.dataset.streaming_encoding,
+            async_save=cfg.dataset.async_save,
+            video_encoding=video_encoding,
         )
 
     # Load pretrained policy
@@ -297,8 +472,14 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
             control_time_s=cfg.dataset.episode_time_s,
             single_task=cfg.dataset.single_task,
             display_data=cfg.display_data,
+            pipelined=cfg.pipelined,
+            scheduler_config=cfg.scheduler,
         )
 
+        saved_during_reset = cfg.dataset.async_save and not events["rerecord_episode"]
+        if saved_during_reset:
+            dataset.save_episode()
+
         # Execute a few seconds without recording to give time to manually reset the environment
         # Skip reset for the last episode to be recorded
         if not events["stop_recording"] and (
@@ -313,8 +494,14 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                 control_time_s=cfg.dataset.reset_time_s,
                 single_task=cfg.dataset.single_task,
                 display_data=cfg.display_data,
+                pipelined=cfg.pipelined,
+                scheduler_config=cfg.scheduler,
             )
 
+        if events["rerecord_episode"] and saved_during_reset:
+            logging.warning("With `async_save`, episodes can only be re-recorded during their recording.")
+            events["rerecord_episode"] = False
+
         if events["rerecord_episode"]:
             log_say("Re-record episode", cfg.play_sounds)
             events["rerecord_episode"] = False
@@ -322,12 +509,14 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
             dataset.clear_episode_buffer()
             continue
 
-        dataset.save_episode()
+        if not saved_during_reset:
+            dataset.save_episode()
 
         if events["stop_recording"]:
             break
 
     log_say("Stop recording", cfg.play_sounds, blocking=True)
+    dataset.stop_episode_saver()
 
     robot.disconnect()
     if teleop is not None:
@@ -28,8 +28,7 @@ python -m lerobot.replay \
 """
 
 import logging
-import time
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from pprint import pformat
 
@@ -44,7 +43,7 @@ from lerobot.common.robots import (  # noqa: F401
     so100_follower,
     so101_follower,
 )
-from lerobot.common.utils.robot_utils import busy_wait
+from lerobot.common.utils.scheduler import PeriodicScheduler, SchedulerConfig
 from lerobot.common.utils.utils import (
     init_logging,
     log_say,
@@ -69,6 +68,8 @@ class ReplayConfig:
     dataset: DatasetReplayConfig
     # Use vocal synthesis to read events.
     play_sounds: bool = True
+    # Real-time priority and CPU affinity of the control loop
+    scheduler: SchedulerConfig = field(default_factory=SchedulerConfig)
 
 
 @draccus.wrap()
@@ -82,18 +83,17 @@ def replay(cfg: ReplayConfig):
     robot.connect()
 
     log_say("Replaying episode", cfg.play_sounds, blocking=True)
-    for idx in range(dataset.num_frames):
-        start_episode_t = time.perf_counter()
-
-        action_array = actions[idx]["action"]
-        action = {}
-        for i, name in enumerate(dataset.features["action"]["names"]):
-            action[name] = action_array[i]
-
-        robot.send_action(action)
-
-        dt_s = time.perf_counter() - start_episode_t
-        busy_wait(1 / dataset.fps - dt_s)
+    with PeriodicScheduler(dataset.fps, cfg.scheduler) as scheduler:
+        # Frames are replayed at their recorded time: the frames of missed ticks are skipped
+        while (idx := scheduler.index) < dataset.num_frames:
+            action_array = actions[idx]["action"]
+            action = {}
+            for i, name in enumerate(dataset.features["action"]["names"]):
+                action[name] = action_array[i]
+
+            robot.send_action(action)
+            scheduler.wait()
+    logging.info(f"Replay loop:\n{scheduler.stats.format()}")
 
     robot.disconnect()
 
@@ -253,6 +253,7 @@ class RobotEnv(gym.Env):
 
         self._joint_names = [f"{key}.pos" for key in self.robot.bus.motors]
         self._image_keys = self.robot.cameras.keys()
+        self._last_robot_observation = None
 
         # Read initial joint positions using the bus
         self.current_joint_positions = self._get_observation()["agent_pos"]
@@ -264,11 +265,23 @@ class RobotEnv(gym.Env):
     def _get_observation(self) -> np.ndarray:
         """Helper to convert a dictionary from bus.sync_read to an ordered numpy array."""
         obs_dict = self.robot.get_observation()
+        self._last_robot_observation = obs_dict
         joint_positions = np.array([obs_dict[name] for name in self._joint_names], dtype=np.float32)
 
         images = {key: obs_dict[key] for key in self._image_keys}
         return {"agent_pos": joint_positions, "pixels": images}
 
+    def get_motor_values(self, suffix: str) -> np.ndarray | None:
+        """
+        Values of the `<motor>.<suffix>` features (e.g. "pos", "current") in the last observation, so that
+        wrappers don't read them from the robot again. Returns None if the robot doesn't observe them.
+        """
+        obs_dict = self._last_robot_observation
+        keys = [f"{motor}.{suffix}" for motor in self.robot.bus.motors]
+        if obs_dict is None or not all(key in obs_dict for key in keys):
+            return None
+        return np.array([obs_dict[key] for key in keys], dtype=np.float32)
+
     def _setup_spaces(self):
         """
         Dynamically configure the observation and action spaces based on the robot's capabilities.
@@ -520,7 +533,11 @@ class AddCurrentToObservation(gym.ObservationWrapper):
         Returns:
             The modified observation with current values.
         """
-        present_current_observation = self.unwrapped._get_observation()["agent_pos"]
+        present_current_observation = self.unwrapped.get_motor_values("current")
+        if present_current_observation is None:
+            # Not observed by the robot (see e.g. `SO101FollowerConfig.observe_current`), read on its own
+            present_current = self.unwrapped.robot.bus.sync_read("Present_Current")
+            present_current_observation = np.array(list(present_current.values()), dtype=np.float32)
         observation["agent_pos"] = np.concatenate(
             [observation["agent_pos"], present_current_observation], axis=-1
         )
@@ -1108,7 +1125,7 @@ class EEObservationWrapper(gym.ObservationWrapper):
         Returns:
             Enhanced observation with end-effector pose information.
         """
-        current_joint_pos = self.unwrapped._get_observation()["agent_pos"]
+        current_joint_pos = self.unwrapped.get_motor_values("pos")
 
         current_ee_pos = self.kinematics.forward_kinematics(current_joint_pos, frame="gripper_tip")[:3, 3]
         observation["agent_pos"] = np.concatenate([observation["agent_pos"], current_ee_pos], -1)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Summarize latency traces written with `lerobot.common.utils.tracing` (e.g. by `smf.py --trace`).
+
+Reports p50/p95 durations across all the runs found in the given files:
+- per run (full cycle time),
+- per state, and per state visit (1 = first attempt, 2 = first retry, ...) to see what retry loops cost,
+- per span (subprocess, verification, robot I/O, policy inference, ...),
+- subprocess overhead: time spent in a subprocess outside of its control loop (spawn, connect, checkpoint load).
+
+Examples:
+
+```
+python -m lerobot.scripts.trace_report outputs/traces/smf.jsonl
+python -m lerobot.scripts.trace_report outputs/traces/*.jsonl --chrome outputs/traces/smf_chrome.json
+```
+
+The `--chrome` file can be opened in chrome://tracing or https://ui.perfetto.dev.
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from lerobot.common.utils.tracing import load_trace, summarize_durations, summarize_spans
+
+
+def subprocess_overheads(events: list[dict]) -> dict[str, list[float]]:
+    """For each subprocess span, its duration minus the control loops (`record_loop`) that ran inside it."""
+    episodes = [e for e in events if e.get("cat") == "episode"]
+    overheads: dict[str, list[float]] = {}
+    for proc in events:
+        if proc.get("cat") != "subprocess":
+            continue
+        start, end = proc["ts"], proc["ts"] + proc["dur"]
+        inside_us = sum(
+            e["dur"]
+            for e in episodes
+            if e["pid"] != proc["pid"] and start <= e["ts"] and e["ts"] + e["dur"] <= end
+        )
+        overheads.setdefault(proc["name"], []).append(max(proc["dur"] - inside_us, 0.0) / 1e6)
+    return overheads
+
+
+def state_failures(events: list[dict]) -> dict[str, int]:
+    failures: dict[str, int] = {}
+    for e in events:
+        if e.get("cat") == "state" and e.get("args", {}).get("ok") is False:
+            failures[e["name"]] = failures.get(e["name"], 0) + 1
+    return failures
+
+
+def build_report(events: list[dict]) -> dict:
+    state_events = [e for e in events if e.get("cat") == "state"]
+    visit_events = [{**e, "name": f"{e['name']}#{e.get('args', {}).get('visit', 1)}"} for e in state_events]
+    other_events = [e for e in events if e.get("cat") not in ("run", "state")]
+    return {
+        "runs": summarize_durations([e["dur"] / 1e6 for e in events if e.get("cat") == "run"]),
+        "states": {name: stats for (_, name), stats in summarize_spans(state_events).items()},
+        "state_failures": state_failures(events),
+        "state_visits": {name: stats for (_, name), stats in summarize_spans(visit_events).items()},
+        "spans": {f"{cat}/{name}": stats for (cat, name), stats in summarize_spans(other_events).items()},
+        "subprocess_overhead": {
+            name: summarize_durations(durations) for name, durations in subprocess_overheads(events).items()
+        },
+    }
+
+
+def format_table(title: str, rows: dict[str, dict], failures: dict[str, int] | None = None) -> str:
+    if not rows:
+        return ""
+    width = max(len(title), *(len(name) for name in rows))
+    header = f"{title:<{width}}  {'n':>5}  {'p50 s':>8}  {'p95 s':>8}  {'mean s':>8}  {'total s':>9}"
+    if failures is not None:
+        header += f"  {'failed':>6}"
+    lines = [header, "-" * len(header)]
+    for name, s in rows.items():
+        line = (
+            f"{name:<{width}}  {s['count']:>5}  {s['p50_s']:>8.3f}  {s['p95_s']:>8.3f}  "
+            f"{s['mean_s']:>8.3f}  {s['total_s']:>9.2f}"
+        )
+        if failures is not None:
+            line += f"  {failures.get(name, 0):>6}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def print_report(report: dict):
+    tables = [
+        format_table("run", {"cycle": report["runs"]} if report["runs"]["count"] else {}),
+        format_table("state", report["states"], report["state_failures"]),
+        format_table("state#visit", report["state_visits"]),
+        format_table("span", report["spans"]),
+        format_table("subprocess overhead", report["subprocess_overhead"]),
+    ]
+    print("\n\n".join(table for table in tables if table))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("paths", nargs="+", type=Path, help="JSONL trace files.")
+    parser.add_argument("--json", type=Path, help="Also write the report as JSON to this file.")
+    parser.add_argument(
+        "--chrome", type=Path, help="Also write the events in Chrome trace format to this file."
+    )
+    args = parser.parse_args()
+
+    events = [event for path in args.paths for event in load_trace(path)]
+    report = build_report(events)
+    print_report(report)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.chrome:
+        with open(args.chrome, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+if __name__ == "__main__":
+    main()
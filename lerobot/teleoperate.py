@@ -32,7 +32,7 @@ python -m lerobot.teleoperate \
 
 import logging
 import time
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from pprint import pformat
 
 import draccus
@@ -41,6 +41,9 @@ import rerun as rr
 
 from lerobot.common.cameras.opencv.configuration_opencv import OpenCVCameraConfig  # noqa: F401
 from lerobot.common.cameras.realsense.configuration_realsense import RealSenseCameraConfig  # noqa: F401
+from lerobot.common.cameras.shared_memory.configuration_shared_memory import (  # noqa: F401
+    SharedMemoryCameraConfig,
+)
 from lerobot.common.robots import (  # noqa: F401
     Robot,
     RobotConfig,
@@ -54,7 +57,7 @@ from lerobot.common.teleoperators import (
     TeleoperatorConfig,
     make_teleoperator_from_config,
 )
-from lerobot.common.utils.robot_utils import busy_wait
+from lerobot.common.utils.scheduler import PeriodicScheduler, SchedulerConfig
 from lerobot.common.utils.utils import init_logging, move_cursor_up
 from lerobot.common.utils.visualization_utils import _init_rerun
 
@@ -70,13 +73,34 @@ class TeleoperateConfig:
     teleop_time_s: float | None = None
     # Display all cameras on screen
     display_data: bool = False
+    # Real-time priority and CPU affinity of the control loop
+    scheduler: SchedulerConfig = field(default_factory=SchedulerConfig)
 
 
 def teleop_loop(
-    teleop: Teleoperator, robot: Robot, fps: int, display_data: bool = False, duration: float | None = None
+    teleop: Teleoperator,
+    robot: Robot,
+    fps: int,
+    display_data: bool = False,
+    duration: float | None = None,
+    scheduler_config: SchedulerConfig | None = None,
 ):
     display_len = max(len(key) for key in robot.action_features)
-    start = time.perf_counter()
+    with PeriodicScheduler(fps, scheduler_config) as scheduler:
+        try:
+            _teleop_loop(teleop, robot, scheduler, display_len, display_data, duration)
+        finally:
+            logging.info(f"Teleoperation loop:\n{scheduler.stats.format()}")
+
+
+def _teleop_loop(
+    teleop: Teleoperator,
+    robot: Robot,
+    scheduler: PeriodicScheduler,
+    display_len: int,
+    display_data: bool,
+    duration: float | None,
+):
     while True:
         loop_start = time.perf_counter()
         action = teleop.get_action()
@@ -92,8 +116,7 @@ def teleop_loop(
                     rr.log(f"action_{act}", rr.Scalar(val))
 
         robot.send_action(action)
-        dt_s = time.perf_counter() - loop_start
-        busy_wait(1 / fps - dt_s)
+        scheduler.wait()
 
         loop_s = time.perf_counter() - loop_start
 
@@ -103,7 +126,7 @@ def teleop_loop(
             print(f"{motor:<{display_len}} | {value:>7.2f}")
         print(f"\ntime: {loop_s * 1e3:.2f}ms ({1 / loop_s:.0f} Hz)")
 
-        if duration is not None and time.perf_counter() - start >= duration:
+        if duration is not None and scheduler.timestamp >= duration:
             return
 
         move_cursor_up(len(action) + 5)
@@ -123,7 +146,14 @@ def teleoperate(cfg: TeleoperateConfig):
     robot.connect()
 
     try:
-        teleop_loop(teleop, robot, cfg.fps, display_data=cfg.display_data, duration=cfg.teleop_time_s)
+        teleop_loop(
+            teleop,
+            robot,
+            cfg.fps,
+            display_data=cfg.display_data,
+            duration=cfg.teleop_time_s,
+            scheduler_config=cfg.scheduler,
+        )
     except KeyboardInterrupt:
         pass
     finally:
@@ -2,30 +2,56 @@
 """
 State machine controller for the Cheeto robot.
 
-States:
-- MOVE_CHEETO           : run move script (20s timeout)
-- HOME_ROBOT            : home script (5s timeout), used after move & after cut
-- CHECK_CHEETO_POSITION : YOLO model (in cv_models env) decides if Cheeto is in acceptable position
-- CUT_CHEETO            : run cut script (20s timeout)
-- CHECK_CHEETO_CUT      : YOLO model (in cv_models env) decides if Cheeto is in two pieces; end or loop
-
-Transitions (logical):
-1) MOVE_CHEETO -> HOME_ROBOT (next_after_home = CHECK_CHEETO_POSITION)
-2) HOME_ROBOT -> next_after_home
-3) CHECK_CHEETO_POSITION:
+The states, transitions, timeouts, policies and verifier models are declared in a config
+file (smf_configs/cheeto.json by default) and run by smf_engine.StateMachine. This file
+only binds the config's actions to the robot and the verifiers:
+- "policy" : run an ACT policy (lerobot.record) until its timeout
+- "home"   : home the robot with the leader arm (lerobot.teleoperate) until its timeout,
+             optionally starting the next check once the arm is clear of the board
+- "verify" : YOLO model (in cv_models env) answers yes/no on the current camera view
+and its preparation tasks, run in the background while other states execute:
+- "start_verifier"       : launch the YOLO service
+- "preload_policy:<name>": load a policy into the in-process runtime
+
+Cheeto task (smf_configs/cheeto.json):
+1) MOVE_CHEETO -> HOME_AFTER_MOVE -> CHECK_CHEETO_POSITION
+2) CHECK_CHEETO_POSITION:
     - if NO  -> MOVE_CHEETO
     - if YES -> CUT_CHEETO
-4) CUT_CHEETO -> HOME_ROBOT (next_after_home = CHECK_CHEETO_CUT)
-5) CHECK_CHEETO_CUT:
+3) CUT_CHEETO -> HOME_AFTER_CUT -> CHECK_CHEETO_CUT
+4) CHECK_CHEETO_CUT:
     - if YES (cut ok) -> end
     - if NO  -> CHECK_CHEETO_POSITION
+
+Both YOLO models are served by one long-lived `yolo_classifier.py --serve` process that is
+started once and queried over a Unix socket. If the service cannot be started, each check
+falls back to a one-shot `yolo_classifier.py` subprocess.
+
+With --in-process (run from the lerobot environment), policy and home states run inside
+this process through smf_runtime.SMFRuntime: the robot, cameras and the ACT policies are
+loaded once and each state timeout becomes an in-loop deadline.
+
+Other task variants only need their own config:
+    python3 smf.py --config smf_configs/my_task.json
+
+With --trace FILE, every run, state, subprocess, verification and (through the
+LEROBOT_TRACE_FILE environment variable inherited by lerobot.record) every control loop step is
+written as a span to FILE. Summarize one or many runs with:
+    python -m lerobot.scripts.trace_report FILE [FILE ...]
 """
 
+import argparse
+import contextlib
+import json
+import logging
+import socket
 import subprocess
+import threading
 import time
-import logging
-from enum import Enum, auto
-from typing import List, Optional
+from typing import List, Optional, Union
+
+from lerobot.common.utils.tracing import enable_tracing, span
+from smf_engine import StateMachine, StateMachineConfig
 
 logging.basicConfig(
     level=logging.INFO,
@@ -34,29 +60,19 @@ logging.basicConfig(
 
 
 # ---------------------------------------------------------
-# State definitions
+# Config: command BASES
+# (policy path and dataset.repo_id with timestamp are added at runtime)
 # ---------------------------------------------------------
-class State(Enum):
-    MOVE_CHEETO = auto()
-    HOME_ROBOT = auto()
-    CHECK_CHEETO_POSITION = auto()
-    CUT_CHEETO = auto()
-    CHECK_CHEETO_CUT = auto()
-
+SMF_CONFIG_PATH = "smf_configs/cheeto.json"
 
-# ---------------------------------------------------------
-# Config: command BASES & timeouts
-# (dataset.repo_id with timestamp is added at runtime)
-# ---------------------------------------------------------
-MOVE_CHEETO_CMD_BASE: List[str] = [
+RECORD_CMD_BASE: List[str] = [
     "conda", "run", "-n", "lerobot010_v2",
     "python", "-m", "lerobot.record",
     "--robot.type=so101_follower",
     "--robot.port=/dev/ttyACM0",
     "--robot.id=my_awesome_follower_arm",
+    # Cameras JSON must be ONE argument as a string
     "--robot.cameras={ left: {type: opencv, index_or_path: 0, width: 640, height: 480, fps: 10}, right: {type: opencv, index_or_path: 2, width: 640, height: 480, fps: 10} }",
-    "--policy.path=outputs/train/act_cc_v10_full_run/checkpoints/100000/pretrained_model",
-    "--dataset.single_task=YellowBrickPurpleRectangle",
     "--dataset.push_to_hub=false",
     "--display_data=true",
 ]
@@ -72,26 +88,74 @@ HOME_ROBOT_CMD: List[str] = [
     "--teleop.id=my_awesome_leader_arm",
 ]
 
-CUT_CHEETO_CMD_BASE: List[str] = [
-    "conda", "run", "-n", "lerobot010_v2",
-    "python", "-m", "lerobot.record",
-    "--robot.type=so101_follower",
-    "--robot.port=/dev/ttyACM0",
-    "--robot.id=my_awesome_follower_arm",
-    # Cameras JSON must be ONE argument as a string
-    "--robot.cameras={ left: {type: opencv, index_or_path: 0, width: 640, height: 480, fps: 10},  right: {type: opencv, index_or_path: 2, width: 640, height: 480, fps: 10} }",
-    # Policy path
-    "--policy.path=outputs/train/act_cc_v11_full_run/checkpoints/100000/pretrained_model",
-    "--dataset.single_task=YellowBrickPurpleRectangle",
-    "--dataset.push_to_hub=false",
-    "--display_data=true",
-]
+# Overridden by the "task", "policies" and "verifiers" entries of the SMF config
+# (YOLO_MODELS is defined below with the YOLO service settings)
+TASK = "YellowBrickPurpleRectangle"
+POLICY_PATHS = {
+    "move": "outputs/train/act_cc_v10_full_run/checkpoints/100000/pretrained_model",
+    "cut": "outputs/train/act_cc_v11_full_run/checkpoints/100000/pretrained_model",
+}
+EVAL_REPO_ID_PREFIX = "JaredBailey/eval_lerobot-yellow-brick"
 
-MOVE_CHEETO_TIMEOUT_S = 30
-HOME_ROBOT_TIMEOUT_S = 5
-CUT_CHEETO_TIMEOUT_S = 30
+# ---------------------------------------------------------
+# Config: YOLO verification service
+# ---------------------------------------------------------
+# .pt checkpoints run through ultralytics. Models exported with yolo_export.py (best.onnx, or
+# best.int8.onnx) run through ONNX Runtime, or OpenVINO with YOLO_BACKEND = "openvino".
+YOLO_MODELS = {
+    "cheeto_position": "yolov8_models/cheeto_position/best.pt",
+    "cheeto_cut": "yolov8_models/cheeto_cut/best.pt",
+}
+YOLO_BACKEND = "auto"  # "auto" (from the file extension), "ultralytics", "onnx" or "openvino"
+YOLO_CAMERA_INDEX = 2
+YOLO_SOCKET_PATH = "/tmp/cheeto_yolo.sock"
+YOLO_SERVICE_STARTUP_TIMEOUT_S = 120
+YOLO_REQUEST_TIMEOUT_S = 10
+# Each check classifies a short burst of frames in one batched call and votes, so a single
+# occluded or blurred frame doesn't send the robot back to MOVE_CHEETO.
+YOLO_BURST_FRAMES = 5
+YOLO_BURST_CAMERAS: List[Union[int, str]] = [YOLO_CAMERA_INDEX]
+YOLO_VOTE_MODE = "mean"  # "mean" (confidence-weighted) or "majority"
+# In --in-process mode the runtime owns the cameras and publishes this one to shared memory
+# (smf_runtime.default_cameras), so the YOLO service reads its frames from memory instead of
+# reopening camera 2 between policy states.
+YOLO_SHARED_CAMERA = "lerobot_camera_right"
+# Keep camera 2 open in the YOLO service between checks (yolo_classifier.py --hold-camera). A check
+# then classifies the latest frames in tens of ms, instead of reopening the camera and discarding
+# warmup frames first (a few hundred ms). Off by default because lerobot.record, run as a
+# subprocess for each policy state, can't open camera 2 while the service holds it. With
+# --in-process, the service reads YOLO_SHARED_CAMERA from memory and never opens the device, so
+# checks are fast either way.
+YOLO_HOLD_CAMERA = False
 
-MAX_ITERATIONS = 50  # safety guard so we don't loop forever
+# ---------------------------------------------------------
+# Config: early exit of MOVE/CUT (--in-process only)
+# The live robot frames are classified in the background while the policy runs, and the
+# subtask stops as soon as the verifier is confident it is done. The regular check after
+# homing still decides the next state.
+# ---------------------------------------------------------
+EARLY_EXIT_ENABLED = True
+EARLY_EXIT_CAMERA = "right"  # observation key of the camera the YOLO models were trained on
+EARLY_EXIT_EVERY_N_STEPS = 15  # ~0.5s at 30 fps
+EARLY_EXIT_THRESHOLD = 0.9
+EARLY_EXIT_PATIENCE = 2  # consecutive confident classifications before exiting
+EARLY_EXIT_MIN_STEPS = 60  # ignore the first ~2s of each subtask
+
+# ---------------------------------------------------------
+# Config: speculative verification while homing
+# A "home" state with a "verify" param starts that verifier in the background once the arm
+# is clear of the board (its "clearance" param), and the next "verify" state uses the result
+# instead of waiting for a new check after homing:
+#   "params": {"verify": "cheeto_cut",
+#              "clearance": {"after_s": 2.0, "joints": {"shoulder_lift.pos": {"max": -60}}}}
+# "after_s" is the time since homing started. "joints" bounds are checked against the follower's
+# observed positions, so they are only used with --in-process.
+# ---------------------------------------------------------
+SPECULATIVE_VERIFY_ENABLED = True
+# While the YOLO service answers, the check is repeated at most this often until the verify state
+# uses it, so the result reflects the latest frame. A check falling back to a one-shot subprocess
+# takes seconds, so it only runs once.
+SPECULATIVE_VERIFY_PERIOD_S = 0.5
 
 
 # ---------------------------------------------------------
@@ -104,16 +168,20 @@ def run_with_timeout(cmd: List[str], timeout_s: int, name: str) -> bool:
     Returns True if it exited with code 0 within the timeout, False otherwise.
     """
     logging.info("Starting %s: %s (timeout=%ss)", name, cmd, timeout_s)
-    try:
-        proc = subprocess.Popen(cmd)
-        proc.wait(timeout=timeout_s)
-    except subprocess.TimeoutExpired:
-        logging.warning("%s timed out after %s seconds. Killing process...", name, timeout_s)
-        proc.kill()
-        return False
-    except Exception as e:
-        logging.error("%s failed with exception: %s", name, e)
-        return False
+    with span(name, "subprocess", timeout_s=timeout_s) as trace_args:
+        try:
+            proc = subprocess.Popen(cmd)
+            proc.wait(timeout=timeout_s)
+        except subprocess.TimeoutExpired:
+            logging.warning("%s timed out after %s seconds. Killing process...", name, timeout_s)
+            proc.kill()
+            trace_args["timed_out"] = True
+            return False
+        except Exception as e:
+            logging.error("%s failed with exception: %s", name, e)
+            trace_args["error"] = str(e)
+            return False
+        trace_args["returncode"] = proc.returncode
 
     if proc.returncode == 0:
         logging.info("%s completed successfully.", name)
@@ -123,49 +191,286 @@ def run_with_timeout(cmd: List[str], timeout_s: int, name: str) -> bool:
         return False
 
 
-def run_move_cheeto() -> bool:
-    """Run the move Cheeto script with a timeout."""
-    ts = time.strftime('%Y%m%d_%H%M%S')
-    cmd = MOVE_CHEETO_CMD_BASE + [
-        f"--dataset.repo_id=JaredBailey/eval_lerobot-yellow-brick_{ts}",
-    ]
-    return run_with_timeout(cmd, MOVE_CHEETO_TIMEOUT_S, "MoveCheeto")
+# In-process robot/policy runtime, set in main() when --in-process is given
+runtime = None
+
+
+def make_success_detector(model_name: str):
+    """Early-exit detector classifying live observations with YOLO_MODELS[model_name], or None."""
+    if not EARLY_EXIT_ENABLED or not yolo_service.is_running:
+        return None
+
+    from lerobot.common.utils.control_utils import AsyncSuccessDetector
+
+    def classify(observation: dict) -> float:
+        if YOLO_SHARED_CAMERA in YOLO_BURST_CAMERAS:
+            # The service reads the frame the robot just published, no need to send it.
+            p_yes = yolo_service.classify_latest(model_name, YOLO_SHARED_CAMERA)
+        else:
+            p_yes = yolo_service.classify_images(model_name, [observation[EARLY_EXIT_CAMERA]])
+        return 0.0 if p_yes is None else p_yes
 
+    return AsyncSuccessDetector(
+        classify,
+        every_n_steps=EARLY_EXIT_EVERY_N_STEPS,
+        threshold=EARLY_EXIT_THRESHOLD,
+        patience=EARLY_EXIT_PATIENCE,
+        min_steps=EARLY_EXIT_MIN_STEPS,
+    )
 
-def run_home_robot() -> bool:
-    """Run the home robot script with a 5s timeout."""
-    return run_with_timeout(HOME_ROBOT_CMD, HOME_ROBOT_TIMEOUT_S, "HomeRobot")
 
+def run_policy(policy: str, timeout_s: float, verifier: Optional[str] = None) -> bool:
+    """
+    Run POLICY_PATHS[policy] on the robot with a timeout.
 
-def run_cut_cheeto() -> bool:
-    """Run the cut Cheeto script with a 20s timeout."""
+    In --in-process mode, `verifier` (a YOLO_MODELS key) is also used to end the subtask
+    early once it is confident the subtask is done.
+    """
+    # The scene is about to change, so checks started during the previous homing are stale
+    discard_speculative_checks()
+    if runtime is not None:
+        detector = make_success_detector(verifier) if verifier is not None else None
+        try:
+            return runtime.run_policy(policy, timeout_s, success_detector=detector)
+        finally:
+            if detector is not None:
+                detector.close()
     ts = time.strftime('%Y%m%d_%H%M%S')
-    cmd = CUT_CHEETO_CMD_BASE + [
-        f"--dataset.repo_id=JaredBailey/eval_lerobot-yellow-brick_{ts}",
+    cmd = RECORD_CMD_BASE + [
+        f"--policy.path={POLICY_PATHS[policy]}",
+        f"--dataset.single_task={TASK}",
+        f"--dataset.repo_id={EVAL_REPO_ID_PREFIX}_{ts}",
     ]
-    return run_with_timeout(cmd, CUT_CHEETO_TIMEOUT_S, "CutCheeto")
+    return run_with_timeout(cmd, timeout_s, f"Policy[{policy}]")
+
+
+def run_home_robot(timeout_s: float, verify: Optional[str] = None, clearance: Optional[dict] = None) -> bool:
+    """
+    Run the home robot script with a timeout.
+
+    If `verify` (a YOLO_MODELS key) is given, that check starts in the background as soon as the
+    `clearance` condition is met, and its result is used by the next run_verify(verify).
+    """
+    check = None
+    if verify is not None and SPECULATIVE_VERIFY_ENABLED:
+        discard_speculative_checks()
+        check = SpeculativeCheck(verify, **(clearance or {}))
+        speculative_checks[verify] = check
+
+    if runtime is not None:
+        return runtime.home(timeout_s, on_observation=check.observe if check is not None else None)
+    if check is not None:
+        check.observe_until_started()
+    return run_with_timeout(HOME_ROBOT_CMD, timeout_s, "HomeRobot")
 
 
 # ---------------------------------------------------------
 # YOLO-based checks (cv_models environment, camera 2)
 # ---------------------------------------------------------
-def run_yolo_check(model_path: str) -> bool:
+class YoloService:
     """
-    Run the YOLOv8 model in the cv_models environment on camera index 2.
+    Client for the long-lived YOLO classification service (yolo_classifier.py --serve).
+
+    The service runs in the cv_models environment and keeps every model in YOLO_MODELS loaded
+    and warm, instead of re-importing ultralytics and reloading weights for every check. Checks
+    take tens of milliseconds when the frames come from shared memory (--in-process) or from a
+    held camera (YOLO_HOLD_CAMERA); otherwise reopening camera 2 dominates.
+    """
+
+    def __init__(self, socket_path: str = YOLO_SOCKET_PATH):
+        self.socket_path = socket_path
+        self.proc: Optional[subprocess.Popen] = None
+        self._sock: Optional[socket.socket] = None
+        self._stream = None
+        # Checks from the state machine and from the early-exit detector share one connection
+        self._lock = threading.Lock()
+
+    def start(self, timeout_s: float = YOLO_SERVICE_STARTUP_TIMEOUT_S) -> bool:
+        """Launch the service and wait until it answers a ping. Returns False if it never does."""
+        cmd = [
+            "conda", "run", "--no-capture-output", "-n", "cv_models",
+            "python", "yolo_classifier.py",
+            "--serve",
+            "--socket", self.socket_path,
+            "--backend", YOLO_BACKEND,
+        ]
+        for camera in YOLO_BURST_CAMERAS:
+            cmd += ["--camera", str(camera)]
+        if YOLO_HOLD_CAMERA:
+            cmd += ["--hold-camera"]
+        for name, path in YOLO_MODELS.items():
+            cmd += ["--model", f"{name}={path}"]
+
+        logging.info("Starting YOLO service: %s", cmd)
+        try:
+            self.proc = subprocess.Popen(cmd)
+        except Exception as e:
+            logging.error("Failed to launch YOLO service: %s", e)
+            return False
+
+        deadline = time.monotonic() + timeout_s
+        while time.monotonic() < deadline:
+            if self.proc.poll() is not None:
+                logging.error("YOLO service exited early with status %s.", self.proc.returncode)
+                return False
+            try:
+                self._request({"cmd": "ping"})
+                logging.info("YOLO service ready.")
+                return True
+            except OSError:
+                time.sleep(0.25)
+
+        logging.error("YOLO service not ready after %s seconds.", timeout_s)
+        self.stop()
+        return False
+
+    @property
+    def is_running(self) -> bool:
+        # A lost connection doesn't stop the service: the next request connects again
+        return self.proc is not None and self.proc.poll() is None
+
+    def _connect(self):
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(YOLO_REQUEST_TIMEOUT_S)
+        self._sock.connect(self.socket_path)
+        self._stream = self._sock.makefile("rw")
+
+    def _disconnect(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _request(self, request: dict) -> dict:
+        """
+        Send `request` and return the response, connecting first if needed.
+
+        Any failure drops the connection: a stream that timed out can't be read anymore, and a late
+        response would otherwise be read as the answer to the next request. The next request then
+        connects again.
+        """
+        with self._lock:
+            try:
+                if self._stream is None:
+                    self._connect()
+                self._stream.write(json.dumps(request) + "\n")
+                self._stream.flush()
+                line = self._stream.readline()
+                if not line:
+                    raise ConnectionError("YOLO service closed the connection.")
+                return json.loads(line)
+            except (OSError, ValueError):
+                self._disconnect()
+                raise
+
+    def classify_images(self, model_name: str, images: list) -> Optional[float]:
+        """
+        Classify RGB frames captured in this process (e.g. robot observations).
+
+        Returns the vote's probability that the answer is 'yes', or None if the service could not answer.
+        """
+        # Only needed in --in-process mode, where the lerobot environment provides cv2
+        import cv2
+
+        from yolo_classifier import encode_image
+
+        try:
+            encoded = [encode_image(cv2.cvtColor(image, cv2.COLOR_RGB2BGR)) for image in images]
+        except RuntimeError as e:
+            logging.error("Failed to encode frame for the YOLO service: %s", e)
+            return None
+
+        return self._request_p_yes({"model": model_name, "images": encoded, "mode": YOLO_VOTE_MODE})
+
+    def classify_latest(self, model_name: str, camera: str) -> Optional[float]:
+        """Same as classify_images, on the latest frame published to the shared memory `camera`."""
+        return self._request_p_yes({"model": model_name, "frames": 1, "cameras": [camera]})
+
+    def _request_p_yes(self, request: dict) -> Optional[float]:
+        try:
+            response = self._request(request)
+        except (OSError, ValueError) as e:
+            logging.error("YOLO service request failed: %s", e)
+            return None
+        if not response.get("ok"):
+            logging.error("YOLO service error: %s", response.get("error"))
+            return None
+
+        confidence = response["confidence"]
+        return confidence if response["label"] == "yes" else 1.0 - confidence
+
+    def classify(self, model_name: str) -> Optional[tuple]:
+        """Returns (label, confidence), or None if the service could not answer."""
+        try:
+            response = self._request(
+                {
+                    "model": model_name,
+                    "frames": YOLO_BURST_FRAMES,
+                    "cameras": YOLO_BURST_CAMERAS,
+                    "mode": YOLO_VOTE_MODE,
+                }
+            )
+        except (OSError, ValueError) as e:
+            logging.error("YOLO service request failed: %s", e)
+            return None
+
+        if not response.get("ok"):
+            logging.error("YOLO service error: %s", response.get("error"))
+            return None
+
+        logging.info(
+            "YOLO service: model=%s label=%s confidence=%.3f (%.1f ms)",
+            model_name,
+            response["label"],
+            response["confidence"],
+            response["latency_ms"],
+        )
+        for frame in response.get("frames", []):
+            logging.info("  camera=%s label=%s p_yes=%.3f", frame["camera"], frame["label"], frame["p_yes"])
+        return response["label"], response["confidence"]
+
+    def stop(self):
+        if self.is_running:
+            with contextlib.suppress(OSError, ValueError):
+                self._request({"cmd": "shutdown"})
+        with self._lock:
+            self._disconnect()
+
+        if self.proc is not None:
+            try:
+                self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+            self.proc = None
+
+
+# Shared service instance, started in main()
+yolo_service = YoloService()
+
+
+def run_yolo_check_subprocess(model_path: str) -> bool:
+    """
+    Run the YOLOv8 model in the cv_models environment on the YOLO_BURST_CAMERAS.
 
     Assumes yolo_classifier.py:
-      - warms up camera 2
-      - captures a fresh frame
+      - opens camera 2 and captures fresh frames, or reads them from shared memory in
+        --in-process mode, where the runtime owns the camera and publishes YOLO_SHARED_CAMERA
       - releases the camera
       - prints 'yes' or 'no' to stdout (on the LAST line)
 
     Returns True if YOLO prints 'yes' on its last non-empty stdout line, False otherwise.
     """
+    camera_args = [arg for camera in YOLO_BURST_CAMERAS for arg in ("--camera", str(camera))]
     cmd = [
         "conda", "run", "-n", "cv_models",
         "python", "yolo_classifier.py",
         "--model-path", model_path,
-        "--camera", "2",
+        *camera_args,
+        "--frames", str(YOLO_BURST_FRAMES),
+        "--vote", YOLO_VOTE_MODE,
+        "--backend", YOLO_BACKEND,
     ]
 
     logging.info("Running YOLO classifier: %s", cmd)
@@ -210,99 +515,240 @@ def run_yolo_check(model_path: str) -> bool:
         return False
 
 
-def check_cheeto_position() -> bool:
+def run_yolo_check(model_name: str) -> bool:
     """
-    Use the YOLOv8 'cheeto_position' model to decide
-    if the Cheeto is in an acceptable position on the board.
+    Classify the current camera view with YOLO_MODELS[model_name].
 
-    Returns:
-        True  -> position OK (go to CUT_CHEETO)
-        False -> position NOT OK (go back to MOVE_CHEETO)
+    Uses the resident YOLO service when it is running and falls back to a one-shot
+    subprocess otherwise.
+
+    Returns True if the model predicts 'yes', False otherwise.
+    """
+    with span("yolo_check", "verify", model=model_name) as trace_args:
+        if yolo_service.is_running:
+            result = yolo_service.classify(model_name)
+            if result is not None:
+                label, _ = result
+                if label not in ("yes", "no"):
+                    logging.warning("Unexpected YOLO output '%s'; treating as NOT OK.", label)
+                trace_args.update(backend="service", label=label)
+                return label == "yes"
+            logging.warning("YOLO service unavailable; falling back to subprocess check.")
+
+        trace_args["backend"] = "subprocess"
+        ok = run_yolo_check_subprocess(YOLO_MODELS[model_name])
+        trace_args["label"] = "yes" if ok else "no"
+        return ok
+
+
+def run_verify(verifier: str, timeout_s: Optional[float] = None) -> bool:
     """
-    logging.info("Using YOLOv8 model to check cheeto position.")
-    model_path = "yolov8_models/cheeto_position/best.pt"
-    return run_yolo_check(model_path)
+    Use the YOLOv8 model YOLO_MODELS[verifier] to decide if the subtask succeeded,
+    e.g. 'cheeto_position' (Cheeto in an acceptable position on the board) or
+    'cheeto_cut' (Cheeto cut into two pieces).
+
+    Uses the result of the check started while homing, if there is one.
+
+    Returns True if the model answers 'yes', False otherwise.
+    """
+    check = speculative_checks.pop(verifier, None)
+    if check is not None:
+        ok = check.finish()
+        if ok is not None:
+            logging.info("Using the '%s' check started while homing: %s.", verifier, "yes" if ok else "no")
+            return ok
+        logging.info("The '%s' check didn't start while homing.", verifier)
+
+    logging.info("Using YOLOv8 model '%s' to check the subtask result.", verifier)
+    return run_yolo_check(verifier)
 
 
-def check_cheeto_cut() -> bool:
+class SpeculativeCheck:
     """
-    Use the YOLOv8 'cheeto_cut' model to decide
-    if the Cheeto has been cut into two pieces.
+    Runs run_yolo_check(verifier) in the background while the robot is homing.
 
-    Returns:
-        True  -> cut successful (end program)
-        False -> cut NOT successful (go back to CHECK_CHEETO_POSITION)
+    The check starts once `after_s` seconds have passed since homing started and, when given, the
+    observed joint positions are within the `joints` bounds ({"motor.pos": {"min": .., "max": ..}}).
+    It is then repeated every `period_s` while the YOLO service is running, until finish() is
+    called, so the decision reflects a frame taken with the arm clear of the board and is ready as
+    soon as homing ends.
     """
-    logging.info("Using YOLOv8 model to check cheeto cut result.")
-    model_path = "yolov8_models/cheeto_cut/best.pt"
-    return run_yolo_check(model_path)
+
+    def __init__(
+        self,
+        verifier: str,
+        after_s: float = 0.0,
+        joints: Optional[dict] = None,
+        period_s: float = SPECULATIVE_VERIFY_PERIOD_S,
+    ):
+        self.verifier = verifier
+        self.after_s = after_s
+        self.joints = joints or {}
+        self.period_s = period_s
+        self.start_t = time.perf_counter()
+        self.num_checks = 0
+        self._result: Optional[bool] = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._timer: Optional[threading.Thread] = None
+
+    def _is_clear(self, observation: Optional[dict]) -> bool:
+        if time.perf_counter() - self.start_t < self.after_s:
+            return False
+        if not self.joints:
+            return True
+        if observation is None:
+            return False
+        for joint, bounds in self.joints.items():
+            value = observation.get(joint)
+            if value is None:
+                return False
+            if "min" in bounds and value < bounds["min"]:
+                return False
+            if "max" in bounds and value > bounds["max"]:
+                return False
+        return True
+
+    def observe(self, observation: Optional[dict] = None):
+        """Called with each observation while homing. Starts the check once the arm is clear."""
+        if self._thread is not None or self._stop_event.is_set() or not self._is_clear(observation):
+            return
+        logging.info(
+            "Arm clear after %.1fs of homing, starting the '%s' check.",
+            time.perf_counter() - self.start_t,
+            self.verifier,
+        )
+        self._thread = threading.Thread(target=self._run, name=f"speculative_{self.verifier}", daemon=True)
+        self._thread.start()
+
+    def observe_until_started(self, period_s: float = 0.1):
+        """Without observations (homing in a subprocess): start the check once `after_s` has passed."""
+        if self.joints:
+            logging.warning("Joint clearance bounds need --in-process; only 'after_s' is used.")
+            self.joints = {}
+
+        def poll():
+            while self._thread is None and not self._stop_event.is_set():
+                self.observe()
+                self._stop_event.wait(period_s)
+
+        self._timer = threading.Thread(target=poll, name=f"speculative_{self.verifier}_timer", daemon=True)
+        self._timer.start()
+
+    def _run(self):
+        while True:
+            with span("speculative_check", "verify", model=self.verifier):
+                ok = run_yolo_check(self.verifier)
+            with self._lock:
+                self._result = ok
+                self.num_checks += 1
+            if not yolo_service.is_running or self._stop_event.wait(self.period_s):
+                return
+
+    def _stop(self):
+        """Stops checking and waits for the check in progress, so no thread outlives the check."""
+        self._stop_event.set()
+        if self._timer is not None:
+            self._timer.join()
+        if self._thread is not None:
+            self._thread.join()
+
+    def finish(self) -> Optional[bool]:
+        """
+        Stops checking. Returns the latest result, waiting for the check in progress, or None if
+        the check never started.
+        """
+        self._stop()
+        with self._lock:
+            return self._result
+
+    def cancel(self):
+        """Stops checking, e.g. because the scene is about to change, and discards the result."""
+        self._stop()
+        with self._lock:
+            self._result = None
+
+
+# Checks started while homing, by verifier, until the next "verify" state uses them
+speculative_checks = {}
+
+
+def discard_speculative_checks():
+    """Cancels the pending checks, waiting for those in progress so they don't see the next policy run."""
+    for check in speculative_checks.values():
+        check.cancel()
+    speculative_checks.clear()
+
+
+def start_verifier():
+    """Launch the YOLO service, if it isn't running yet."""
+    if yolo_service.is_running:
+        return
+    # Checks fall back to one-shot subprocesses if this fails.
+    if not yolo_service.start():
+        logging.warning("YOLO service not available; using one-shot subprocess checks.")
+
+
+def preload_policy(policy: str):
+    """Load a policy into the in-process runtime ahead of time. No-op in subprocess mode."""
+    if runtime is not None:
+        runtime.preload_policy(policy)
 
 
 # ---------------------------------------------------------
-# State machine main loop
+# State machine
 # ---------------------------------------------------------
-def main():
-    current_state = State.MOVE_CHEETO
-    next_after_home: Optional[State] = None
-    iteration = 0
-
-    logging.info("Starting Cheeto state machine.")
-
-    while True:
-        iteration += 1
-        if iteration > MAX_ITERATIONS:
-            logging.error("Reached MAX_ITERATIONS=%d. Aborting for safety.", MAX_ITERATIONS)
-            break
-
-        logging.info("=== Iteration %d | State: %s ===", iteration, current_state.name)
-
-        if current_state == State.MOVE_CHEETO:
-            # Step 1: MoveCheeto
-            run_move_cheeto()
-            # After homing from here, we want to go to CHECK_CHEETO_POSITION
-            next_after_home = State.CHECK_CHEETO_POSITION
-            current_state = State.HOME_ROBOT
-
-        elif current_state == State.HOME_ROBOT:
-            # Shared state: used after MOVE_CHEETO and CUT_CHEETO
-            run_home_robot()
-            if next_after_home is None:
-                logging.error("HOME_ROBOT reached with no next_after_home set. Aborting.")
-                break
-            logging.info("HomeRobot complete. Next state: %s", next_after_home.name)
-            current_state = next_after_home
-            next_after_home = None  # reset, just to be safe
-
-        elif current_state == State.CHECK_CHEETO_POSITION:
-            # Step 3: CheckCheetoPosition via YOLO
-            position_ok = check_cheeto_position()
-            if position_ok:
-                logging.info("Cheeto position OK -> CutCheeto.")
-                current_state = State.CUT_CHEETO
-            else:
-                logging.info("Cheeto position NOT OK -> MoveCheeto.")
-                current_state = State.MOVE_CHEETO
-
-        elif current_state == State.CUT_CHEETO:
-            # Step 4: CutCheeto
-            run_cut_cheeto()
-            # After homing from here, we want to go to CHECK_CHEETO_CUT
-            next_after_home = State.CHECK_CHEETO_CUT
-            current_state = State.HOME_ROBOT
-
-        elif current_state == State.CHECK_CHEETO_CUT:
-            # Step 5: final check on cut via YOLO
-            cut_ok = check_cheeto_cut()
-            if cut_ok:
-                logging.info("Cheeto cut successful. Exiting.")
-                break
-            else:
-                logging.info("Cheeto cut NOT successful -> back to CheckCheetoPosition.")
-                current_state = State.CHECK_CHEETO_POSITION
+def build_state_machine(config: StateMachineConfig) -> StateMachine:
+    machine = StateMachine(config)
+    machine.register_action("policy", run_policy)
+    machine.register_action("home", run_home_robot)
+    machine.register_action("verify", run_verify)
+    machine.register_prepare_task("start_verifier", start_verifier)
+    machine.register_prepare_task("preload_policy", preload_policy)
+    return machine
 
-        else:
-            logging.error("Unknown state: %s. Aborting.", current_state)
-            break
+
+def main():
+    global runtime, TASK, POLICY_PATHS, YOLO_MODELS, YOLO_BURST_CAMERAS
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--config", default=SMF_CONFIG_PATH, help="State machine config (JSON or YAML).")
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Keep the robot and policies loaded in this process (requires the lerobot environment).",
+    )
+    parser.add_argument(
+        "--trace",
+        help="Append per-state/per-step latency spans (JSONL) to this file, e.g. outputs/traces/smf.jsonl.",
+    )
+    args = parser.parse_args()
+
+    if args.trace:
+        enable_tracing(args.trace)
+
+    config = StateMachineConfig.from_file(args.config)
+    TASK = config.extra.get("task", TASK)
+    POLICY_PATHS = config.extra.get("policies", POLICY_PATHS)
+    YOLO_MODELS = config.extra.get("verifiers", YOLO_MODELS)
+
+    if args.in_process:
+        from smf_runtime import SMFRuntime, SMFRuntimeConfig
+
+        # Policies are loaded on first use or by "preload_policy" preparation tasks
+        runtime = SMFRuntime(SMFRuntimeConfig(policy_paths=POLICY_PATHS, task=TASK))
+        with span("runtime_connect", "setup"):
+            runtime.connect(preload=[])
+        YOLO_BURST_CAMERAS = [YOLO_SHARED_CAMERA]
+
+    logging.info("Starting state machine from %s.", args.config)
+    try:
+        build_state_machine(config).run()
+    finally:
+        yolo_service.stop()
+        if runtime is not None:
+            runtime.disconnect()
 
     logging.info("State machine finished.")
 
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Declarative state machine engine for the SMF.
+
+A task is described by a config (JSON, or YAML if PyYAML is installed) instead of code:
+
+    {
+      "initial_state": "MOVE",
+      "max_iterations": 50,
+      "states": {
+        "MOVE":  {"action": "policy", "params": {"policy": "move"}, "timeout_s": 30, "next": "HOME"},
+        "HOME":  {"action": "home", "timeout_s": 5, "next": "CHECK",
+                  "prepare": ["preload_policy:cut"]},
+        "CHECK": {"action": "verify", "params": {"verifier": "position"},
+                  "requires": ["start_verifier"], "on_success": null, "on_failure": "MOVE"}
+      }
+    }
+
+Each state names an action registered on the engine. The action is called with the state's
+params and timeout and returns True/False:
+- "next" is used whatever the result,
+- otherwise "on_success" / "on_failure" is used,
+- a null/missing target ends the run ("END" works too).
+
+"prepare" lists preparation tasks ("task" or "task:arg") started in the background when the
+state is entered, e.g. preloading the next policy while the robot is homing. A state only
+waits for the preparation tasks listed in its "requires".
+
+Every state execution is timed; the timings are logged at the end and available as
+`StateMachine.timings`. With tracing enabled (see lerobot/common/utils/tracing.py), every run,
+state and preparation task is also written as a span to the trace file.
+"""
+
+import json
+import logging
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from lerobot.common.utils.tracing import span
+
+END = "END"
+
+
+@dataclass
+class StateSpec:
+    name: str
+    action: str
+    params: dict = field(default_factory=dict)
+    timeout_s: Optional[float] = None
+    next: Optional[str] = None
+    on_success: Optional[str] = None
+    on_failure: Optional[str] = None
+    prepare: List[str] = field(default_factory=list)
+    requires: List[str] = field(default_factory=list)
+
+    def next_state(self, ok: bool) -> Optional[str]:
+        target = self.next if self.next is not None else (self.on_success if ok else self.on_failure)
+        return None if target == END else target
+
+
+@dataclass
+class StateMachineConfig:
+    initial_state: str
+    states: Dict[str, StateSpec]
+    max_iterations: int = 50
+    # Anything else in the config file (e.g. policy or verifier paths), left to the caller
+    extra: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> "StateMachineConfig":
+        raw = dict(raw)
+        states = {name: StateSpec(name=name, **spec) for name, spec in raw.pop("states").items()}
+        initial_state = raw.pop("initial_state")
+        max_iterations = raw.pop("max_iterations", 50)
+        config = cls(initial_state=initial_state, states=states, max_iterations=max_iterations, extra=raw)
+        config.validate()
+        return config
+
+    @classmethod
+    def from_file(cls, path) -> "StateMachineConfig":
+        path = Path(path)
+        with open(path) as f:
+            if path.suffix in (".yaml", ".yml"):
+                import yaml
+
+                raw = yaml.safe_load(f)
+            else:
+                raw = json.load(f)
+        return cls.from_dict(raw)
+
+    def validate(self):
+        if self.initial_state not in self.states:
+            raise ValueError(f"Initial state '{self.initial_state}' is not defined.")
+        for spec in self.states.values():
+            if spec.next is not None and (spec.on_success is not None or spec.on_failure is not None):
+                raise ValueError(f"State '{spec.name}' sets both 'next' and 'on_success'/'on_failure'.")
+            for target in (spec.next, spec.on_success, spec.on_failure):
+                if target is not None and target != END and target not in self.states:
+                    raise ValueError(f"State '{spec.name}' transitions to unknown state '{target}'.")
+
+
+@dataclass
+class StateTiming:
+    iteration: int
+    state: str
+    action: str
+    start_s: float
+    duration_s: float
+    ok: bool
+    # 1 for the first time the state runs, 2 for its first retry, ...
+    visit: int = 1
+
+
+class StateMachine:
+    """Runs a StateMachineConfig with actions and preparation tasks registered by the caller."""
+
+    def __init__(self, config: StateMachineConfig, max_prepare_workers: int = 2):
+        self.config = config
+        self.actions: Dict[str, Callable[..., bool]] = {}
+        self.prepare_tasks: Dict[str, Callable[..., None]] = {}
+        self.timings: List[StateTiming] = []
+        self._executor = ThreadPoolExecutor(max_workers=max_prepare_workers, thread_name_prefix="smf_prepare")
+        self._prepared: Dict[str, Future] = {}
+        # Groups the spans of one run in the trace
+        self.run_id = f"{os.getpid()}-{time.time_ns()}"
+
+    def register_action(self, name: str, fn: Callable[..., bool]):
+        """`fn(timeout_s=..., **params) -> bool`"""
+        self.actions[name] = fn
+
+    def register_prepare_task(self, name: str, fn: Callable[..., None]):
+        """`fn()` or `fn(arg)` for "name:arg" entries."""
+        self.prepare_tasks[name] = fn
+
+    def _check_registered(self):
+        for spec in self.config.states.values():
+            if spec.action not in self.actions:
+                raise ValueError(f"State '{spec.name}' uses unregistered action '{spec.action}'.")
+            for key in spec.prepare + spec.requires:
+                task = key.split(":", 1)[0]
+                if task not in self.prepare_tasks:
+                    raise ValueError(f"State '{spec.name}' uses unregistered preparation task '{task}'.")
+
+    def _run_prepare_task(self, key: str):
+        task, _, arg = key.partition(":")
+        fn = self.prepare_tasks[task]
+        with span(key, "prepare", run_id=self.run_id):
+            return fn(arg) if arg else fn()
+
+    def prepare(self, key: str) -> Future:
+        """Start preparation task `key` ("task" or "task:arg") in the background, once."""
+        if key not in self._prepared:
+            self._prepared[key] = self._executor.submit(self._run_prepare_task, key)
+        return self._prepared[key]
+
+    def _wait_for(self, keys: List[str]):
+        for key in keys:
+            start_t = time.perf_counter()
+            with span(f"wait:{key}", "prepare", run_id=self.run_id):
+                try:
+                    self.prepare(key).result()
+                except Exception as e:
+                    logging.error("Preparation task '%s' failed: %s", key, e)
+            waited_s = time.perf_counter() - start_t
+            if waited_s > 0.01:
+                logging.info("Waited %.2fs for preparation task '%s'.", waited_s, key)
+
+    def run(self) -> bool:
+        """Run until a terminal transition. Returns False if it aborted (max iterations or errors)."""
+        self._check_registered()
+        current = self.config.initial_state
+        completed = False
+        visits: Dict[str, int] = {}
+        run_start_t = time.perf_counter()
+
+        with span("run", "run", run_id=self.run_id) as run_args:
+            try:
+                for iteration in range(1, self.config.max_iterations + 1):
+                    spec = self.config.states[current]
+                    visits[spec.name] = visit = visits.get(spec.name, 0) + 1
+                    logging.info("=== Iteration %d | State: %s ===", iteration, spec.name)
+
+                    for key in spec.prepare:
+                        self.prepare(key)
+                    self._wait_for(spec.requires)
+
+                    start_t = time.perf_counter()
+                    with span(
+                        spec.name,
+                        "state",
+                        run_id=self.run_id,
+                        iteration=iteration,
+                        visit=visit,
+                        action=spec.action,
+                    ) as state_args:
+                        try:
+                            ok = bool(self.actions[spec.action](timeout_s=spec.timeout_s, **spec.params))
+                        except Exception as e:
+                            logging.error("State %s failed with exception: %s", spec.name, e)
+                            ok = False
+                        state_args["ok"] = ok
+                    duration_s = time.perf_counter() - start_t
+                    self.timings.append(
+                        StateTiming(
+                            iteration, spec.name, spec.action, start_t - run_start_t, duration_s, ok, visit
+                        )
+                    )
+
+                    next_state = spec.next_state(ok)
+                    logging.info("%s -> %s in %.2fs (ok=%s)", spec.name, next_state or END, duration_s, ok)
+                    if next_state is None:
+                        completed = True
+                        break
+                    current = next_state
+                else:
+                    logging.error(
+                        "Reached max_iterations=%d. Aborting for safety.", self.config.max_iterations
+                    )
+            finally:
+                self._executor.shutdown(wait=True)
+                self.log_timings()
+                run_args.update(completed=completed, iterations=len(self.timings), visits=visits)
+
+        return completed
+
+    def summary(self) -> Dict[str, dict]:
+        """Per-state count, total and mean duration."""
+        summary: Dict[str, dict] = {}
+        for t in self.timings:
+            s = summary.setdefault(t.state, {"count": 0, "total_s": 0.0, "failures": 0})
+            s["count"] += 1
+            s["total_s"] += t.duration_s
+            s["failures"] += 0 if t.ok else 1
+        for s in summary.values():
+            s["mean_s"] = s["total_s"] / s["count"]
+        return summary
+
+    def log_timings(self):
+        if not self.timings:
+            return
+        total_s = sum(t.duration_s for t in self.timings) or 1e-9
+        logging.info("State timings (total %.2fs):", total_s)
+        for state, s in sorted(self.summary().items(), key=lambda item: -item[1]["total_s"]):
+            logging.info(
+                "  %-24s n=%-3d total=%7.2fs mean=%6.2fs failures=%d (%.0f%%)",
+                state,
+                s["count"],
+                s["total_s"],
+                s["mean_s"],
+                s["failures"],
+                100 * s["total_s"] / total_s,
+            )
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+In-process runtime for the Cheeto state machine (smf.py --in-process).
+
+Instead of spawning `lerobot.record` / `lerobot.teleoperate` for every MOVE_CHEETO, CUT_CHEETO
+and HOME_ROBOT state, the runtime:
+- connects the SO101 follower, its cameras and the leader arm once,
+- keeps every ACT policy (v10 for moving, v11 for cutting) loaded on the device in a
+  PolicyRegistry, which shares identical ResNet backbones between them,
+- runs each subtask with `record_loop`, using the state timeout as an in-loop deadline.
+
+Switching policies only resets the policy's action queue, so per-state startup drops from
+seconds (process spawn, bus configure, camera open, checkpoint load) to milliseconds.
+
+The "right" camera is also published to shared memory, where the YOLO verifier reads it: the
+device is opened once, by this process, for the whole run.
+
+Must run in the lerobot environment.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from lerobot.common.cameras.opencv.configuration_opencv import OpenCVCameraConfig
+from lerobot.common.policies.registry import PolicyRegistry
+from lerobot.common.robots import make_robot_from_config
+from lerobot.common.robots.so101_follower import SO101FollowerConfig
+from lerobot.common.teleoperators import make_teleoperator_from_config
+from lerobot.common.teleoperators.so101_leader import SO101LeaderConfig
+from lerobot.common.utils.control_utils import AsyncSuccessDetector
+from lerobot.common.utils.tracing import span
+from lerobot.record import record_loop
+
+
+def default_cameras() -> dict:
+    return {
+        "left": OpenCVCameraConfig(index_or_path=0, width=640, height=480, fps=10),
+        # Published to shared memory for the YOLO verifier, which would otherwise have to reopen camera 2
+        "right": OpenCVCameraConfig(
+            index_or_path=2, width=640, height=480, fps=10, shared_memory_name="lerobot_camera_right"
+        ),
+    }
+
+
+@dataclass
+class SMFRuntimeConfig:
+    robot_port: str = "/dev/ttyACM0"
+    robot_id: str = "my_awesome_follower_arm"
+    teleop_port: str = "/dev/ttyACM1"
+    teleop_id: str = "my_awesome_leader_arm"
+    cameras: dict = field(default_factory=default_cameras)
+    # Name -> pretrained_model directory of every policy kept resident
+    policy_paths: Dict[str, str] = field(
+        default_factory=lambda: {
+            "move": "outputs/train/act_cc_v10_full_run/checkpoints/100000/pretrained_model",
+            "cut": "outputs/train/act_cc_v11_full_run/checkpoints/100000/pretrained_model",
+        }
+    )
+    task: str = "YellowBrickPurpleRectangle"
+    # Control frequency of the policy subtasks (lerobot.record default)
+    fps: int = 30
+    # Control frequency while homing with the leader arm (lerobot.teleoperate default)
+    home_fps: int = 60
+    display_data: bool = False
+
+
+class SMFRuntime:
+    """Owns the robot, the leader arm and the resident policies for the whole state machine run."""
+
+    def __init__(self, config: SMFRuntimeConfig):
+        self.config = config
+        self.robot = make_robot_from_config(
+            SO101FollowerConfig(port=config.robot_port, id=config.robot_id, cameras=config.cameras)
+        )
+        self.teleop = make_teleoperator_from_config(
+            SO101LeaderConfig(port=config.teleop_port, id=config.teleop_id)
+        )
+        self.policies = PolicyRegistry()
+        # Policies can be preloaded from a background thread while another state runs
+        self._load_lock = threading.Lock()
+        # Same keys as the ones set by init_keyboard_listener, so record_loop can be reused as is
+        self.events = {"exit_early": False, "rerecord_episode": False, "stop_recording": False}
+
+    def connect(self, preload: Optional[List[str]] = None):
+        """Connect the hardware and load the `preload` policies (all of them by default)."""
+        start_t = time.perf_counter()
+        for name in self.config.policy_paths if preload is None else preload:
+            self.preload_policy(name)
+
+        self.robot.connect()
+        self.teleop.connect()
+        for cam in self.robot.cameras.values():
+            # Starts the background read thread, which keeps publishing frames between states
+            if getattr(cam.config, "shared_memory_name", None) is not None:
+                cam.async_read()
+        logging.info("SMF runtime ready in %.1fs.", time.perf_counter() - start_t)
+
+    def preload_policy(self, name: str):
+        """Load policy `name` if it isn't resident yet. Safe to call from another thread."""
+        with self._load_lock:
+            if name in self.policies:
+                return
+            path = self.config.policy_paths[name]
+            start_t = time.perf_counter()
+            with span("load_policy", "setup", policy=name):
+                self.policies.load(name, path)
+            logging.info("Loaded policy '%s' from %s in %.1fs", name, path, time.perf_counter() - start_t)
+
+    def disconnect(self):
+        if self.robot.is_connected:
+            self.robot.disconnect()
+        if self.teleop.is_connected:
+            self.teleop.disconnect()
+
+    def run_policy(
+        self, name: str, timeout_s: float, success_detector: Optional[AsyncSuccessDetector] = None
+    ) -> bool:
+        """
+        Run the `name` policy on the robot until `timeout_s` elapses or an early exit is requested.
+
+        If given, `success_detector` classifies live observations in the background and ends the
+        subtask as soon as it is confident the subtask is done.
+
+        Returns True if the subtask ran to its deadline (or exited early on request), False on error.
+        """
+        self.preload_policy(name)
+        if self.policies.active_name != name:
+            logging.info("Switching active policy: %s -> %s", self.policies.active_name, name)
+        policy = self.policies.activate(name)
+        self.events["exit_early"] = False
+        logging.info("Running policy '%s' (deadline=%ss)", name, timeout_s)
+        try:
+            record_loop(
+                robot=self.robot,
+                events=self.events,
+                fps=self.config.fps,
+                policy=policy,
+                control_time_s=timeout_s,
+                single_task=self.config.task,
+                display_data=self.config.display_data,
+                success_detector=success_detector,
+            )
+        except Exception as e:
+            logging.error("Policy '%s' failed with exception: %s", name, e)
+            return False
+        return True
+
+    def home(self, timeout_s: float, on_observation: Optional[Callable[[dict], None]] = None) -> bool:
+        """
+        Follow the leader arm (resting in its home pose) until `timeout_s` elapses.
+
+        `on_observation` is called with every observation, e.g. to start verifying the subtask
+        once the arm is clear of the board.
+        """
+        self.events["exit_early"] = False
+        logging.info("Homing robot (deadline=%ss)", timeout_s)
+        try:
+            record_loop(
+                robot=self.robot,
+                events=self.events,
+                fps=self.config.home_fps,
+                teleop=self.teleop,
+                control_time_s=timeout_s,
+                display_data=self.config.display_data,
+                on_observation=on_observation,
+            )
+        except Exception as e:
+            logging.error("Homing failed with exception: %s", e)
+            return False
+        return True
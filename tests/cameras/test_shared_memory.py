@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Example of running a specific test:
+# ```bash
+# pytest tests/cameras/test_shared_memory.py::test_read_published_frames
+# ```
+
+import os
+
+import cv2
+import numpy as np
+import pytest
+
+from lerobot.common.cameras import ColorMode, make_cameras_from_configs
+from lerobot.common.cameras.opencv import OpenCVCamera, OpenCVCameraConfig
+from lerobot.common.cameras.shared_memory import SharedMemoryCamera, SharedMemoryCameraConfig
+from lerobot.common.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
+
+
+@pytest.fixture
+def publisher(tmp_path):
+    # Short video with a different color per frame, played by OpenCV as a camera
+    video_path = tmp_path / "camera.avi"
+    writer = cv2.VideoWriter(str(video_path), cv2.VideoWriter_fourcc(*"MJPG"), 30, (160, 120))
+    for i in range(10):
+        writer.write(np.full((120, 160, 3), (i * 20, 0, 255 - i * 20), dtype=np.uint8))
+    writer.release()
+
+    config = OpenCVCameraConfig(
+        index_or_path=video_path, shared_memory_name=f"lerobot_test_camera_{os.getpid()}"
+    )
+    camera = OpenCVCamera(config)
+    camera.connect(warmup=False)
+    yield camera
+    if camera.is_connected:
+        camera.disconnect()
+
+
+def test_abc_implementation():
+    """Instantiation should raise an error if the class doesn't implement abstract methods/properties."""
+    _ = SharedMemoryCamera(SharedMemoryCameraConfig(name="lerobot_test_camera"))
+
+
+def test_make_camera_from_config():
+    cameras = make_cameras_from_configs({"right": SharedMemoryCameraConfig(name="lerobot_test_camera")})
+    assert isinstance(cameras["right"], SharedMemoryCamera)
+
+
+def test_read_published_frames(publisher):
+    camera = SharedMemoryCamera(SharedMemoryCameraConfig(name=publisher.config.shared_memory_name))
+    camera.connect(warmup=False)
+    assert (camera.width, camera.height) == (publisher.width, publisher.height)
+
+    expected = publisher.read()
+    np.testing.assert_array_equal(camera.read(), expected)
+    expected = publisher.read()
+    np.testing.assert_array_equal(camera.async_read(), expected)
+    expected = publisher.read()
+    np.testing.assert_array_equal(camera.read(color_mode=ColorMode.BGR), expected[..., ::-1])
+
+    # Every published frame was already returned
+    with pytest.raises(TimeoutError):
+        camera.async_read(timeout_ms=10)
+
+    camera.disconnect()
+    assert not camera.is_connected
+
+
+def test_connect_already_connected(publisher):
+    publisher.read()
+    camera = SharedMemoryCamera(SharedMemoryCameraConfig(name=publisher.config.shared_memory_name))
+    camera.connect()
+
+    with pytest.raises(DeviceAlreadyConnectedError):
+        camera.connect()
+    camera.disconnect()
+
+
+def test_connect_invalid_size(publisher):
+    config = SharedMemoryCameraConfig(name=publisher.config.shared_memory_name, width=640, height=480)
+    camera = SharedMemoryCamera(config)
+
+    with pytest.raises(RuntimeError):
+        camera.connect(warmup=False)
+    assert not camera.is_connected
+
+
+def test_connect_nothing_published():
+    config = SharedMemoryCameraConfig(name="lerobot_test_camera_missing", connect_timeout_s=0.1)
+    camera = SharedMemoryCamera(config)
+
+    with pytest.raises(ConnectionError):
+        camera.connect()
+
+
+def test_read_before_connect():
+    camera = SharedMemoryCamera(SharedMemoryCameraConfig(name="lerobot_test_camera"))
+
+    with pytest.raises(DeviceNotConnectedError):
+        camera.read()
+    with pytest.raises(DeviceNotConnectedError):
+        camera.disconnect()
+
+
+def test_publisher_disconnect_removes_buffer(publisher):
+    name = publisher.config.shared_memory_name
+    assert name in [cam["name"] for cam in SharedMemoryCamera.find_cameras()]
+
+    publisher.disconnect()
+    assert name not in [cam["name"] for cam in SharedMemoryCamera.find_cameras()]
@@ -19,12 +19,16 @@ import numpy as np
 import pytest
 
 from lerobot.common.datasets.compute_stats import (
+    QUANTILES,
+    RunningImageStats,
     _assert_type_and_shape,
     aggregate_feature_stats,
+    aggregate_quantiles,
     aggregate_stats,
     compute_episode_stats,
     estimate_num_samples,
     get_feature_stats,
+    get_quantile_key,
     sample_images,
     sample_indices,
 )
@@ -155,6 +159,61 @@ def test_compute_episode_stats():
     assert stats["observation.image"]["mean"].shape == (3, 1, 1)
 
 
+def test_running_image_stats():
+    images = np.random.randint(0, 256, (10, 3, 32, 32), dtype=np.uint8)
+    running = RunningImageStats()
+    for img in images:
+        running.update(img)
+    stats = running.get_stats()
+
+    expected = get_feature_stats(images, axis=(0, 2, 3), keepdims=True)
+    assert stats.keys() == expected.keys()
+    for key in ["min", "max", "mean", "std", *[get_quantile_key(q) for q in QUANTILES]]:
+        assert stats[key].shape == (3, 1, 1)
+        np.testing.assert_allclose(stats[key], np.squeeze(expected[key] / 255.0, axis=0))
+    np.testing.assert_array_equal(stats["count"], np.array([10]))
+
+
+def test_compute_episode_stats_in_memory_frames():
+    images = np.random.randint(0, 256, (20, 3, 32, 32), dtype=np.uint8)
+    features = {f"observation.images.{i}": {"dtype": "image"} for i in range(3)}
+    episode_data = {
+        # uint8 channel first, uint8 channel last and float channel first frames of the same images
+        "observation.images.0": images,
+        "observation.images.1": list(images.transpose(0, 2, 3, 1)),
+        "observation.images.2": images.astype(np.float32) / 255.0,
+    }
+    paths = [f"image_{i}.png" for i in range(20)]
+    with patch(
+        "lerobot.common.datasets.compute_stats.load_image_as_numpy",
+        side_effect=lambda path, dtype, channel_first: images[paths.index(path)],
+    ):
+        expected = compute_episode_stats({"observation.images.0": paths}, features)["observation.images.0"]
+
+    for num_workers in [0, 2]:
+        stats = compute_episode_stats(episode_data, features, num_workers=num_workers)
+        for key in episode_data:
+            for stat, value in expected.items():
+                np.testing.assert_allclose(stats[key][stat], value, err_msg=f"{key} {stat}")
+
+
+def test_aggregate_quantiles():
+    rng = np.random.default_rng(0)
+    episodes = [rng.normal(i, 1.0, (1000, 2)) for i in range(4)]
+    stats_ft_list = [get_feature_stats(ep, axis=0, keepdims=False) for ep in episodes]
+
+    # A single set keeps its own quantiles
+    for key, value in aggregate_quantiles(stats_ft_list[:1]).items():
+        np.testing.assert_allclose(value, stats_ft_list[0][key])
+
+    expected = get_feature_stats(np.concatenate(episodes), axis=0, keepdims=False)
+    result = aggregate_quantiles(stats_ft_list)
+    for q in QUANTILES:
+        key = get_quantile_key(q)
+        assert result[key].shape == (2,)
+        np.testing.assert_allclose(result[key], expected[key], atol=0.3)
+
+
 def test_assert_type_and_shape_valid():
     valid_stats = [
         {
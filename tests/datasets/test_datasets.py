@@ -28,6 +28,8 @@ from PIL import Image
 from safetensors.torch import load_file
 
 import lerobot
+from lerobot.common.datasets import lerobot_dataset
+from lerobot.common.datasets.compute_stats import aggregate_stats
 from lerobot.common.datasets.factory import make_dataset
 from lerobot.common.datasets.image_writer import image_array_to_pil_image
 from lerobot.common.datasets.lerobot_dataset import (
@@ -306,6 +308,236 @@ def test_add_frame_image_pil(image_dataset):
     assert dataset[0]["image"].shape == torch.Size(DUMMY_CHW)
 
 
+@pytest.fixture
+def streaming_video_dataset(tmp_path, empty_lerobot_dataset_factory):
+    features = {
+        "image": {
+            "dtype": "video",
+            "shape": DUMMY_HWC,
+            "names": ["height", "width", "channels"],
+        }
+    }
+    return empty_lerobot_dataset_factory(
+        root=tmp_path / "test", features=features, streaming_encoding=True, video_backend="pyav"
+    )
+
+
+def test_add_frame_streaming_video(streaming_video_dataset):
+    dataset = streaming_video_dataset
+    for _ in range(5):
+        dataset.add_frame({"image": np.random.randint(0, 256, DUMMY_HWC, dtype=np.uint8)}, task="Dummy task")
+    dataset.save_episode()
+
+    assert not (dataset.root / "images").exists()
+    assert (dataset.root / dataset.meta.get_video_file_path(0, "image")).is_file()
+    assert dataset.meta.episodes_stats[0]["image"]["mean"].shape == (3, 1, 1)
+    assert dataset.meta.episodes_stats[0]["image"]["count"] == np.array([5])
+    assert dataset.video_encoders == {}
+    assert dataset[4]["image"].shape == torch.Size(DUMMY_CHW)
+
+
+def test_clear_episode_buffer_streaming_video(streaming_video_dataset):
+    dataset = streaming_video_dataset
+    dataset.add_frame({"image": np.random.rand(*DUMMY_HWC)}, task="Dummy task")
+    video_path = dataset.video_encoders["image"].video_path
+    dataset.clear_episode_buffer()
+
+    assert dataset.video_encoders == {}
+    assert not video_path.exists()
+
+
+def test_frame_store(tmp_path, streaming_video_dataset):
+    recorded = streaming_video_dataset
+    for num_frames in [5, 3]:
+        for _ in range(num_frames):
+            image = np.random.randint(0, 256, DUMMY_HWC, dtype=np.uint8)
+            recorded.add_frame({"image": image}, task="Dummy task")
+        recorded.save_episode()
+
+    decoded = LeRobotDataset(recorded.repo_id, root=recorded.root, video_backend="pyav")
+    stored = LeRobotDataset(
+        recorded.repo_id,
+        root=recorded.root,
+        video_backend="pyav",
+        frame_store=True,
+        frame_store_dir=tmp_path / "frame_store",
+    )
+    assert len(stored.frame_store.episodes) == 2
+    for idx in range(len(decoded)):
+        torch.testing.assert_close(stored[idx]["image"], decoded[idx]["image"])
+
+
+def test_getitems_matches_getitem(tmp_path, empty_lerobot_dataset_factory):
+    features = {
+        "state": {"dtype": "float32", "shape": (2,), "names": None},
+        "image": {"dtype": "image", "shape": DUMMY_HWC, "names": ["height", "width", "channels"]},
+        "video": {"dtype": "video", "shape": DUMMY_HWC, "names": ["height", "width", "channels"]},
+    }
+    recorded = empty_lerobot_dataset_factory(
+        root=tmp_path / "test", features=features, streaming_encoding=True, video_backend="pyav"
+    )
+    for num_frames in [6, 4]:
+        for _ in range(num_frames):
+            frame = {
+                "state": np.random.rand(2).astype(np.float32),
+                "image": np.random.randint(0, 256, DUMMY_HWC, dtype=np.uint8),
+                "video": np.random.randint(0, 256, DUMMY_HWC, dtype=np.uint8),
+            }
+            recorded.add_frame(frame, task="Dummy task")
+        recorded.save_episode()
+
+    delta_timestamps = {key: [-1 / 30, 0.0, 2 / 30] for key in ["state", "image", "video"]}
+    dataset = LeRobotDataset(
+        recorded.repo_id, root=recorded.root, delta_timestamps=delta_timestamps, video_backend="pyav"
+    )
+    indices = [0, 5, 6, 3, 9, 4, 4]
+    batch = dataset.__getitems__(indices)
+
+    assert len(batch) == len(indices)
+    for idx, item in zip(indices, batch, strict=True):
+        expected = dataset[idx]
+        assert item.keys() == expected.keys()
+        for key, value in expected.items():
+            if isinstance(value, torch.Tensor):
+                assert item[key].dtype == value.dtype, key
+                torch.testing.assert_close(item[key], value)
+            else:
+                assert item[key] == value
+
+
+def test_tensor_cache(tmp_path, empty_lerobot_dataset_factory):
+    features = {"state": {"dtype": "float32", "shape": (2,), "names": None}}
+    recorded = empty_lerobot_dataset_factory(root=tmp_path / "test", features=features)
+    for num_frames in [6, 4]:
+        for _ in range(num_frames):
+            recorded.add_frame({"state": np.random.rand(2).astype(np.float32)}, task="Dummy task")
+        recorded.save_episode()
+
+    delta_timestamps = {"state": [-2 / 30, 0.0, 3 / 30]}
+    uncached = LeRobotDataset(recorded.repo_id, root=recorded.root, delta_timestamps=delta_timestamps)
+    cached = LeRobotDataset(
+        recorded.repo_id, root=recorded.root, delta_timestamps=delta_timestamps, tensor_cache=True
+    )
+    assert set(cached.tensor_cache.columns) == set(cached.hf_dataset.column_names)
+    for idx in range(len(uncached)):
+        expected = uncached[idx]
+        item = cached[idx]
+        assert item.keys() == expected.keys()
+        for key, value in expected.items():
+            if isinstance(value, torch.Tensor):
+                assert item[key].dtype == value.dtype, key
+                torch.testing.assert_close(item[key], value)
+
+    # Saved episodes are added to the cache
+    cached = LeRobotDataset(recorded.repo_id, root=recorded.root, tensor_cache=True)
+    cached.add_frame({"state": np.random.rand(2).astype(np.float32)}, task="Dummy task")
+    cached.save_episode()
+    assert cached[10]["index"] == 10
+    assert len(cached.tensor_cache) == 11
+
+
+def test_recompute_stats(tmp_path, empty_lerobot_dataset_factory):
+    features = {
+        "state": {"dtype": "float32", "shape": (2,), "names": None},
+        "image": {"dtype": "image", "shape": DUMMY_HWC, "names": ["height", "width", "channels"]},
+        "video": {"dtype": "video", "shape": DUMMY_HWC, "names": ["height", "width", "channels"]},
+    }
+    recorded = empty_lerobot_dataset_factory(
+        root=tmp_path / "test", features=features, streaming_encoding=True, video_backend="pyav"
+    )
+    for num_frames in [6, 4]:
+        for _ in range(num_frames):
+            frame = {
+                "state": np.random.rand(2).astype(np.float32),
+                "image": np.random.randint(0, 256, DUMMY_HWC, dtype=np.uint8),
+                "video": np.full(DUMMY_HWC, 128, dtype=np.uint8),
+            }
+            recorded.add_frame(frame, task="Dummy task")
+        recorded.save_episode()
+
+    dataset = LeRobotDataset(recorded.repo_id, root=recorded.root, video_backend="pyav")
+    stats = dataset.recompute_stats(num_workers=2)
+    assert stats["state"]["q50"].shape == (2,)
+    assert stats["image"]["q99"].shape == (3, 1, 1)
+    for ep_idx, expected in recorded.meta.episodes_stats.items():
+        recomputed = dataset.meta.episodes_stats[ep_idx]
+        for key in ["state", "image", "index"]:
+            for stat, value in expected[key].items():
+                np.testing.assert_allclose(recomputed[key][stat], value, rtol=1e-6, err_msg=f"{key} {stat}")
+        # Lossy video compression of a constant frame
+        np.testing.assert_allclose(recomputed["video"]["mean"], expected["video"]["mean"], atol=2 / 255)
+
+    reloaded = LeRobotDataset(recorded.repo_id, root=recorded.root, video_backend="pyav")
+    for stat, value in stats["state"].items():
+        np.testing.assert_allclose(reloaded.meta.stats["state"][stat], value)
+
+
+def test_save_episode_stats(tmp_path, empty_lerobot_dataset_factory, monkeypatch):
+    features = {"state": {"dtype": "float32", "shape": (2,), "names": None}}
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "test", features=features)
+    quantile_calls = []
+
+    def aggregate_quantiles(stats_ft_list):
+        quantile_calls.append(len(stats_ft_list))
+        return aggregate_quantiles_fn(stats_ft_list)
+
+    aggregate_quantiles_fn = lerobot_dataset.aggregate_quantiles
+    monkeypatch.setattr(lerobot_dataset, "aggregate_quantiles", aggregate_quantiles)
+
+    for num_frames in [5, 8, 3]:
+        for _ in range(num_frames):
+            dataset.add_frame({"state": np.random.rand(2).astype(np.float32)}, task="Dummy task")
+        dataset.save_episode()
+    # Quantiles are only aggregated when the stats are read, once
+    assert quantile_calls == []
+
+    expected = aggregate_stats(list(dataset.meta.episodes_stats.values()))
+    for key in ["state", "index"]:
+        assert dataset.meta.stats[key].keys() == expected[key].keys()
+        for stat, value in expected[key].items():
+            np.testing.assert_allclose(
+                dataset.meta.stats[key][stat], value, rtol=1e-6, err_msg=f"{key} {stat}"
+            )
+    assert dataset.meta.stats["state"]["count"] == np.array([16])
+    # Once per feature, however many times the stats were read
+    assert len(quantile_calls) == len(expected)
+
+
+def test_save_episode_async(tmp_path, empty_lerobot_dataset_factory):
+    features = {"state": {"dtype": "float32", "shape": (1,), "names": None}}
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "test", features=features, async_save=True)
+    futures = []
+    for ep_idx in range(3):
+        for _ in range(ep_idx + 1):
+            dataset.add_frame({"state": torch.randn(1)}, task="Dummy task")
+        futures.append(dataset.save_episode())
+        assert dataset.episode_buffer["episode_index"] == ep_idx + 1
+
+    dataset.stop_episode_saver()
+    assert all(future.done() for future in futures)
+    assert dataset.episode_saver is None
+    assert dataset.meta.total_episodes == 3
+    assert dataset.meta.total_frames == 6
+    assert dataset.hf_dataset["index"][-1] == 5
+    assert dataset.hf_dataset["episode_index"][-1] == 2
+
+
+def test_hf_dataset_concatenated_on_access(tmp_path, empty_lerobot_dataset_factory):
+    features = {"state": {"dtype": "float32", "shape": (1,), "names": None}}
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "test", features=features)
+    for _ in range(3):
+        for _ in range(2):
+            dataset.add_frame({"state": torch.randn(1)}, task="Dummy task")
+        dataset.save_episode()
+
+    assert len(dataset._new_episode_tables) == 3
+    assert dataset.num_frames == 6
+    assert len(dataset.hf_dataset) == 6
+    assert dataset._new_episode_tables == []
+    assert dataset[5]["index"] == 5
+    assert dataset.meta.total_videos == 0
+
+
 def test_image_array_to_pil_image_wrong_range_float_0_255():
     image = np.random.rand(*DUMMY_HWC) * 255
     with pytest.raises(ValueError):
@@ -0,0 +1,45 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+
+from lerobot.common.datasets.episode_buffer import GrowableArray
+
+
+def test_append_and_grow():
+    column = GrowableArray((2,), "float32", capacity=2)
+    rows = [np.array([i, -i], dtype=np.float32) for i in range(5)]
+    for row in rows:
+        column.append(row)
+
+    assert len(column) == 5
+    assert column.capacity == 8
+    np.testing.assert_array_equal(column.array, np.stack(rows))
+    np.testing.assert_array_equal(column[-1], rows[-1])
+
+
+def test_array_is_a_view():
+    column = GrowableArray((), "int64")
+    for i in range(3):
+        column.append(i)
+
+    assert column.array.shape == (3,)
+    assert np.shares_memory(column.array, column._data)
+
+
+def test_matches():
+    column = GrowableArray((6,), "float32")
+    assert column.matches(np.zeros(6, dtype=np.float32))
+    assert not column.matches(np.zeros(6, dtype=np.float64))
+    assert not column.matches(np.zeros((1, 6), dtype=np.float32))
+    assert not column.matches([0.0] * 6)
@@ -0,0 +1,160 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import threading
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from lerobot.common.datasets.episode_saver import AsyncEpisodeSaver
+from lerobot.common.datasets.image_writer import write_image
+from lerobot.common.datasets.utils import TASKS_PATH
+from tests.fixtures.constants import DUMMY_HWC
+
+
+def test_submit_reserves_indices():
+    saver = AsyncEpisodeSaver(total_episodes=3, total_frames=100)
+    release = threading.Event()
+    try:
+        future = saver.submit(20, release.wait)
+        assert saver.next_episode_index == 4
+        assert saver.next_frame_index == 120
+        assert saver.num_pending == 1
+        release.set()
+        future.result(timeout=1)
+    finally:
+        release.set()
+        saver.stop()
+
+
+def test_episodes_finalized_in_order():
+    saver = AsyncEpisodeSaver(total_episodes=0, total_frames=0)
+    finalized = []
+    for i in range(5):
+        saver.submit(1, finalized.append, i)
+    saver.wait_until_done()
+    saver.stop()
+    assert finalized == list(range(5))
+
+
+def test_error_raised_on_next_call():
+    saver = AsyncEpisodeSaver(total_episodes=0, total_frames=0)
+
+    def fail():
+        raise OSError("disk full")
+
+    saver.submit(1, fail).exception(timeout=1)
+    with pytest.raises(RuntimeError) as excinfo:
+        saver.submit(1, lambda: None)
+    assert isinstance(excinfo.value.__cause__, OSError)
+    with pytest.raises(RuntimeError):
+        saver.stop()
+
+
+def test_episodes_after_error_not_finalized():
+    saver = AsyncEpisodeSaver(total_episodes=0, total_frames=0)
+    release = threading.Event()
+    finalized = []
+
+    def fail():
+        release.wait()
+        raise OSError("disk full")
+
+    saver.submit(1, fail)
+    future = saver.submit(1, finalized.append, 1)
+    release.set()
+    with pytest.raises(RuntimeError):
+        future.result(timeout=1)
+    assert finalized == []
+    with pytest.raises(RuntimeError):
+        saver.stop()
+
+
+def test_new_task_while_saving_previous_episode(tmp_path, empty_lerobot_dataset_factory):
+    features = {"state": {"dtype": "float32", "shape": (1,), "names": None}}
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "test", features=features, async_save=True)
+    saving = threading.Event()
+    release = threading.Event()
+    save_episode_meta = dataset.meta.save_episode
+
+    def slow_save_episode_meta(*args, **kwargs):
+        saving.set()
+        release.wait(timeout=5)
+        save_episode_meta(*args, **kwargs)
+
+    try:
+        with patch.object(dataset.meta, "save_episode", side_effect=slow_save_episode_meta):
+            for _ in range(2):
+                dataset.add_frame({"state": np.zeros(1, dtype=np.float32)}, task="Pick")
+            dataset.save_episode()
+            assert saving.wait(timeout=5)
+
+            for _ in range(3):
+                dataset.add_frame({"state": np.ones(1, dtype=np.float32)}, task="Place")
+            dataset.save_episode()
+            # The new task is only added to the metadata by the episode saver's thread
+            assert dataset.meta.tasks == {0: "Pick"}
+
+            release.set()
+            dataset.stop_episode_saver()
+    finally:
+        release.set()
+        dataset.stop_episode_saver()
+
+    assert dataset.meta.tasks == {0: "Pick", 1: "Place"}
+    assert dataset.meta.total_tasks == 2
+    with open(dataset.root / TASKS_PATH) as f:
+        assert [json.loads(line)["task"] for line in f] == ["Pick", "Place"]
+    assert dataset.hf_dataset["task_index"] == [0, 0, 1, 1, 1]
+
+
+def test_finalize_doesnt_wait_for_next_episode_images(tmp_path, empty_lerobot_dataset_factory):
+    features = {"image": {"dtype": "image", "shape": DUMMY_HWC, "names": ["height", "width", "channels"]}}
+    dataset = empty_lerobot_dataset_factory(
+        root=tmp_path / "test", features=features, async_save=True, image_writer_threads=2
+    )
+    release = threading.Event()
+    next_frame_added = threading.Event()
+    wait_image_writer = dataset._wait_image_writer
+
+    def blocking_write_image(image, fpath):
+        if fpath.parent.name == "episode_000001":
+            release.wait(timeout=10)
+        write_image(image, fpath)
+
+    def wait_image_writer_after_next_frame(*args):
+        next_frame_added.wait(timeout=5)
+        wait_image_writer(*args)
+
+    try:
+        with (
+            patch("lerobot.common.datasets.image_writer.write_image", side_effect=blocking_write_image),
+            patch.object(dataset, "_wait_image_writer", side_effect=wait_image_writer_after_next_frame),
+        ):
+            frame = {"image": np.zeros(DUMMY_HWC, dtype=np.uint8)}
+            for _ in range(2):
+                dataset.add_frame(frame, task="Dummy task")
+            future = dataset.save_episode()
+            # The images of the episode being recorded can't be written yet
+            dataset.add_frame(frame, task="Dummy task")
+            next_frame_added.set()
+
+            future.result(timeout=5)
+            assert dataset.meta.total_episodes == 1
+            release.set()
+    finally:
+        release.set()
+        dataset.stop_episode_saver()
+        dataset.stop_image_writer()
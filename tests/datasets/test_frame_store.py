@@ -0,0 +1,87 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import pickle
+
+import pytest
+import torch
+
+from lerobot.common.datasets.frame_store import DecodedFrameStore, build_frame_store
+from lerobot.common.datasets.video_utils import decode_video_frames
+from tests.datasets.test_video_utils import FPS, NUM_FRAMES, write_video
+from tests.fixtures.constants import DUMMY_HWC
+
+
+@pytest.fixture
+def videos(tmp_path):
+    return {(i, "cam"): (write_video(tmp_path / f"episode_{i}.mp4"), NUM_FRAMES) for i in range(2)}
+
+
+def test_frames_match_decoded_video(tmp_path, videos):
+    store = build_frame_store(tmp_path / "store", "v2.1", videos)
+    for (ep_idx, key), (path, _) in videos.items():
+        timestamps = [0.0, 10 / FPS, 11 / FPS, 44 / FPS]
+        expected = decode_video_frames(path, timestamps, 1e-4, backend="pyav")
+        frames = store.get_frames(ep_idx, key, timestamps, 1e-4)
+        assert frames.dtype == torch.uint8
+        torch.testing.assert_close(frames.type(torch.float32) / 255, expected)
+
+
+def test_consecutive_frames_are_views(tmp_path, videos):
+    store = build_frame_store(tmp_path / "store", "v2.1", videos)
+    frames = store.get_frames(0, "cam", [5 / FPS, 6 / FPS, 7 / FPS], 1e-4)
+    mapped = store._arrays["cam/episode_000000"]
+    assert frames.data_ptr() == mapped[5:].ctypes.data
+
+
+def test_timestamp_outside_tolerance(tmp_path, videos):
+    store = build_frame_store(tmp_path / "store", "v2.1", videos)
+    with pytest.raises(AssertionError):
+        store.get_frames(0, "cam", [0.5 / FPS], 1e-4)
+
+
+def test_resolution(tmp_path, videos):
+    store = build_frame_store(tmp_path / "store", "v2.1", videos, resolution=(32, 48))
+    assert store.get_frames(1, "cam", [0.0], 1e-4).shape == (1, 3, 32, 48)
+
+
+def test_invalidation(tmp_path, videos):
+    store_dir = tmp_path / "store"
+    build_frame_store(store_dir, "v2.1", videos)
+    assert len(DecodedFrameStore(store_dir, "v2.1").episodes) == 2
+    assert len(DecodedFrameStore(store_dir, "v2.1", resolution=(32, 48)).episodes) == 0
+
+    build_frame_store(store_dir, "v2.1", videos)
+    assert len(DecodedFrameStore(store_dir, "main").episodes) == 0
+    assert not store_dir.exists()
+
+    # A video re-recorded after the store was built is decoded again
+    build_frame_store(store_dir, "v2.1", videos)
+    path = videos[(0, "cam")][0]
+    write_video(path)
+    os.utime(path, ns=(0, 0))
+    store = DecodedFrameStore(store_dir, "v2.1")
+    assert not store.is_stored(0, "cam", path)
+    assert store.is_stored(1, "cam", videos[(1, "cam")][0])
+
+
+def test_pickle_drops_memory_maps(tmp_path, videos):
+    store = build_frame_store(tmp_path / "store", "v2.1", videos)
+    store.get_frames(0, "cam", [0.0], 1e-4)
+
+    unpickled = pickle.loads(pickle.dumps(store))
+    assert unpickled._arrays == {}
+    frames = unpickled.get_frames(0, "cam", [0.0], 1e-4)
+    assert frames.shape == (1, 3, *DUMMY_HWC[:2])
+    torch.testing.assert_close(frames, store.get_frames(0, "cam", [0.0], 1e-4))
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import queue
+import threading
 import time
 from multiprocessing import queues
 from unittest.mock import MagicMock, patch
@@ -324,6 +325,32 @@ def test_wait_until_done_multiprocessing(tmp_path, img_array_factory):
         writer.stop()
 
 
+def test_wait_until_done_tag(tmp_path, img_array_factory):
+    release = threading.Event()
+
+    def blocking_write_image(image, fpath):
+        if fpath.name == "next_episode.png":
+            release.wait(timeout=5)
+        write_image(image, fpath)
+
+    with patch("lerobot.common.datasets.image_writer.write_image", side_effect=blocking_write_image):
+        writer = AsyncImageWriter(num_threads=2)
+        try:
+            writer.save_image(img_array_factory(), tmp_path / "next_episode.png", tag=1)
+            writer.save_image(img_array_factory(), tmp_path / "episode.png", tag=0)
+            # Doesn't wait for the images of other tags
+            writer.wait_until_done(0)
+            assert (tmp_path / "episode.png").exists()
+            assert not (tmp_path / "next_episode.png").exists()
+
+            release.set()
+            writer.wait_until_done(1)
+            assert (tmp_path / "next_episode.png").exists()
+        finally:
+            release.set()
+            writer.stop()
+
+
 def test_exception_handling(tmp_path, img_array_factory):
     writer = AsyncImageWriter()
     try:
@@ -0,0 +1,72 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import datasets
+import numpy as np
+import torch
+
+from lerobot.common.datasets.tensor_cache import TensorCache
+from lerobot.common.datasets.utils import hf_transform_to_torch
+
+
+def make_hf_dataset(num_rows: int = 10) -> datasets.Dataset:
+    features = datasets.Features(
+        {
+            "state": datasets.Sequence(datasets.Value("float32"), length=3),
+            "timestamp": datasets.Value("float64"),
+            "index": datasets.Value("int32"),
+            "done": datasets.Value("bool"),
+            "name": datasets.Value("string"),
+        }
+    )
+    hf_dataset = datasets.Dataset.from_dict(
+        {
+            "state": np.random.rand(num_rows, 3).astype(np.float32),
+            "timestamp": np.arange(num_rows) / 30,
+            "index": np.arange(num_rows, dtype=np.int32),
+            "done": np.arange(num_rows) == num_rows - 1,
+            "name": [f"row_{i}" for i in range(num_rows)],
+        },
+        features=features,
+    )
+    hf_dataset.set_transform(hf_transform_to_torch)
+    return hf_dataset
+
+
+def test_rows_match_hf_dataset():
+    hf_dataset = make_hf_dataset()
+    cache = TensorCache(hf_dataset)
+
+    assert len(cache) == 10
+    assert set(cache.columns) == {"state", "timestamp", "index", "done"}
+    assert all(values.is_shared() for values in cache.columns.values())
+    for idx in [0, 4, 9]:
+        row = cache.get_row(idx)
+        expected = hf_dataset[idx]
+        for key, value in row.items():
+            assert value.dtype == expected[key].dtype, key
+            torch.testing.assert_close(value, expected[key])
+
+
+def test_take():
+    hf_dataset = make_hf_dataset()
+    cache = TensorCache(hf_dataset.select([9, 2, 5]))
+
+    assert cache.take("index", [[0, 1], [2, 2]]).tolist() == [[9, 2], [5, 5]]
+    assert cache.take("state", np.array([1, 0])).shape == (2, 3)
+
+
+def test_get_row_copies():
+    cache = TensorCache(make_hf_dataset())
+    cache.get_row(0)["state"].zero_()
+    assert cache.columns["state"][0].abs().sum() > 0
@@ -0,0 +1,123 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pickle
+from dataclasses import asdict
+
+import numpy as np
+import pytest
+import torch
+
+from lerobot.common.datasets.video_utils import (
+    StreamingVideoEncoder,
+    VideoDecoderPool,
+    decode_video_frames,
+    get_video_encoding_config,
+    get_video_options,
+)
+from tests.fixtures.constants import DUMMY_HWC
+
+FPS = 30
+NUM_FRAMES = 45
+
+
+def write_video(path, num_frames: int = NUM_FRAMES):
+    encoder = StreamingVideoEncoder(path, FPS)
+    for i in range(num_frames):
+        frame = np.full(DUMMY_HWC, i * 5, dtype=np.uint8)
+        frame[i % DUMMY_HWC[0]] = 255
+        encoder.add_frame(frame)
+    return encoder.finish()
+
+
+@pytest.fixture
+def video_paths(tmp_path):
+    return [write_video(tmp_path / f"episode_{i}.mp4") for i in range(3)]
+
+
+def test_streaming_video_encoder(tmp_path):
+    path = write_video(tmp_path / "video.mp4", num_frames=10)
+    frames = decode_video_frames(path, [0.0, 9 / FPS], 1e-4, backend="pyav")
+    assert frames.shape == (2, 3, *DUMMY_HWC[:2])
+
+
+def test_get_video_options():
+    assert get_video_options("libsvtav1", g=2, crf=30, fast_decode=1, preset=10, threads=4) == {
+        "g": "2",
+        "crf": "30",
+        "preset": "10",
+        "svtav1-params": "fast-decode=1:lp=4",
+    }
+    assert get_video_options("h264", g=None, crf=23, fast_decode=1, tune="zerolatency", threads=2) == {
+        "crf": "23",
+        "threads": "2",
+        "tune": "zerolatency,fastdecode",
+    }
+    assert get_video_options("h264_nvenc", g=2, crf=23, fast_decode=0, preset="p1") == {
+        "g": "2",
+        "cq": "23",
+        "preset": "p1",
+    }
+
+
+@pytest.mark.parametrize("preset", ["svtav1-fast", "x264-ultrafast"])
+def test_streaming_video_encoder_presets(tmp_path, preset):
+    encoding = get_video_encoding_config(preset, threads=1)
+    encoder = StreamingVideoEncoder(tmp_path / "video.mp4", FPS, **asdict(encoding))
+    for i in range(5):
+        encoder.add_frame(np.full(DUMMY_HWC, i * 40, dtype=np.uint8))
+    path = encoder.finish()
+    frames = decode_video_frames(path, [4 / FPS], 1e-4, backend="pyav")
+    assert frames.shape == (1, 3, *DUMMY_HWC[:2])
+    assert abs(frames.mean().item() - 160 / 255) < 0.02
+
+
+def test_unknown_video_encoding_preset():
+    with pytest.raises(ValueError):
+        get_video_encoding_config("libfoo")
+
+
+def test_decoder_pool_matches_decode_video_frames(video_paths):
+    pool = VideoDecoderPool("pyav", max_cached_frames=8, max_forward_frames=4)
+    queries = [[0.0], [1.0], [0.5, 0.6], [44 / FPS], [0.1], [1.0, 31 / FPS], [2 / FPS]]
+    for path in video_paths:
+        for timestamps in queries:
+            expected = decode_video_frames(path, timestamps, 1e-4, backend="pyav")
+            torch.testing.assert_close(pool.decode(path, timestamps, 1e-4), expected)
+
+
+def test_decoder_pool_eviction(video_paths):
+    pool = VideoDecoderPool("pyav", max_open_decoders=2, max_cached_frames=4)
+    for path in video_paths:
+        pool.decode(path, [0.0, 0.2], 1e-4)
+
+    assert list(pool._decoders) == [str(p) for p in video_paths[1:]]
+    assert len(pool._frames) == 4
+
+
+def test_decoder_pool_timestamp_beyond_video(video_paths):
+    pool = VideoDecoderPool("pyav")
+    with pytest.raises(IndexError):
+        pool.decode(video_paths[0], [NUM_FRAMES / FPS], 1e-4)
+
+
+def test_decoder_pool_starts_empty_in_other_process(video_paths):
+    pool = VideoDecoderPool("pyav")
+    pool.decode(video_paths[0], [0.0], 1e-4)
+
+    unpickled = pickle.loads(pickle.dumps(pool))
+    assert len(unpickled._decoders) == 0 and len(unpickled._frames) == 0
+
+    pool._pid = -1  # as if inherited by a forked DataLoader worker
+    pool.decode(video_paths[1], [0.0], 1e-4)
+    assert list(pool._decoders) == [str(video_paths[1])]
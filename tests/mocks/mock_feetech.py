@@ -377,6 +377,28 @@ class MockMotors(MockSerial):
         )
         return stub_name
 
+    def build_bulk_read_stub(self, registers: dict[tuple[int, int], dict[int, int]]) -> str:
+        """Sync read of the block spanning `registers`, a mapping (address, length) → ids_values."""
+        address = min(addr for addr, _ in registers)
+        length = max(addr + length for addr, length in registers) - address
+        ids = list(next(iter(registers.values())))
+        return_packets = b""
+        for id_ in ids:
+            params = [0] * length
+            for (addr, reg_length), ids_values in registers.items():
+                offset = addr - address
+                params[offset : offset + reg_length] = _split_into_byte_chunks(ids_values[id_], reg_length)
+            return_packets += MockStatusPacket.build(id_, params=params, length=length + 2)
+
+        sync_read_request = MockInstructionPacket.sync_read(ids, address, length)
+        stub_name = f"Bulk_Read_{address}_{length}_" + "_".join([str(id_) for id_ in ids])
+        self.stub(
+            name=stub_name,
+            receive_bytes=sync_read_request,
+            send_fn=self._build_send_fn(return_packets),
+        )
+        return stub_name
+
     def build_sequential_sync_read_stub(
         self, address: int, length: int, ids_values: dict[int, list[int]] | None = None
     ) -> str:
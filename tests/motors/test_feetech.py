@@ -295,6 +295,74 @@ def test__sync_read_comm(raise_on_error, mock_motors, dummy_motors):
     assert mock_motors.stubs[stub].called
 
 
+def test_sync_read_pipelined(mock_motors, dummy_motors):
+    addr, length = STS_SMS_SERIES_CONTROL_TABLE["Present_Position"]
+    ids_values = {1: [1337, 1338, 1339], 2: [42, 43, 44], 3: [4016, 4017, 4018]}
+    stub = mock_motors.build_sequential_sync_read_stub(addr, length, ids_values)
+    write_stub = mock_motors.build_write_stub(*STS_SMS_SERIES_CONTROL_TABLE["Lock"], 1, 0)
+    bus = FeetechMotorsBus(port=mock_motors.port, motors=dummy_motors)
+    bus.connect(handshake=False)
+
+    first = bus.sync_read("Present_Position", normalize=False, pipelined=True)
+    # The next request is sent before returning
+    assert mock_motors.stubs[stub].wait_calls(2) == 2
+    second = bus.sync_read("Present_Position", normalize=False, pipelined=True)
+    assert mock_motors.stubs[stub].wait_calls(3) == 3
+    # The pending response is received before writing
+    bus.write("Lock", "dummy_1", 0)
+
+    assert first == {f"dummy_{id_}": values[0] for id_, values in ids_values.items()}
+    assert second == {f"dummy_{id_}": values[1] for id_, values in ids_values.items()}
+    assert mock_motors.stubs[write_stub].called
+    assert bus._pending_sync_read is None
+    assert not bus.port_handler.is_using
+
+
+def test_sync_read_pipelined_with_sync_write(mock_motors, dummy_motors):
+    addr, length = STS_SMS_SERIES_CONTROL_TABLE["Present_Position"]
+    ids_values = {1: [1337, 1338, 1339], 2: [42, 43, 44], 3: [4016, 4017, 4018]}
+    stub = mock_motors.build_sequential_sync_read_stub(addr, length, ids_values)
+    goal_values = {1: 1000, 2: 2000, 3: 3000}
+    write_stub = mock_motors.build_sync_write_stub(
+        *STS_SMS_SERIES_CONTROL_TABLE["Goal_Position"], goal_values
+    )
+    bus = FeetechMotorsBus(port=mock_motors.port, motors=dummy_motors)
+    bus.connect(handshake=False)
+
+    first = bus.sync_read("Present_Position", normalize=False, pipelined=True)
+    # The pending response is received before writing, and used by the next read instead of a new request
+    bus.sync_write("Goal_Position", {f"dummy_{id_}": v for id_, v in goal_values.items()}, normalize=False)
+    second = bus.sync_read("Present_Position", normalize=False, pipelined=True)
+    assert mock_motors.stubs[stub].wait_calls(3) == 3
+    bus.disconnect(disable_torque=False)
+
+    assert first == {f"dummy_{id_}": values[0] for id_, values in ids_values.items()}
+    assert second == {f"dummy_{id_}": values[1] for id_, values in ids_values.items()}
+    assert mock_motors.stubs[write_stub].wait_called()
+    assert mock_motors.stubs[stub].calls == 3
+
+
+def test_bulk_read(mock_motors, dummy_motors):
+    registers = {
+        "Present_Position": {1: 1337, 2: 42, 3: 4016},
+        "Present_Velocity": {1: 12, 2: 0, 3: 345},
+        "Present_Current": {1: 100, 2: 7, 3: 250},
+    }
+    stub = mock_motors.build_bulk_read_stub(
+        {STS_SMS_SERIES_CONTROL_TABLE[name]: ids_values for name, ids_values in registers.items()}
+    )
+    bus = FeetechMotorsBus(port=mock_motors.port, motors=dummy_motors)
+    bus.connect(handshake=False)
+
+    values = bus.bulk_read(list(registers), normalize=False)
+
+    assert mock_motors.stubs[stub].calls == 1
+    assert values == {
+        name: {f"dummy_{id_}": value for id_, value in ids_values.items()}
+        for name, ids_values in registers.items()
+    }
+
+
 @pytest.mark.parametrize(
     "addr, length, ids_values",
     [
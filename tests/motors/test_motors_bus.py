@@ -1,10 +1,12 @@
 import re
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
 from lerobot.common.motors.motors_bus import (
     Motor,
+    MotorCalibration,
     MotorNormMode,
     assert_same_address,
     get_address,
@@ -193,6 +195,7 @@ def test_sync_read_by_str(data_name, id_, value, dummy_motors):
         num_retry=0,
         raise_on_error=True,
         err_msg=f"Failed to sync read '{data_name}' on {ids=} after 1 tries.",
+        pipelined=False,
     )
     mock__decode_sign.assert_called_once_with(data_name, {id_: value})
     if data_name in bus.normalized_data:
@@ -230,6 +233,7 @@ def test_sync_read_by_list(data_name, ids_values, dummy_motors):
         num_retry=0,
         raise_on_error=True,
         err_msg=f"Failed to sync read '{data_name}' on {ids=} after 1 tries.",
+        pipelined=False,
     )
     mock__decode_sign.assert_called_once_with(data_name, ids_values)
     if data_name in bus.normalized_data:
@@ -267,6 +271,7 @@ def test_sync_read_by_none(data_name, ids_values, dummy_motors):
         num_retry=0,
         raise_on_error=True,
         err_msg=f"Failed to sync read '{data_name}' on {ids=} after 1 tries.",
+        pipelined=False,
     )
     mock__decode_sign.assert_called_once_with(data_name, ids_values)
     if data_name in bus.normalized_data:
@@ -340,3 +345,173 @@ def test_sync_write_by_value_dict(data_name, ids_values, dummy_motors):
     mock__encode_sign.assert_called_once_with(data_name, ids_values)
     if data_name in bus.normalized_data:
         mock__unnormalize.assert_called_once_with(ids_values)
+
+
+def test_bulk_write(dummy_motors):
+    bus = MockMotorsBus("/dev/dummy-port", dummy_motors)
+    bus.connect(handshake=False)
+    goal_positions = {"dummy_1": 1337, "dummy_2": 42, "dummy_3": 4016}
+
+    with (
+        patch.object(MockMotorsBus, "_sync_write", return_value=0) as mock__sync_write,
+        patch.object(MockMotorsBus, "_encode_sign", side_effect=lambda _, ids_values: ids_values),
+        patch.object(MockMotorsBus, "_serialize_data", side_effect=lambda value, length: [value] * length),
+    ):
+        # Written in the order of the control table, whatever the order of the values
+        bus.bulk_write({"Goal_Velocity": 7, "Goal_Position": goal_positions}, normalize=False)
+
+    addr, _ = DUMMY_CTRL_TABLE_2["Goal_Position"]
+    ids_data = {id_: [pos] * 4 + [7] * 4 for id_, pos in zip([1, 2, 3], goal_positions.values(), strict=True)}
+    mock__sync_write.assert_called_once_with(
+        addr,
+        8,
+        ids_data,
+        num_retry=0,
+        raise_on_error=True,
+        err_msg="Failed to sync write ['Goal_Velocity', 'Goal_Position'] on ids=[1, 2, 3] after 1 tries.",
+    )
+
+
+def test_bulk_write_not_contiguous(dummy_motors):
+    bus = MockMotorsBus("/dev/dummy-port", dummy_motors)
+    bus.connect(handshake=False)
+
+    with pytest.raises(ValueError, match="aren't contiguous"):
+        bus.bulk_write({"Present_Position": 0, "Goal_Position": 0})
+
+
+def test_bulk_write_different_motors(dummy_motors):
+    bus = MockMotorsBus("/dev/dummy-port", dummy_motors)
+    bus.connect(handshake=False)
+
+    with pytest.raises(ValueError, match="same motors"):
+        bus.bulk_write({"Goal_Position": {"dummy_1": 0}, "Goal_Velocity": 0})
+
+
+def reference_normalize(bus, ids_values):
+    """Normalization of one motor at a time, as the vectorized implementation should compute it."""
+    normalized = {}
+    for id_, val in ids_values.items():
+        motor = bus._id_to_name(id_)
+        cal = bus.calibration[motor]
+        min_, max_ = cal.range_min, cal.range_max
+        drive_mode = bus.apply_drive_mode and cal.drive_mode
+        bounded_val = min(max_, max(min_, val))
+        if bus.motors[motor].norm_mode is MotorNormMode.RANGE_M100_100:
+            norm = (((bounded_val - min_) / (max_ - min_)) * 200) - 100
+            normalized[id_] = -norm if drive_mode else norm
+        elif bus.motors[motor].norm_mode is MotorNormMode.RANGE_0_100:
+            norm = ((bounded_val - min_) / (max_ - min_)) * 100
+            normalized[id_] = 100 - norm if drive_mode else norm
+        else:
+            max_res = bus.model_resolution_table[bus._id_to_model(id_)] - 1
+            normalized[id_] = (val - (min_ + max_) / 2) * 360 / max_res
+    return normalized
+
+
+def reference_unnormalize(bus, ids_values):
+    unnormalized = {}
+    for id_, val in ids_values.items():
+        motor = bus._id_to_name(id_)
+        cal = bus.calibration[motor]
+        min_, max_ = cal.range_min, cal.range_max
+        drive_mode = bus.apply_drive_mode and cal.drive_mode
+        if bus.motors[motor].norm_mode is MotorNormMode.RANGE_M100_100:
+            val = -val if drive_mode else val
+            bounded_val = min(100.0, max(-100.0, val))
+            unnormalized[id_] = int(((bounded_val + 100) / 200) * (max_ - min_) + min_)
+        elif bus.motors[motor].norm_mode is MotorNormMode.RANGE_0_100:
+            val = 100 - val if drive_mode else val
+            bounded_val = min(100.0, max(0.0, val))
+            unnormalized[id_] = int((bounded_val / 100) * (max_ - min_) + min_)
+        else:
+            max_res = bus.model_resolution_table[bus._id_to_model(id_)] - 1
+            unnormalized[id_] = int((val * max_res / 360) + (min_ + max_) / 2)
+    return unnormalized
+
+
+@pytest.fixture
+def calibrated_bus():
+    motors = {
+        "m100_100": Motor(1, "model_2", MotorNormMode.RANGE_M100_100),
+        "m100_100_inverted": Motor(2, "model_3", MotorNormMode.RANGE_M100_100),
+        "range_0_100": Motor(3, "model_2", MotorNormMode.RANGE_0_100),
+        "range_0_100_inverted": Motor(4, "model_3", MotorNormMode.RANGE_0_100),
+        "degrees": Motor(5, "model_3", MotorNormMode.DEGREES),
+    }
+    bus = MockMotorsBus("/dev/dummy-port", motors)
+    bus.apply_drive_mode = True
+    bus.calibration = {
+        motor: MotorCalibration(
+            m.id,
+            drive_mode=int("inverted" in motor),
+            homing_offset=0,
+            range_min=m.id * 100,
+            range_max=4000 - m.id * 50,
+        )
+        for motor, m in motors.items()
+    }
+    return bus
+
+
+def test_normalize_matches_reference(calibrated_bus):
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        values = rng.integers(-100, 4200, len(calibrated_bus.ids))
+        ids_values = {id_: int(v) for id_, v in zip(calibrated_bus.ids, values, strict=True)}
+        assert calibrated_bus._normalize(ids_values) == reference_normalize(calibrated_bus, ids_values)
+
+
+def test_unnormalize_matches_reference(calibrated_bus):
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        values = rng.uniform(-120, 120, len(calibrated_bus.ids))
+        ids_values = {id_: float(v) for id_, v in zip(calibrated_bus.ids, values, strict=True)}
+        unnormalized = calibrated_bus._unnormalize(ids_values)
+        assert unnormalized == reference_unnormalize(calibrated_bus, ids_values)
+        assert all(type(value) is int for value in unnormalized.values())
+
+    # A subset of the motors, in a different order
+    ids_values = {5: 12.5, 3: 50.0}
+    assert calibrated_bus._unnormalize(ids_values) == reference_unnormalize(calibrated_bus, ids_values)
+
+
+def test_normalize_invalid_calibration(calibrated_bus):
+    calibrated_bus.calibration = {
+        **calibrated_bus.calibration,
+        "degrees": MotorCalibration(5, drive_mode=0, homing_offset=0, range_min=10, range_max=10),
+    }
+    assert 1 in calibrated_bus._normalize({1: 2000})
+    with pytest.raises(ValueError, match="Invalid calibration for motor 'degrees'"):
+        calibrated_bus._normalize({1: 2000, 5: 2000})
+
+
+def test_normalize_without_calibration(dummy_motors):
+    bus = MockMotorsBus("/dev/dummy-port", dummy_motors)
+    with pytest.raises(RuntimeError, match="has no calibration registered"):
+        bus._normalize({1: 2000})
+
+
+def test_sync_reader_setup_is_reused(dummy_motors):
+    bus = MockMotorsBus("/dev/dummy-port", dummy_motors)
+    bus.sync_reader = MagicMock()
+
+    bus._setup_sync_reader([1, 2], 3, 4)
+    bus._setup_sync_reader([1, 2], 3, 4)
+    assert bus.sync_reader.clearParam.call_count == 1
+    assert bus.sync_reader.addParam.call_count == 2
+
+    bus._setup_sync_reader([1, 3], 3, 4)
+    assert bus.sync_reader.clearParam.call_count == 2
+
+
+def test_sync_writer_setup_is_reused(dummy_motors):
+    bus = MockMotorsBus("/dev/dummy-port", dummy_motors)
+    bus.sync_writer = MagicMock()
+
+    with patch.object(MockMotorsBus, "_serialize_data", side_effect=lambda value, length: [value]):
+        bus._setup_sync_writer({1: 10, 2: 20}, 11, 4)
+        bus._setup_sync_writer({1: 30, 2: 40}, 11, 4)
+    assert bus.sync_writer.clearParam.call_count == 1
+    bus.sync_writer.changeParam.assert_any_call(1, [30])
+    bus.sync_writer.changeParam.assert_any_call(2, [40])
@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+
+# Copyright 2024 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+from lerobot.common.policies.act.configuration_act import ACTConfig
+from lerobot.common.policies.act.modeling_act import ACTPolicy
+from lerobot.common.policies.registry import CachedBackbone, PolicyRegistry
+from lerobot.configs.types import FeatureType, NormalizationMode, PolicyFeature
+
+IMAGE_SHAPE = (3, 64, 64)
+
+
+def make_act_policy(seed: int, cameras: tuple[str, ...] = ("top",)) -> ACTPolicy:
+    config = ACTConfig(
+        device="cpu",
+        pretrained_backbone_weights=None,
+        chunk_size=4,
+        n_action_steps=4,
+        dim_model=32,
+        dim_feedforward=64,
+        n_encoder_layers=1,
+        n_decoder_layers=1,
+        use_vae=False,
+        normalization_mapping={
+            "VISUAL": NormalizationMode.IDENTITY,
+            "STATE": NormalizationMode.IDENTITY,
+            "ACTION": NormalizationMode.IDENTITY,
+        },
+        input_features={
+            "observation.state": PolicyFeature(type=FeatureType.STATE, shape=(2,)),
+            **{
+                f"observation.images.{camera}": PolicyFeature(type=FeatureType.VISUAL, shape=IMAGE_SHAPE)
+                for camera in cameras
+            },
+        },
+        output_features={"action": PolicyFeature(type=FeatureType.ACTION, shape=(2,))},
+    )
+    torch.manual_seed(seed)
+    return ACTPolicy(config)
+
+
+def make_batch(cameras: tuple[str, ...] = ("top",)) -> dict[str, torch.Tensor]:
+    return {
+        "observation.state": torch.rand(1, 2),
+        **{f"observation.images.{camera}": torch.rand(1, *IMAGE_SHAPE) for camera in cameras},
+    }
+
+
+def count_backbone_calls(backbone: CachedBackbone) -> list[int]:
+    calls = [0]
+
+    def hook(*_):
+        calls[0] += 1
+
+    backbone.module.register_forward_hook(hook)
+    return calls
+
+
+def test_registry_shares_identical_backbones():
+    move, cut = make_act_policy(seed=0), make_act_policy(seed=1)
+    cut.model.backbone.load_state_dict(move.model.backbone.state_dict())
+
+    registry = PolicyRegistry()
+    registry.add("move", move)
+    registry.add("cut", cut)
+
+    assert len(registry.shared_backbones) == 1
+    assert move.model.backbone is cut.model.backbone
+
+    calls = count_backbone_calls(registry.shared_backbones[0])
+    batch = make_batch()
+    registry.activate("move").select_action(batch)
+    registry.activate("cut").select_action(batch)
+    assert calls[0] == 1
+
+
+def test_registry_caches_backbone_per_camera():
+    cameras = ("left", "right")
+    move, cut = make_act_policy(seed=0, cameras=cameras), make_act_policy(seed=1, cameras=cameras)
+    cut.model.backbone.load_state_dict(move.model.backbone.state_dict())
+
+    registry = PolicyRegistry()
+    registry.add("move", move)
+    registry.add("cut", cut)
+
+    calls = count_backbone_calls(registry.shared_backbones[0])
+    for frame in range(1, 3):
+        batch = make_batch(cameras)
+        registry.activate("move").select_action(batch)
+        registry.activate("cut").select_action(batch)
+        # Once per camera per frame, although the cameras alternate
+        assert calls[0] == len(cameras) * frame
+
+
+def test_registry_keeps_different_backbones_separate():
+    registry = PolicyRegistry()
+    registry.add("move", make_act_policy(seed=0))
+    registry.add("cut", make_act_policy(seed=1))
+
+    assert len(registry.shared_backbones) == 2
+    assert registry["move"].model.backbone is not registry["cut"].model.backbone
+
+
+def test_registry_output_matches_unshared_policy():
+    reference = make_act_policy(seed=0)
+    reference.eval()
+    registry = PolicyRegistry()
+    registry.add("move", make_act_policy(seed=0))
+
+    batch = make_batch()
+    torch.testing.assert_close(
+        registry.activate("move").select_action(batch),
+        reference.select_action(batch),
+    )
+
+
+def test_registry_activate_resets_action_queue():
+    registry = PolicyRegistry()
+    registry.add("move", make_act_policy(seed=0))
+
+    policy = registry.activate("move")
+    policy.select_action(make_batch())
+    assert len(policy._action_queue) == policy.config.n_action_steps - 1
+
+    registry.activate("move")
+    assert registry.active_name == "move"
+    assert len(policy._action_queue) == 0
+
+
+def test_registry_errors():
+    registry = PolicyRegistry()
+    with pytest.raises(RuntimeError):
+        registry.select_action(make_batch())
+
+    registry.add("move", make_act_policy(seed=0))
+    with pytest.raises(KeyError):
+        registry.add("move", make_act_policy(seed=0))
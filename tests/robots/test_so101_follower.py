@@ -0,0 +1,156 @@
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lerobot.common.robots.so101_follower import (
+    SO101Follower,
+    SO101FollowerConfig,
+)
+
+
+def _make_bus_mock() -> MagicMock:
+    """Return a bus mock with just the attributes used by the robot."""
+    bus = MagicMock(name="FeetechBusMock")
+    bus.is_connected = False
+
+    def _connect():
+        bus.is_connected = True
+
+    def _disconnect(_disable=True):
+        bus.is_connected = False
+
+    bus.connect.side_effect = _connect
+    bus.disconnect.side_effect = _disconnect
+
+    @contextmanager
+    def _dummy_cm():
+        yield
+
+    bus.torque_disabled.side_effect = _dummy_cm
+
+    return bus
+
+
+@pytest.fixture
+def make_follower():
+    bus_mock = _make_bus_mock()
+
+    def _bus_side_effect(*_args, **kwargs):
+        bus_mock.motors = kwargs["motors"]
+        motors_order: list[str] = list(bus_mock.motors)
+        # Registers written to every motor, read back as is
+        written = {}
+
+        def _sync_write(data_name, value, *_args, **_kwargs):
+            written[data_name] = value if isinstance(value, dict) else dict.fromkeys(motors_order, value)
+
+        def _bulk_write(values, *_args, **_kwargs):
+            for data_name, value in values.items():
+                _sync_write(data_name, value)
+
+        def _bulk_read(data_names, *_args, **_kwargs):
+            return {
+                name: written.get(name, {motor: offset + idx for idx, motor in enumerate(motors_order, 1)})
+                for offset, name in zip(range(0, 100 * len(data_names), 100), data_names, strict=True)
+            }
+
+        bus_mock.bulk_read.side_effect = _bulk_read
+        bus_mock.sync_read.return_value = {motor: idx for idx, motor in enumerate(motors_order, 1)}
+        bus_mock.sync_write.side_effect = _sync_write
+        bus_mock.bulk_write.side_effect = _bulk_write
+        bus_mock.write.return_value = None
+        bus_mock.is_calibrated = True
+        return bus_mock
+
+    robots = []
+
+    def _make_follower(**config_kwargs) -> SO101Follower:
+        cfg = SO101FollowerConfig(port="/dev/null", **config_kwargs)
+        robot = SO101Follower(cfg)
+        robots.append(robot)
+        return robot
+
+    with patch(
+        "lerobot.common.robots.so101_follower.so101_follower.FeetechMotorsBus",
+        side_effect=_bus_side_effect,
+    ):
+        yield _make_follower
+
+    for robot in robots:
+        if robot.is_connected:
+            robot.disconnect()
+
+
+def test_configure(make_follower):
+    follower = make_follower()
+    follower.connect()
+
+    # One bus transaction per group of registers instead of one per motor per register, and one to read
+    # them back, since sync writes aren't acknowledged
+    follower.bus.write.assert_not_called()
+    follower.bus.sync_write.assert_called_once_with("Operating_Mode", 0)
+    follower.bus.bulk_write.assert_called_once_with(
+        {"P_Coefficient": 16, "D_Coefficient": 32, "I_Coefficient": 0}
+    )
+    follower.bus.bulk_read.assert_called_once_with(
+        ["Operating_Mode", "P_Coefficient", "D_Coefficient", "I_Coefficient"], normalize=False
+    )
+
+
+def test_configure_lost_write(make_follower):
+    follower = make_follower()
+    bulk_read = follower.bus.bulk_read.side_effect
+
+    def _bulk_read_lost_write(data_names, *args, **kwargs):
+        values = bulk_read(data_names, *args, **kwargs)
+        # The gripper missed the write and kept its default
+        values["P_Coefficient"] = {**values["P_Coefficient"], "gripper": 32}
+        return values
+
+    follower.bus.bulk_read.side_effect = _bulk_read_lost_write
+
+    with pytest.raises(RuntimeError, match=r"motors: gripper.P_Coefficient=32 \(expected 16\)$"):
+        follower.connect()
+
+
+def test_get_observation(make_follower):
+    follower = make_follower()
+    follower.connect()
+    obs = follower.get_observation()
+
+    assert set(obs) == {f"{m}.pos" for m in follower.bus.motors}
+    for idx, motor in enumerate(follower.bus.motors, 1):
+        assert obs[f"{motor}.pos"] == idx
+
+
+def test_get_observation_velocity_and_current(make_follower):
+    follower = make_follower(observe_velocity=True, observe_current=True)
+    follower.connect()
+    follower.bus.bulk_read.reset_mock()
+    obs = follower.get_observation()
+
+    follower.bus.bulk_read.assert_called_once_with(
+        ["Present_Position", "Present_Velocity", "Present_Current"]
+    )
+    assert set(obs) == set(follower.observation_features)
+    for idx, motor in enumerate(follower.bus.motors, 1):
+        assert obs[f"{motor}.pos"] == idx
+        assert obs[f"{motor}.vel"] == 100 + idx
+        assert obs[f"{motor}.current"] == 200 + idx
+
+
+def test_send_action_max_relative_target(make_follower):
+    follower = make_follower(max_relative_target=5.0)
+    follower.connect()
+    action = {f"{m}.pos": 20 for m in follower.bus.motors}
+
+    # Clipped around the present position of the observation, without reading it again
+    follower.get_observation()
+    returned = follower.send_action(action)
+    follower.bus.sync_read.assert_not_called()
+    assert returned == {f"{m}.pos": idx + 5 for idx, m in enumerate(follower.bus.motors, 1)}
+
+    # Read when no observation was read since the last action
+    follower.send_action(action)
+    follower.bus.sync_read.assert_called_once_with("Present_Position")
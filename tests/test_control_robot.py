@@ -1,10 +1,17 @@
+from types import SimpleNamespace
+
+import torch
+
 from lerobot.calibrate import CalibrateConfig, calibrate
-from lerobot.record import DatasetRecordConfig, RecordConfig, record
+from lerobot.common.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.common.datasets.utils import hw_to_dataset_features
+from lerobot.common.utils.control_utils import AsyncSuccessDetector
+from lerobot.record import DatasetRecordConfig, RecordConfig, record, record_loop
 from lerobot.replay import DatasetReplayConfig, ReplayConfig, replay
 from lerobot.teleoperate import TeleoperateConfig, teleoperate
 from tests.fixtures.constants import DUMMY_REPO_ID
-from tests.mocks.mock_robot import MockRobotConfig
-from tests.mocks.mock_teleop import MockTeleopConfig
+from tests.mocks.mock_robot import MockRobot, MockRobotConfig
+from tests.mocks.mock_teleop import MockTeleop, MockTeleopConfig
 
 
 def test_calibrate():
@@ -88,3 +95,105 @@ def test_record_and_replay(tmp_path):
 
     record(record_cfg)
     replay(replay_cfg)
+
+
+def test_record_loop_with_policy_and_no_dataset():
+    class ConstantPolicy:
+        config = SimpleNamespace(device="cpu", use_amp=False)
+
+        def __init__(self, n_actions):
+            self.n_actions = n_actions
+            self.n_calls = 0
+
+        def reset(self):
+            self.n_calls = 0
+
+        def select_action(self, batch):
+            assert batch["observation.state"].shape == (1, self.n_actions)
+            self.n_calls += 1
+            return torch.zeros(1, self.n_actions)
+
+    robot = MockRobot(MockRobotConfig())
+    robot.connect()
+    policy = ConstantPolicy(len(robot.action_features))
+    events = {"exit_early": False, "rerecord_episode": False, "stop_recording": False}
+
+    record_loop(robot=robot, events=events, fps=30, policy=policy, control_time_s=0.1)
+
+    assert policy.n_calls > 0
+    robot.disconnect()
+
+
+def test_record_loop_exits_early_on_success():
+    robot = MockRobot(MockRobotConfig())
+    robot.connect()
+    teleop = MockTeleop(MockTeleopConfig())
+    teleop.connect()
+    events = {"exit_early": False, "rerecord_episode": False, "stop_recording": False}
+    detector = AsyncSuccessDetector(lambda obs: 1.0, every_n_steps=1, patience=1)
+
+    record_loop(
+        robot=robot, events=events, fps=30, teleop=teleop, control_time_s=10, success_detector=detector
+    )
+
+    assert detector.triggered
+    assert detector.step < 30
+    assert not events["exit_early"]
+    robot.disconnect()
+    teleop.disconnect()
+
+
+def test_record_loop_calls_on_observation():
+    robot = MockRobot(MockRobotConfig())
+    robot.connect()
+    teleop = MockTeleop(MockTeleopConfig())
+    teleop.connect()
+    events = {"exit_early": False, "rerecord_episode": False, "stop_recording": False}
+    observations = []
+
+    record_loop(
+        robot=robot,
+        events=events,
+        fps=30,
+        teleop=teleop,
+        control_time_s=0.1,
+        on_observation=observations.append,
+    )
+
+    assert len(observations) > 0
+    assert set(robot.observation_features) <= set(observations[0])
+    robot.disconnect()
+    teleop.disconnect()
+
+
+def test_pipelined_record_loop(tmp_path):
+    robot = MockRobot(MockRobotConfig())
+    robot.connect()
+    teleop = MockTeleop(MockTeleopConfig())
+    teleop.connect()
+    features = {
+        **hw_to_dataset_features(robot.action_features, "action"),
+        **hw_to_dataset_features(robot.observation_features, "observation"),
+    }
+    dataset = LeRobotDataset.create(DUMMY_REPO_ID, 30, root=tmp_path / "dataset", features=features)
+    events = {"exit_early": False, "rerecord_episode": False, "stop_recording": False}
+
+    stats = record_loop(
+        robot=robot,
+        events=events,
+        fps=30,
+        dataset=dataset,
+        teleop=teleop,
+        control_time_s=0.2,
+        single_task="Dummy task",
+        pipelined=True,
+    )
+
+    assert stats.num_ticks == 6
+    num_frames = dataset.episode_buffer["size"]
+    assert 0 < num_frames <= stats.num_ticks
+    # Frames have consecutive timestamps, which `save_episode` checks
+    dataset.save_episode()
+    assert dataset.meta.total_frames == num_frames
+    robot.disconnect()
+    teleop.disconnect()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import socketserver
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import smf
+from smf import SpeculativeCheck, YoloService
+
+
+@pytest.fixture
+def yolo_checks(monkeypatch):
+    """Stubs run_yolo_check with a check taking `delay_s` and answering `result`, and records its calls."""
+    checks = SimpleNamespace(calls=[], delay_s=0.05, result=True)
+
+    def run_yolo_check(model_name):
+        checks.calls.append(model_name)
+        time.sleep(checks.delay_s)
+        return checks.result
+
+    monkeypatch.setattr(smf, "run_yolo_check", run_yolo_check)
+    monkeypatch.setattr(smf, "yolo_service", SimpleNamespace(is_running=False))
+    return checks
+
+
+def test_starts_after_delay(yolo_checks):
+    check = SpeculativeCheck("cheeto_cut", after_s=10.0)
+
+    check.observe()
+    assert check.finish() is None
+    assert yolo_checks.calls == []
+
+    check = SpeculativeCheck("cheeto_cut", after_s=10.0)
+    check.start_t -= 10.0
+    check.observe()
+    assert check.finish() is True
+    assert yolo_checks.calls == ["cheeto_cut"]
+
+
+def test_joint_bounds(yolo_checks):
+    check = SpeculativeCheck("cheeto_cut", joints={"shoulder_lift.pos": {"min": -90, "max": -60}})
+
+    for observation in [None, {}, {"shoulder_lift.pos": 0.0}, {"shoulder_lift.pos": -100.0}]:
+        check.observe(observation)
+        assert check.num_checks == 0
+        assert yolo_checks.calls == []
+
+    check.observe({"shoulder_lift.pos": -70.0})
+    assert check.finish() is True
+    assert yolo_checks.calls == ["cheeto_cut"]
+
+
+def test_finish_waits_for_first_result(yolo_checks):
+    yolo_checks.delay_s = 0.2
+    yolo_checks.result = False
+    check = SpeculativeCheck("cheeto_cut")
+
+    check.observe()
+    assert check.finish() is False
+    assert check.num_checks == 1
+
+
+def test_runs_once_without_service(yolo_checks):
+    check = SpeculativeCheck("cheeto_cut", period_s=0.01)
+
+    check.observe()
+    time.sleep(0.2)
+    assert check.finish() is True
+    assert yolo_checks.calls == ["cheeto_cut"]
+
+
+def test_paced_with_service(yolo_checks, monkeypatch):
+    monkeypatch.setattr(smf, "yolo_service", SimpleNamespace(is_running=True))
+    yolo_checks.delay_s = 0.0
+    check = SpeculativeCheck("cheeto_cut", period_s=0.1)
+
+    check.observe()
+    time.sleep(0.25)
+    assert check.finish() is True
+    # Not back to back: one check, then one per period
+    assert 2 <= len(yolo_checks.calls) <= 4
+
+
+def test_cancel_stops_threads(yolo_checks):
+    check = SpeculativeCheck("cheeto_cut", after_s=0.05)
+
+    check.observe_until_started(period_s=0.01)
+    # Cancel while the check is in progress
+    deadline = time.perf_counter() + 5
+    while not yolo_checks.calls and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    check.cancel()
+
+    assert yolo_checks.calls == ["cheeto_cut"]
+    assert not any(t.name.startswith("speculative_cheeto_cut") for t in threading.enumerate())
+    assert check.finish() is None
+
+
+def test_discard_waits_for_checks(yolo_checks, monkeypatch):
+    monkeypatch.setattr(smf, "speculative_checks", {})
+    check = SpeculativeCheck("cheeto_cut")
+    smf.speculative_checks["cheeto_cut"] = check
+
+    check.observe()
+    smf.discard_speculative_checks()
+
+    assert smf.speculative_checks == {}
+    assert check.num_checks == 1
+    assert not any(t.name.startswith("speculative_cheeto_cut") for t in threading.enumerate())
+
+
+class SlowYoloHandler(socketserver.StreamRequestHandler):
+    """Answers like yolo_classifier.serve, taking 0.5s for the "slow" model."""
+
+    def handle(self):
+        for line in self.rfile:
+            request = json.loads(line)
+            if request.get("model") == "slow":
+                time.sleep(0.5)
+            response = {"ok": True, "label": "yes", "confidence": 0.9, "latency_ms": 1.0}
+            try:
+                self.wfile.write((json.dumps(response) + "\n").encode())
+            except BrokenPipeError:
+                return
+
+
+def test_yolo_service_reconnects_after_timeout(tmp_path, monkeypatch):
+    monkeypatch.setattr(smf, "YOLO_REQUEST_TIMEOUT_S", 0.2)
+    socket_path = str(tmp_path / "yolo.sock")
+    server = socketserver.ThreadingUnixStreamServer(socket_path, SlowYoloHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    service = YoloService(socket_path)
+    service.proc = SimpleNamespace(poll=lambda: None)
+
+    try:
+        assert service.classify_latest("fast", "camera") == pytest.approx(0.9)
+        assert service.classify_latest("slow", "camera") is None
+        # The timed out connection is dropped, and the late answer isn't read as the next one
+        assert service.is_running
+        assert service.classify_latest("fast", "camera") == pytest.approx(0.9)
+        assert service.classify("fast")[0] == "yes"
+    finally:
+        with service._lock:
+            service._disconnect()
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+
+import pytest
+
+from smf_engine import StateMachine, StateMachineConfig
+
+CONFIG = {
+    "initial_state": "MOVE",
+    "max_iterations": 10,
+    "states": {
+        "MOVE": {"action": "move", "timeout_s": 30, "next": "CHECK"},
+        "CHECK": {"action": "verify", "on_success": None, "on_failure": "MOVE"},
+    },
+}
+
+
+def make_machine(raw: dict, verify_results: list[bool]) -> tuple[StateMachine, list[str]]:
+    """Machine with stub actions recording the states they ran in, and a `verify` answering from a list."""
+    calls = []
+    results = iter(verify_results)
+
+    def move(timeout_s=None, **params):
+        calls.append("move")
+        return True
+
+    def verify(timeout_s=None, **params):
+        calls.append("verify")
+        return next(results)
+
+    machine = StateMachine(StateMachineConfig.from_dict(raw))
+    machine.register_action("move", move)
+    machine.register_action("verify", verify)
+    return machine, calls
+
+
+def test_from_dict():
+    config = StateMachineConfig.from_dict({**CONFIG, "policy_path": "outputs/move"})
+
+    assert config.initial_state == "MOVE"
+    assert config.max_iterations == 10
+    assert config.states["MOVE"].timeout_s == 30
+    assert config.states["CHECK"].next_state(True) is None
+    assert config.states["CHECK"].next_state(False) == "MOVE"
+    assert config.extra == {"policy_path": "outputs/move"}
+
+
+@pytest.mark.parametrize(
+    "raw, match",
+    [
+        ({**CONFIG, "initial_state": "CUT"}, "Initial state 'CUT'"),
+        (
+            {**CONFIG, "states": {**CONFIG["states"], "MOVE": {"action": "move", "next": "CUT"}}},
+            "unknown state 'CUT'",
+        ),
+        (
+            {
+                **CONFIG,
+                "states": {
+                    **CONFIG["states"],
+                    "MOVE": {"action": "move", "next": "CHECK", "on_failure": "MOVE"},
+                },
+            },
+            "sets both 'next' and 'on_success'/'on_failure'",
+        ),
+    ],
+    ids=["unknown_initial_state", "unknown_target", "next_and_on_failure"],
+)
+def test_from_dict_invalid(raw, match):
+    with pytest.raises(ValueError, match=match):
+        StateMachineConfig.from_dict(raw)
+
+
+def test_run_unregistered_action():
+    machine = StateMachine(StateMachineConfig.from_dict(CONFIG))
+    machine.register_action("move", lambda timeout_s=None: True)
+
+    with pytest.raises(ValueError, match="unregistered action 'verify'"):
+        machine.run()
+
+
+def test_run_unregistered_prepare_task():
+    raw = {**CONFIG, "states": {**CONFIG["states"], "MOVE": {"action": "move", "prepare": ["preload:cut"]}}}
+    machine, _ = make_machine(raw, [True])
+
+    with pytest.raises(ValueError, match="unregistered preparation task 'preload'"):
+        machine.run()
+
+
+def test_run_verify_yes():
+    machine, calls = make_machine(CONFIG, [True])
+
+    assert machine.run()
+    assert calls == ["move", "verify"]
+    assert [(t.state, t.ok, t.visit) for t in machine.timings] == [("MOVE", True, 1), ("CHECK", True, 1)]
+
+
+def test_run_verify_no_then_yes():
+    machine, calls = make_machine(CONFIG, [False, False, True])
+
+    assert machine.run()
+    assert calls == ["move", "verify"] * 3
+    assert [t.visit for t in machine.timings if t.state == "CHECK"] == [1, 2, 3]
+    assert machine.summary()["CHECK"]["failures"] == 2
+
+
+def test_run_action_exception_is_failure():
+    move = {"action": "move", "on_success": "CHECK", "on_failure": None}
+    machine, calls = make_machine({**CONFIG, "states": {**CONFIG["states"], "MOVE": move}}, [True])
+
+    def failing_move(timeout_s=None):
+        calls.append("failing_move")
+        raise RuntimeError("motor overload")
+
+    machine.register_action("move", failing_move)
+
+    assert machine.run()
+    assert calls == ["failing_move"]
+    assert not machine.timings[0].ok
+
+
+def test_run_max_iterations():
+    machine, calls = make_machine({**CONFIG, "max_iterations": 5}, [False] * 10)
+
+    assert not machine.run()
+    assert len(calls) == 5
+    assert len(machine.timings) == 5
+
+
+def test_run_prepare_and_requires():
+    preload_started = threading.Event()
+    release_preload = threading.Event()
+    preloaded = []
+
+    def preload(arg):
+        preload_started.set()
+        release_preload.wait(timeout=5)
+        preloaded.append(arg)
+
+    raw = {
+        **CONFIG,
+        "states": {
+            "MOVE": {"action": "move", "next": "CHECK", "prepare": ["preload:cut"]},
+            "CHECK": {
+                "action": "verify",
+                "on_success": None,
+                "on_failure": "MOVE",
+                "requires": ["preload:cut"],
+            },
+        },
+    }
+    machine, calls = make_machine(raw, [False, True])
+    machine.register_prepare_task("preload", preload)
+    preloaded_in_state = {}
+
+    def move(timeout_s=None):
+        # The preparation task runs in the background while the state runs
+        preload_started.wait(timeout=5)
+        preloaded_in_state.setdefault("MOVE", list(preloaded))
+        calls.append("move")
+        release_preload.set()
+        return True
+
+    verify = machine.actions["verify"]
+
+    def verify_after_preload(timeout_s=None):
+        preloaded_in_state.setdefault("CHECK", list(preloaded))
+        return verify(timeout_s=timeout_s)
+
+    machine.register_action("move", move)
+    machine.register_action("verify", verify_after_preload)
+
+    assert machine.run()
+    assert calls == ["move", "verify"] * 2
+    # Not done while MOVE runs, done before CHECK runs
+    assert preloaded_in_state == {"MOVE": [], "CHECK": ["cut"]}
+    # Started once, even though MOVE was entered twice
+    assert preloaded == ["cut"]
@@ -0,0 +1,112 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import time
+
+import pytest
+
+from lerobot.common.utils.control_pipeline import LatestValue, PipelinedControlLoop
+
+FPS = 50
+
+
+def test_latest_value_skips_intermediate_values():
+    channel = LatestValue()
+    assert channel.get(timeout=0.01) is None
+    channel.put("a")
+    channel.put("b")
+    assert channel.get() == (2, "b")
+    assert channel.get(after=2, timeout=0.01) is None
+
+    threading.Timer(0.01, channel.put, args=("c",)).start()
+    assert channel.get(after=2, timeout=1) == (3, "c")
+
+    channel.close()
+    assert channel.get(after=3) is None
+
+
+def sense_with_action(index):
+    return {"index": index}, {"action": {"index": index}}
+
+
+def test_records_every_tick_in_order():
+    records = []
+    loop = PipelinedControlLoop(
+        FPS,
+        sense_with_action,
+        act=lambda tick, action: action,
+        record=lambda tick, sent_action: records.append((tick.index, tick.timestamp, sent_action["index"])),
+    )
+    stats = loop.run(0.2)
+
+    assert stats.num_ticks == 10
+    assert records == [(i, i / FPS, i) for i in range(10)]
+    report = stats.report()
+    assert {"jitter", "jitter_histogram", "latency", "sense", "act", "record"} <= set(report)
+
+
+def test_slow_decide_records_stale_ticks():
+    def decide(tick):
+        time.sleep(2.5 / FPS)
+        return {"index": tick.index}
+
+    records = []
+    loop = PipelinedControlLoop(
+        FPS,
+        lambda index: ({}, {}),
+        act=lambda tick, action: action,
+        decide=decide,
+        record=lambda tick, sent_action: records.append((tick.index, sent_action["index"])),
+    )
+    stats = loop.run(0.4)
+
+    # Sensing isn't slowed down by the policy
+    assert stats.num_ticks == 20
+    assert stats.stale_ticks > 0
+    # Ticks are recorded in order, without gaps, each with the action in effect when it was sensed
+    indices = [index for index, _ in records]
+    assert indices == list(range(indices[0], indices[-1] + 1))
+    assert all(action_index <= index for index, action_index in records)
+    assert stats.stale_ticks == sum(action_index < index for index, action_index in records)
+
+
+def test_slow_display_does_not_slow_down_sensing():
+    displayed = []
+
+    def display(tick, sent_action):
+        displayed.append(tick.index)
+        time.sleep(5 / FPS)
+
+    loop = PipelinedControlLoop(FPS, sense_with_action, act=lambda tick, action: action, display=display)
+    stats = loop.run(0.4)
+
+    assert stats.num_ticks == 20
+    assert stats.schedule.missed_deadlines == 0
+    assert 0 < len(displayed) < 20
+
+
+def test_should_stop():
+    loop = PipelinedControlLoop(
+        FPS, sense_with_action, act=lambda tick, action: action, should_stop=lambda: True
+    )
+    assert loop.run(1).num_ticks == 0
+
+
+def test_stage_error_stops_the_loop():
+    def act(tick, action):
+        raise RuntimeError("bus error")
+
+    loop = PipelinedControlLoop(FPS, sense_with_action, act=act, record=lambda tick, sent_action: None)
+    with pytest.raises(RuntimeError, match="bus error"):
+        loop.run(10)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+import pytest
+
+from lerobot.common.utils.control_utils import AsyncSuccessDetector
+
+
+def make_events():
+    return {"exit_early": False, "rerecord_episode": False, "stop_recording": False}
+
+
+def run_steps(detector, events, probabilities):
+    """Feeds one observation per step and waits for each classification to finish."""
+    for p in probabilities:
+        detector({"p": p}, events)
+        detector.wait()
+
+
+def test_success_detector_exits_after_patience():
+    detector = AsyncSuccessDetector(lambda obs: obs["p"], every_n_steps=1, threshold=0.9, patience=2)
+    events = make_events()
+
+    run_steps(detector, events, [0.95, 0.2, 0.95])
+    assert not events["exit_early"]
+
+    run_steps(detector, events, [0.95])
+    assert events["exit_early"]
+    assert detector.triggered
+
+
+def test_success_detector_classifies_every_n_steps():
+    seen = []
+    detector = AsyncSuccessDetector(lambda obs: seen.append(obs["p"]) or 0.0, every_n_steps=3)
+
+    run_steps(detector, make_events(), range(7))
+    assert seen == [0, 3, 6]
+
+
+def test_success_detector_respects_min_steps():
+    detector = AsyncSuccessDetector(lambda obs: 1.0, every_n_steps=1, patience=1, min_steps=3)
+    events = make_events()
+
+    run_steps(detector, events, [1.0, 1.0, 1.0])
+    assert not events["exit_early"]
+
+    run_steps(detector, events, [1.0])
+    assert events["exit_early"]
+
+
+def test_success_detector_never_blocks_and_skips_busy_steps():
+    release = threading.Event()
+    calls = []
+
+    def slow_classifier(obs):
+        calls.append(obs["p"])
+        release.wait(timeout=5)
+        return 1.0
+
+    detector = AsyncSuccessDetector(slow_classifier, every_n_steps=1, patience=1)
+    events = make_events()
+    for p in range(5):
+        detector({"p": p}, events)
+    release.set()
+    detector.wait()
+
+    assert calls == [0]
+    assert events["exit_early"]
+
+
+def test_success_detector_reset_discards_stale_result():
+    release = threading.Event()
+
+    def slow_classifier(obs):
+        release.wait(timeout=5)
+        return 1.0
+
+    detector = AsyncSuccessDetector(slow_classifier, every_n_steps=1, patience=1)
+    events = make_events()
+    detector({}, events)
+    detector.reset()
+    release.set()
+    detector.wait()
+
+    assert not events["exit_early"]
+    assert detector.last_probability is None
+
+
+def test_success_detector_ignores_classifier_errors():
+    def failing_classifier(obs):
+        raise RuntimeError("camera unplugged")
+
+    detector = AsyncSuccessDetector(failing_classifier, every_n_steps=1, patience=1)
+    events = make_events()
+    run_steps(detector, events, [1.0])
+    assert not events["exit_early"]
+
+
+def test_success_detector_reuses_one_worker():
+    threads = set()
+
+    def classifier(obs):
+        threads.add(threading.current_thread())
+        return 0.0
+
+    detector = AsyncSuccessDetector(classifier, every_n_steps=1)
+    run_steps(detector, make_events(), range(3))
+    assert len(threads) == 1
+
+    detector.close(timeout=5)
+    assert not next(iter(threads)).is_alive()
+
+
+def test_success_detector_invalid_args():
+    with pytest.raises(ValueError):
+        AsyncSuccessDetector(lambda obs: 1.0, every_n_steps=0)
@@ -0,0 +1,74 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import time
+
+import pytest
+
+from lerobot.common.utils.scheduler import PeriodicScheduler, SchedulerConfig
+
+FPS = 100
+
+
+def test_deadlines_do_not_drift():
+    with PeriodicScheduler(FPS) as scheduler:
+        while scheduler.index < 20:
+            # Work of varying duration, which a relative sleep would accumulate
+            time.sleep((scheduler.index % 3) * 2e-3)
+            scheduler.wait()
+
+    elapsed = time.perf_counter() - scheduler.start_t
+    assert elapsed == pytest.approx(20 / FPS, abs=5e-3)
+    assert scheduler.stats.num_ticks == 21
+    assert scheduler.stats.missed_deadlines == 0
+    assert scheduler.timestamp == 20 / FPS
+
+
+def test_overrun_skips_missed_deadlines():
+    with PeriodicScheduler(FPS) as scheduler:
+        time.sleep(3.5 / FPS)
+        index = scheduler.wait()
+
+    # Deadlines 1 and 2 were missed, the loop resumes right away at the latest one
+    assert index == 3
+    assert scheduler.stats.missed_deadlines == 2
+    assert scheduler.stats.overrun[0] == pytest.approx(2.5 / FPS, abs=1e-3)
+    assert scheduler.stats.jitter[0] == pytest.approx(0.5 / FPS, abs=1e-3)
+
+
+def test_report():
+    with PeriodicScheduler(FPS) as scheduler:
+        for _ in range(5):
+            scheduler.wait()
+
+    report = scheduler.stats.report()
+    assert report["num_ticks"] == 6
+    assert report["overruns"] == 0
+    assert report["fps"] == pytest.approx(FPS, rel=0.1)
+    assert sum(report["jitter_histogram"].values()) == 5
+    assert "jitter" in scheduler.stats.format()
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="Linux only")
+def test_cpu_affinity_is_restored():
+    affinity = os.sched_getaffinity(0)
+    cpu = min(affinity)
+    with PeriodicScheduler(FPS, SchedulerConfig(cpu_affinity=[cpu])):
+        assert os.sched_getaffinity(0) == {cpu}
+    assert os.sched_getaffinity(0) == affinity
+
+
+def test_invalid_realtime_priority():
+    with pytest.raises(ValueError):
+        SchedulerConfig(realtime_priority=0)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from lerobot.common.utils.shared_frames import SharedFrameReader, SharedFrameWriter
+
+SHAPE = (4, 6, 3)
+
+
+@pytest.fixture
+def writer():
+    writer = SharedFrameWriter(f"lerobot_test_frames_{os.getpid()}", SHAPE, num_slots=3)
+    yield writer
+    writer.close()
+
+
+def make_frame(value: int) -> np.ndarray:
+    return np.full(SHAPE, value, dtype=np.uint8)
+
+
+def test_read_before_first_frame(writer):
+    reader = SharedFrameReader(writer.name)
+    assert reader.read_latest() is None
+    with pytest.raises(TimeoutError):
+        reader.wait_for_frame(timeout_s=0.01)
+    reader.close()
+
+
+def test_reader_sees_latest_frame(writer):
+    reader = SharedFrameReader(writer.name)
+    assert reader.shape == SHAPE
+    assert reader.color_order == "rgb"
+
+    for value in range(1, 6):
+        seq = writer.write(make_frame(value))
+    frame, latest_seq, timestamp_s = reader.read_latest()
+    assert latest_seq == seq == 5
+    assert timestamp_s > 0
+    np.testing.assert_array_equal(frame, make_frame(5))
+
+    with pytest.raises(TimeoutError):
+        reader.wait_for_frame(after_seq=latest_seq, timeout_s=0.01)
+    writer.write(make_frame(6))
+    frame, _, _ = reader.wait_for_frame(after_seq=latest_seq)
+    np.testing.assert_array_equal(frame, make_frame(6))
+    reader.close()
+
+
+def test_zero_copy_view_is_overwritten_after_a_lap(writer):
+    reader = SharedFrameReader(writer.name)
+    writer.write(make_frame(1))
+    view, _, _ = reader.read_latest(copy=False)
+    copied, _, _ = reader.read_latest()
+
+    for value in range(2, 2 + writer.num_slots):
+        writer.write(make_frame(value))
+    assert view[0, 0, 0] != 1
+    assert copied[0, 0, 0] == 1
+    del view
+    reader.close()
+
+
+def test_wrong_frame_shape(writer):
+    with pytest.raises(ValueError):
+        writer.write(np.zeros((2, 2, 3), dtype=np.uint8))
+
+
+def test_reader_in_another_process(writer):
+    writer.write(make_frame(7))
+    code = (
+        "from lerobot.common.utils.shared_frames import SharedFrameReader;"
+        f"print(SharedFrameReader('{writer.name}').read_latest()[0].max())"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "7"
+
+    # The other process exiting must not remove the buffer
+    writer.write(make_frame(8))
+    reader = SharedFrameReader(writer.name)
+    assert reader.read_latest()[0].max() == 8
+    reader.close()
+
+
+def test_missing_buffer():
+    with pytest.raises(FileNotFoundError):
+        SharedFrameReader("lerobot_test_frames_missing")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import pytest
+
+from lerobot.common.utils import tracing
+from lerobot.common.utils.tracing import Tracer, enable_tracing, load_trace, percentile, span, traced
+from lerobot.scripts.trace_report import build_report
+
+
+@pytest.fixture
+def trace_file(tmp_path, monkeypatch):
+    monkeypatch.delenv(tracing.TRACE_FILE_ENV, raising=False)
+    monkeypatch.setattr(tracing, "_tracer", None)
+    path = tmp_path / "trace.jsonl"
+    enable_tracing(path)
+    yield path
+    tracing.get_tracer().close()
+
+
+def test_disabled_tracer_is_noop(tmp_path):
+    tracer = Tracer()
+    with tracer.span("step", "robot") as args:
+        args["extra"] = 1
+    assert not tracer.enabled
+
+
+def test_span_writes_chrome_events(trace_file):
+    with span("MOVE", "state", visit=1) as args:
+        args["ok"] = True
+
+    @traced(cat="policy")
+    def predict():
+        return 3
+
+    assert predict() == 3
+    assert os.environ[tracing.TRACE_FILE_ENV] == str(trace_file)
+
+    events = load_trace(trace_file)
+    assert [(e["name"], e["cat"], e["ph"]) for e in events] == [
+        ("MOVE", "state", "X"),
+        ("predict", "policy", "X"),
+    ]
+    assert events[0]["args"] == {"visit": 1, "ok": True}
+    assert all(e["dur"] >= 0 and e["pid"] == os.getpid() for e in events)
+
+
+def test_load_trace_skips_truncated_lines(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    path.write_text('{"name": "a", "cat": "", "ph": "X", "ts": 0, "dur": 1}\n{"name": "b", "ca')
+    assert [e["name"] for e in load_trace(path)] == ["a"]
+
+
+def test_percentile():
+    assert percentile([3.0, 1.0, 2.0], 50) == 2.0
+    assert percentile([0.0, 10.0], 95) == pytest.approx(9.5)
+    assert percentile([4.0], 95) == 4.0
+
+
+def event(name, cat, ts_s, dur_s, pid=1, **args):
+    return {
+        "name": name,
+        "cat": cat,
+        "ph": "X",
+        "ts": ts_s * 1e6,
+        "dur": dur_s * 1e6,
+        "pid": pid,
+        "args": args,
+    }
+
+
+def test_build_report():
+    events = [
+        event("run", "run", 0, 100),
+        event("MOVE", "state", 0, 30, visit=1, ok=True),
+        event("CHECK", "state", 30, 2, visit=1, ok=False),
+        event("MOVE", "state", 32, 40, visit=2, ok=True),
+        event("move", "subprocess", 0, 30),
+        # Control loop of the lerobot.record child process: the other 10s are startup overhead
+        event("record_loop", "episode", 8, 20, pid=2),
+    ]
+    report = build_report(events)
+
+    assert report["runs"]["count"] == 1
+    assert report["states"]["MOVE"]["count"] == 2
+    assert report["states"]["MOVE"]["total_s"] == pytest.approx(70)
+    assert report["state_failures"] == {"CHECK": 1}
+    assert report["state_visits"]["MOVE#2"]["p50_s"] == pytest.approx(40)
+    assert report["spans"]["episode/record_loop"]["count"] == 1
+    assert report["subprocess_overhead"]["move"]["total_s"] == pytest.approx(10)
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Inference backends for the YOLOv8 classifiers used by yolo_classifier.py.
+
+Every backend exposes the same two things:
+- `names`: {class index: class name},
+- `predict(frames) -> np.ndarray`: class probabilities of shape (len(frames), num_classes)
+  for a list of BGR frames (as read by OpenCV).
+
+Backends:
+- "ultralytics": the original `.pt` checkpoint through `ultralytics.YOLO` (PyTorch eager).
+- "onnx": an exported `.onnx` model through ONNX Runtime.
+- "openvino": an exported `.onnx` (or OpenVINO `.xml`) model through OpenVINO on CPU.
+
+The ONNX Runtime and OpenVINO backends don't import ultralytics or torch. They preprocess frames
+like ultralytics' classify transforms (shortest side resized to imgsz, center crop, RGB, [0, 1])
+into buffers allocated once, at a fixed input size. Class names and the input size are read from
+the `<model>.json` file written by yolo_export.py next to the exported model.
+
+Create models with yolo_export.py:
+    python yolo_export.py export yolov8_models/cheeto_cut/best.pt
+    python yolo_export.py export yolov8_models/cheeto_cut/best.pt --int8 --calib-dir path/to/images
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+BACKENDS = ("auto", "ultralytics", "onnx", "openvino")
+
+
+def metadata_path(model_path: str | Path) -> Path:
+    return Path(model_path).with_suffix(".json")
+
+
+def load_metadata(model_path: str | Path) -> dict:
+    """Returns {"names": {index: name}, "imgsz": int} written by yolo_export.py."""
+    path = metadata_path(model_path)
+    if not path.exists():
+        raise FileNotFoundError(f"{path} not found. Export the model with yolo_export.py to create it.")
+    with open(path) as f:
+        metadata = json.load(f)
+    metadata["names"] = {int(idx): name for idx, name in metadata["names"].items()}
+    return metadata
+
+
+class ClassifyPreprocessor:
+    """
+    BGR frames -> float32 NCHW batch, like ultralytics' classify transforms at inference.
+
+    The output batch and the intermediate crop buffer are allocated once and reused; resize buffers
+    are allocated once per input frame size.
+    """
+
+    def __init__(self, imgsz: int, max_batch: int = 8):
+        self.imgsz = imgsz
+        self._batch = np.empty((max_batch, 3, imgsz, imgsz), dtype=np.float32)
+        self._rgb = np.empty((imgsz, imgsz, 3), dtype=np.uint8)
+        self._resize_buffers: dict[tuple[int, int], tuple] = {}
+
+    def _get_resize_buffers(self, h: int, w: int) -> tuple:
+        scale = self.imgsz / min(h, w)
+        size = (max(self.imgsz, round(w * scale)), max(self.imgsz, round(h * scale)))
+        # torchvision resizes with antialiasing. INTER_AREA approximates it, but is slow for non-integer
+        # factors: resize to an integer multiple of the target size first, then area-average by that factor.
+        factor = int(1 / scale) if scale < 1 else 1
+        intermediate = None
+        if factor > 1:
+            intermediate = np.empty((size[1] * factor, size[0] * factor, 3), dtype=np.uint8)
+        return size, intermediate, np.empty((size[1], size[0], 3), dtype=np.uint8)
+
+    def _resize(self, frame: np.ndarray) -> np.ndarray:
+        h, w = frame.shape[:2]
+        if (h, w) not in self._resize_buffers:
+            self._resize_buffers[(h, w)] = self._get_resize_buffers(h, w)
+        size, intermediate, resized = self._resize_buffers[(h, w)]
+
+        if intermediate is None:
+            return cv2.resize(frame, size, dst=resized, interpolation=cv2.INTER_LINEAR)
+        cv2.resize(frame, intermediate.shape[1::-1], dst=intermediate, interpolation=cv2.INTER_LINEAR)
+        return cv2.resize(intermediate, size, dst=resized, interpolation=cv2.INTER_AREA)
+
+    def __call__(self, frames: list[np.ndarray]) -> np.ndarray:
+        if len(frames) > len(self._batch):
+            self._batch = np.empty((len(frames), *self._batch.shape[1:]), dtype=np.float32)
+
+        for i, frame in enumerate(frames):
+            resized = self._resize(frame)
+            top = (resized.shape[0] - self.imgsz) // 2
+            left = (resized.shape[1] - self.imgsz) // 2
+            crop = resized[top : top + self.imgsz, left : left + self.imgsz]
+            cv2.cvtColor(crop, cv2.COLOR_BGR2RGB, dst=self._rgb)
+            np.multiply(self._rgb.transpose(2, 0, 1), np.float32(1 / 255), out=self._batch[i])
+        return self._batch[: len(frames)]
+
+
+class UltralyticsClassifier:
+    def __init__(self, model_path: str, imgsz: int | None = None):
+        from ultralytics import YOLO
+
+        self.model = YOLO(model_path)
+        self.names = self.model.names
+        self.imgsz = imgsz
+
+    def predict(self, frames: list[np.ndarray]) -> np.ndarray:
+        kwargs = {"verbose": False}
+        if self.imgsz is not None:
+            kwargs["imgsz"] = self.imgsz
+        results = self.model(frames, **kwargs)
+        return np.stack([result.probs.data.cpu().numpy() for result in results])
+
+
+class OnnxClassifier:
+    def __init__(self, model_path: str, num_threads: int | None = None):
+        import onnxruntime as ort
+
+        metadata = load_metadata(model_path)
+        self.names = metadata["names"]
+        self.imgsz = metadata["imgsz"]
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        if num_threads is not None:
+            options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+
+        model_input = self.session.get_inputs()[0]
+        self.input_name = model_input.name
+        # Models exported without a dynamic batch dimension are run one chunk of `batch` frames at a time
+        self.batch = model_input.shape[0] if isinstance(model_input.shape[0], int) else None
+        self.preprocess = ClassifyPreprocessor(self.imgsz, max_batch=self.batch or 8)
+
+    def predict(self, frames: list[np.ndarray]) -> np.ndarray:
+        batch = self.preprocess(frames)
+        if self.batch is None:
+            return self.session.run(None, {self.input_name: batch})[0]
+
+        probs = []
+        for start in range(0, len(frames), self.batch):
+            chunk = batch[start : start + self.batch]
+            n = len(chunk)
+            if n < self.batch:
+                chunk = np.concatenate([chunk, np.zeros((self.batch - n, *chunk.shape[1:]), np.float32)])
+            probs.append(self.session.run(None, {self.input_name: chunk})[0][:n])
+        return np.concatenate(probs)
+
+
+class OpenVINOClassifier:
+    def __init__(self, model_path: str, num_threads: int | None = None):
+        import openvino as ov
+
+        metadata = load_metadata(model_path)
+        self.names = metadata["names"]
+        self.imgsz = metadata["imgsz"]
+
+        config = {"PERFORMANCE_HINT": "LATENCY"}
+        if num_threads is not None:
+            config["INFERENCE_NUM_THREADS"] = num_threads
+        core = ov.Core()
+        model = core.read_model(model_path)
+        self.batch = (
+            None if model.input(0).get_partial_shape()[0].is_dynamic else model.input(0).get_shape()[0]
+        )
+        self.compiled = core.compile_model(model, "CPU", config)
+        self.request = self.compiled.create_infer_request()
+        self.preprocess = ClassifyPreprocessor(self.imgsz, max_batch=self.batch or 8)
+
+    def predict(self, frames: list[np.ndarray]) -> np.ndarray:
+        batch = self.preprocess(frames)
+        step = self.batch or len(frames)
+        probs = []
+        for start in range(0, len(frames), step):
+            chunk = batch[start : start + step]
+            n = len(chunk)
+            if n < step:
+                chunk = np.concatenate([chunk, np.zeros((step - n, *chunk.shape[1:]), np.float32)])
+            self.request.infer({0: chunk})
+            probs.append(self.request.get_output_tensor(0).data[:n].copy())
+        return np.concatenate(probs)
+
+
+def load_classifier(
+    model_path: str, backend: str = "auto", imgsz: int | None = None, num_threads: int | None = None
+):
+    """
+    Load a classifier with the given backend. "auto" picks it from the file extension:
+    .pt -> ultralytics, .onnx -> ONNX Runtime, .xml -> OpenVINO.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Use one of {BACKENDS}.")
+    if backend == "auto":
+        backend = {".onnx": "onnx", ".xml": "openvino"}.get(os.path.splitext(model_path)[1], "ultralytics")
+
+    logging.info("Loading YOLO model %s with the %s backend", model_path, backend)
+    if backend == "ultralytics":
+        return UltralyticsClassifier(model_path, imgsz)
+    if backend == "onnx":
+        return OnnxClassifier(model_path, num_threads)
+    return OpenVINOClassifier(model_path, num_threads)
@@ -1,15 +1,56 @@
 #!/usr/bin/env python3
 """
 Runs a YOLOv8 model (Ultralytics) to classify the robot's camera feed.
-Usage:
+
+One-shot usage (loads the model, grabs one frame, exits):
     python yolo_classifier.py --model-path path/to/model.pt --camera 2
 Prints ONLY 'yes' or 'no' to stdout.
+
+Models exported with yolo_export.py (`best.onnx`, optionally INT8 `best.int8.onnx`) run through
+ONNX Runtime, or OpenVINO with --backend openvino, without importing ultralytics or torch.
+
+Service usage (keeps every model loaded and warm, answers over a local socket):
+    python yolo_classifier.py --serve --camera 2 \
+        --model cheeto_position=yolov8_models/cheeto_position/best.pt \
+        --model cheeto_cut=yolov8_models/cheeto_cut/best.pt
+
+The service speaks newline-delimited JSON over a Unix domain socket:
+    request : {"model": "cheeto_position"}
+    response: {"ok": true, "label": "yes", "confidence": 0.97, "latency_ms": 21.4}
+
+A burst request classifies several consecutive frames (optionally from several cameras) in
+one batched call and votes ("mean" = confidence-weighted, "majority" = per-frame votes):
+    request : {"model": "cheeto_cut", "frames": 5, "cameras": [2], "mode": "mean"}
+    response: {"ok": true, "label": "yes", "confidence": 0.91, "latency_ms": 48.0,
+               "frames": [{"camera": 2, "label": "yes", "p_yes": 0.95}, ...]}
+
+Frames captured by another process (e.g. the robot's live observation) can be sent instead,
+as base64 JPEGs in BGR order; "camera" is then the index of the image in the request:
+    request : {"model": "cheeto_position", "images": ["/9j/4AAQ..."], "mode": "mean"}
+Send {"cmd": "ping"} to check readiness and {"cmd": "shutdown"} to stop it.
+
+A camera can also be given by the name of the shared memory buffer its owner (the lerobot process,
+see OpenCVCameraConfig.shared_memory_name) publishes frames to. Frames are then read from memory
+and the device is never opened here:
+    python yolo_classifier.py --serve --camera lerobot_camera_right --model ...
 """
 
 import argparse
+import base64
+import json
+import logging
+import os
+import socket
+import threading
 import time
+
 import cv2
-from ultralytics import YOLO
+import numpy as np
+
+from lerobot.common.utils.shared_frames import SharedFrameReader
+from yolo_backends import BACKENDS, load_classifier
+
+DEFAULT_SOCKET_PATH = "/tmp/cheeto_yolo.sock"
 
 
 def open_camera_with_retry(camera_idx: int, retries: int = 10, delay: float = 0.3):
@@ -40,24 +81,452 @@ def capture_fresh_frame(camera_idx: int, warmup_frames: int = 5):
     return frame
 
 
+def parse_model_specs(specs: list[str]) -> dict[str, str]:
+    """Turn ['name=path', 'path'] into {'name': 'path', ...}. Bare paths are named after their folder."""
+    models = {}
+    for spec in specs:
+        if "=" in spec:
+            name, path = spec.split("=", 1)
+        else:
+            path = spec
+            name = os.path.basename(os.path.dirname(os.path.abspath(path)))
+        models[name.strip()] = path.strip()
+    return models
+
+
+def capture_burst(camera_idx: int, n_frames: int, warmup_frames: int = 5) -> list[np.ndarray]:
+    """Open the camera, discard warmup frames, and return the next n_frames consecutive frames."""
+    cap = open_camera_with_retry(camera_idx)
+    try:
+        for _ in range(warmup_frames):
+            cap.read()
+        frames = []
+        for _ in range(n_frames):
+            ret, frame = cap.read()
+            if not ret:
+                raise RuntimeError(f"Failed to capture a frame from camera {camera_idx}.")
+            frames.append(frame)
+    finally:
+        cap.release()
+    return frames
+
+
+class CameraReader:
+    """Keeps a camera open and reads it in a background thread so the latest frame is always fresh."""
+
+    def __init__(self, camera_idx: int, warmup_frames: int = 5):
+        self.camera_idx = camera_idx
+        self._cap = open_camera_with_retry(camera_idx)
+        for _ in range(warmup_frames):
+            self._cap.read()
+
+        self._latest_frame = None
+        self._frame_id = 0
+        self._new_frame = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._read_loop, name=f"yolo_camera_reader_{camera_idx}", daemon=True
+        )
+        self._thread.start()
+
+    def _read_loop(self):
+        while not self._stop_event.is_set():
+            ret, frame = self._cap.read()
+            if not ret:
+                time.sleep(0.01)
+                continue
+            with self._new_frame:
+                self._latest_frame = frame
+                self._frame_id += 1
+                self._new_frame.notify_all()
+
+    def read_frames(self, n_frames: int, timeout_s: float = 2.0) -> list[np.ndarray]:
+        """Returns the latest frame followed by the next n_frames - 1 new ones."""
+        frames = []
+        last_id = None
+        deadline = time.perf_counter() + timeout_s
+        with self._new_frame:
+            while len(frames) < n_frames:
+                if self._latest_frame is not None and self._frame_id != last_id:
+                    frames.append(self._latest_frame)
+                    last_id = self._frame_id
+                    continue
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    raise RuntimeError(f"No new frame received from camera {self.camera_idx}.")
+                self._new_frame.wait(remaining)
+        return frames
+
+    def close(self):
+        self._stop_event.set()
+        self._thread.join(timeout=1.0)
+        self._cap.release()
+
+
+class SharedFrameCameraReader:
+    """Same interface as CameraReader, for a camera another process publishes to shared memory."""
+
+    def __init__(self, name: str, attach_timeout_s: float = 5.0):
+        self.camera_idx = name
+        self.attach_timeout_s = attach_timeout_s
+        self._reader = None
+
+    def _attach(self) -> SharedFrameReader:
+        # The owner may connect its cameras after this service starts.
+        deadline = time.perf_counter() + self.attach_timeout_s
+        while self._reader is None:
+            try:
+                self._reader = SharedFrameReader(self.camera_idx)
+            except FileNotFoundError:
+                if time.perf_counter() > deadline:
+                    raise RuntimeError(f"No frames are published to '{self.camera_idx}'.") from None
+                time.sleep(0.05)
+        return self._reader
+
+    def read_frames(self, n_frames: int, timeout_s: float = 2.0) -> list[np.ndarray]:
+        """Returns the latest frame followed by the next n_frames - 1 new ones, in BGR order."""
+        reader = self._attach()
+        frames = []
+        seq = 0
+        for _ in range(n_frames):
+            try:
+                frame, seq, _ = reader.wait_for_frame(seq, timeout_s)
+            except TimeoutError as e:
+                raise RuntimeError(str(e)) from e
+            if reader.color_order == "rgb":
+                frame = np.ascontiguousarray(frame[..., ::-1])
+            frames.append(frame)
+        return frames
+
+    def close(self):
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+
+
+def parse_camera(value: str) -> int | str:
+    """Camera index, or the name of a shared memory frame buffer."""
+    return int(value) if value.isdigit() else value
+
+
+def vote(p_yes: list[float], mode: str = "mean", threshold: float = 0.5) -> tuple[str, float]:
+    """
+    Combine per-frame P(yes) into one decision.
+
+    - "mean": confidence-weighted, 'yes' if the average P(yes) reaches threshold.
+    - "majority": 'yes' if strictly more than half of the frames predict 'yes'.
+
+    Returns (label, confidence), where confidence is the average P(yes) for a 'yes' decision
+    or the average P(no) for a 'no' decision.
+    """
+    mean_p_yes = float(np.mean(p_yes))
+    if mode == "mean":
+        is_yes = mean_p_yes >= threshold
+    elif mode == "majority":
+        is_yes = sum(p >= threshold for p in p_yes) * 2 > len(p_yes)
+    else:
+        raise ValueError(f"Unknown vote mode '{mode}'. Use 'mean' or 'majority'.")
+    return ("yes", mean_p_yes) if is_yes else ("no", 1.0 - mean_p_yes)
+
+
+class YoloEngine:
+    """
+    Keeps several YOLOv8 classifiers loaded and warm in a single process.
+
+    The cameras are opened on demand by default because the lerobot process also uses them for
+    the policy. Pass hold_camera=True to keep them open between checks: background readers then
+    keep the latest frames fresh and no warmup reads are needed. Cameras given by name are read
+    from the shared memory buffer the lerobot process publishes them to.
+
+    Models are loaded with yolo_backends.load_classifier: `.pt` checkpoints run through
+    ultralytics, exported `.onnx` models through ONNX Runtime (or OpenVINO with backend="openvino").
+    """
+
+    def __init__(
+        self,
+        model_paths: dict[str, str],
+        camera_indices: list[int | str] = (2,),
+        hold_camera: bool = False,
+        warmup_frames: int = 5,
+        imgsz: int | None = None,
+        backend: str = "auto",
+        num_threads: int | None = None,
+    ):
+        self.camera_indices = list(camera_indices)
+        self.hold_camera = hold_camera
+        self.warmup_frames = warmup_frames
+
+        self.models = {}
+        for name, path in model_paths.items():
+            logging.info("Loading YOLO model '%s' from %s", name, path)
+            self.models[name] = load_classifier(path, backend, imgsz, num_threads)
+
+        self._warmup_models()
+        self._readers = {
+            idx: SharedFrameCameraReader(idx) for idx in self.camera_indices if isinstance(idx, str)
+        }
+        if self.hold_camera:
+            self._readers.update(
+                {idx: CameraReader(idx, warmup_frames) for idx in self.camera_indices if isinstance(idx, int)}
+            )
+
+    def _warmup_models(self):
+        # The first call allocates buffers and picks kernels, so pay for it at startup.
+        dummy = np.zeros((480, 640, 3), dtype=np.uint8)
+        for model in self.models.values():
+            model.predict([dummy])
+
+    def _get_model(self, model_name: str):
+        if model_name not in self.models:
+            raise KeyError(f"Unknown model '{model_name}'. Available: {list(self.models)}")
+        return self.models[model_name]
+
+    def grab_frames(
+        self, n_frames: int = 1, cameras: list[int | str] | None = None
+    ) -> list[tuple[int | str, np.ndarray]]:
+        """Returns n_frames consecutive (camera, frame) pairs from each requested camera."""
+        cameras = self.camera_indices if cameras is None else cameras
+        frames = []
+        for idx in cameras:
+            if isinstance(idx, str) and idx not in self._readers:
+                self._readers[idx] = SharedFrameCameraReader(idx)
+            if idx in self._readers:
+                burst = self._readers[idx].read_frames(n_frames)
+            else:
+                burst = capture_burst(idx, n_frames, self.warmup_frames)
+            frames.extend((idx, frame) for frame in burst)
+        return frames
+
+    def grab_frame(self) -> np.ndarray:
+        return self.grab_frames(1, self.camera_indices[:1])[0][1]
+
+    def classify(self, model_name: str, frame: np.ndarray | None = None) -> tuple[str, float]:
+        """Returns the (lower-cased class name, confidence) of the top-1 prediction."""
+        model = self._get_model(model_name)
+        if frame is None:
+            frame = self.grab_frame()
+
+        probs = model.predict([frame])[0]
+        top1 = int(np.argmax(probs))
+        return model.names[top1].strip().lower(), float(probs[top1])
+
+    def classify_burst(
+        self,
+        model_name: str,
+        n_frames: int = 5,
+        cameras: list[int | str] | None = None,
+        mode: str = "mean",
+        threshold: float = 0.5,
+    ) -> dict:
+        """
+        Classify a short burst of frames from one or more cameras in a single batched call and vote.
+
+        Returns {"label", "confidence", "frames": [{"camera", "label", "p_yes"}, ...]}.
+        """
+        frames = self.grab_frames(n_frames, cameras)
+        return self.classify_frames(model_name, frames, mode, threshold)
+
+    def classify_frames(
+        self,
+        model_name: str,
+        frames: list[tuple],
+        mode: str = "mean",
+        threshold: float = 0.5,
+    ) -> dict:
+        """Same as classify_burst, on already captured (source, BGR frame) pairs."""
+        model = self._get_model(model_name)
+        yes_idx = {name.strip().lower(): idx for idx, name in model.names.items()}.get("yes")
+        if yes_idx is None:
+            raise ValueError(f"Model '{model_name}' has no 'yes' class: {model.names}")
+
+        probs = model.predict([frame for _, frame in frames])
+
+        per_frame = []
+        for (camera_idx, _), frame_probs in zip(frames, probs, strict=True):
+            per_frame.append(
+                {
+                    "camera": camera_idx,
+                    "label": model.names[int(np.argmax(frame_probs))].strip().lower(),
+                    "p_yes": float(frame_probs[yes_idx]),
+                }
+            )
+
+        label, confidence = vote([f["p_yes"] for f in per_frame], mode, threshold)
+        return {"label": label, "confidence": confidence, "frames": per_frame}
+
+    def close(self):
+        for reader in self._readers.values():
+            reader.close()
+        self._readers = {}
+
+
+def encode_image(frame: np.ndarray, quality: int = 90) -> str:
+    """BGR frame -> base64 JPEG string, to send frames captured by another process in a request."""
+    ok, buffer = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise RuntimeError("Failed to encode frame.")
+    return base64.b64encode(buffer.tobytes()).decode("ascii")
+
+
+def decode_image(data: str) -> np.ndarray:
+    """base64 JPEG/PNG string -> BGR frame."""
+    buffer = np.frombuffer(base64.b64decode(data), dtype=np.uint8)
+    frame = cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+    if frame is None:
+        raise ValueError("Could not decode image.")
+    return frame
+
+
+def _handle_request(engine: YoloEngine, request: dict) -> dict:
+    cmd = request.get("cmd", "classify")
+    if cmd == "ping":
+        return {"ok": True, "models": list(engine.models)}
+    if cmd == "shutdown":
+        return {"ok": True, "shutdown": True}
+    if cmd != "classify":
+        return {"ok": False, "error": f"Unknown cmd '{cmd}'"}
+
+    start_t = time.perf_counter()
+    try:
+        n_frames = int(request.get("frames", 1))
+        cameras = request.get("cameras")
+        if "images" in request:
+            frames = [(i, decode_image(image)) for i, image in enumerate(request["images"])]
+            response = engine.classify_frames(
+                request["model"],
+                frames,
+                mode=request.get("mode", "mean"),
+                threshold=float(request.get("threshold", 0.5)),
+            )
+        elif n_frames > 1 or cameras is not None:
+            response = engine.classify_burst(
+                request["model"],
+                n_frames=n_frames,
+                cameras=cameras,
+                mode=request.get("mode", "mean"),
+                threshold=float(request.get("threshold", 0.5)),
+            )
+        else:
+            label, confidence = engine.classify(request["model"])
+            response = {"label": label, "confidence": confidence}
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+    return {"ok": True, **response, "latency_ms": (time.perf_counter() - start_t) * 1e3}
+
+
+def serve(engine: YoloEngine, socket_path: str = DEFAULT_SOCKET_PATH):
+    """Answers classification requests on a Unix domain socket until a shutdown request arrives."""
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(1)
+    logging.info("YOLO service ready on %s (models: %s)", socket_path, list(engine.models))
+
+    try:
+        running = True
+        while running:
+            conn, _ = server.accept()
+            with conn, conn.makefile("rw") as stream:
+                for line in stream:
+                    if not line.strip():
+                        continue
+                    try:
+                        request = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        response = {"ok": False, "error": f"Invalid request: {e}"}
+                    else:
+                        response = _handle_request(engine, request)
+                    stream.write(json.dumps(response) + "\n")
+                    stream.flush()
+                    if response.get("shutdown"):
+                        running = False
+                        break
+    finally:
+        server.close()
+        engine.close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+
 def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument("--model-path", required=True)
-    parser.add_argument("--camera", type=int, default=2)
+    parser.add_argument("--model-path", help="Model used for a one-shot classification.")
+    parser.add_argument(
+        "--camera",
+        type=parse_camera,
+        action="append",
+        help=(
+            "Camera index (default: 2), or name of a shared memory frame buffer. "
+            "Can be repeated in --serve mode for multi-camera bursts."
+        ),
+    )
+    parser.add_argument("--frames", type=int, default=1, help="One-shot mode: number of frames to vote over.")
+    parser.add_argument("--vote", choices=["mean", "majority"], default="mean")
+    parser.add_argument("--serve", action="store_true", help="Run as a long-lived classification service.")
+    parser.add_argument(
+        "--model",
+        action="append",
+        default=[],
+        help="Model served as 'name=path/to/best.pt'. Can be repeated.",
+    )
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH)
+    parser.add_argument(
+        "--hold-camera",
+        action="store_true",
+        help="Keep the camera open between checks. Only use if no other process needs the device.",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="auto",
+        help="Inference backend. 'auto' picks it from the model file: .pt -> ultralytics, .onnx -> onnx.",
+    )
+    parser.add_argument("--threads", type=int, help="CPU threads used by the onnx/openvino backends.")
     args = parser.parse_args()
+    cameras = args.camera or [2]
+
+    if args.serve:
+        logging.basicConfig(level=logging.INFO, format="[%(asctime)s] %(levelname)s: %(message)s")
+        model_paths = parse_model_specs(args.model + ([args.model_path] if args.model_path else []))
+        if not model_paths:
+            parser.error("--serve requires at least one --model")
+        engine = YoloEngine(
+            model_paths,
+            camera_indices=cameras,
+            hold_camera=args.hold_camera,
+            backend=args.backend,
+            num_threads=args.threads,
+        )
+        serve(engine, args.socket)
+        return
+
+    if args.model_path is None:
+        parser.error("--model-path is required unless --serve is given")
+
+    if args.frames > 1:
+        engine = YoloEngine(
+            {"model": args.model_path}, camera_indices=cameras, backend=args.backend, num_threads=args.threads
+        )
+        result = engine.classify_burst("model", n_frames=args.frames, mode=args.vote)
+        print(result["label"])
+        return
 
     # Load YOLO model
-    model = YOLO(args.model_path)
+    model = load_classifier(args.model_path, args.backend, num_threads=args.threads)
 
     # Capture frame safely
-    frame = capture_fresh_frame(args.camera)
+    if isinstance(cameras[0], str):
+        frame = SharedFrameCameraReader(cameras[0]).read_frames(1)[0]
+    else:
+        frame = capture_fresh_frame(cameras[0])
 
     # Run inference
-    results = model(frame)
+    probs = model.predict([frame])[0]
 
     # Assume model outputs class names "yes" or "no"
-    pred = results[0].probs.top1
-    class_name = results[0].names[pred]
+    class_name = model.names[int(np.argmax(probs))]
 
     # Print ONLY yes/no for subprocess reading
     print(class_name.strip().lower())
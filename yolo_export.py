@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Export the YOLOv8 classifiers for the lightweight backends of yolo_backends.py and benchmark them.
+
+Export a checkpoint to ONNX at a fixed input size (writes best.onnx and best.json next to best.pt):
+    python yolo_export.py export yolov8_models/cheeto_cut/best.pt --imgsz 224
+
+Add an INT8 model (best.int8.onnx), statically quantized with a few hundred representative camera
+frames, e.g. the validation split of the YOLO dataset:
+    python yolo_export.py export yolov8_models/cheeto_cut/best.pt --int8 \\
+        --calib-dir datasets/cheeto_cut_dataset/val
+
+The exported models run with ONNX Runtime ("onnx" backend) or OpenVINO ("openvino" backend, which
+also runs the INT8 model).
+
+Compare import time, load time, latency and agreement with the .pt model on a folder of images:
+    python yolo_export.py benchmark yolov8_models/cheeto_cut/best.pt \
+        --candidates yolov8_models/cheeto_cut/best.onnx yolov8_models/cheeto_cut/best.int8.onnx \
+        --images datasets/cheeto_cut_dataset/val --backends onnx openvino
+
+Needs ultralytics (export, reference model) and onnxruntime (quantization), so run it from the
+cv_models environment.
+"""
+
+import argparse
+import json
+import logging
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from lerobot.common.utils.tracing import percentile
+from yolo_backends import ClassifyPreprocessor, load_classifier, metadata_path
+
+IMAGE_SUFFIXES = (".jpg", ".jpeg", ".png", ".bmp")
+# Time to import each backend's package in a fresh interpreter
+IMPORT_STATEMENTS = {
+    "ultralytics": "from ultralytics import YOLO",
+    "onnx": "import onnxruntime",
+    "openvino": "import openvino",
+}
+
+
+def load_images(images_dir: str | Path, max_images: int | None = None) -> list[np.ndarray]:
+    paths = sorted(p for p in Path(images_dir).rglob("*") if p.suffix.lower() in IMAGE_SUFFIXES)
+    if max_images is not None:
+        paths = paths[:max_images]
+    if not paths:
+        raise FileNotFoundError(f"No images found in {images_dir}.")
+    return [cv2.imread(str(p)) for p in paths]
+
+
+def write_metadata(onnx_path: Path, names: dict, imgsz: int, **extra):
+    with open(metadata_path(onnx_path), "w") as f:
+        json.dump({"names": {str(k): v for k, v in names.items()}, "imgsz": imgsz, **extra}, f, indent=2)
+
+
+def quantize_int8(onnx_path: Path, output_path: Path, images: list[np.ndarray], imgsz: int):
+    """Static INT8 quantization (QDQ, per-channel weights) calibrated on `images`."""
+    from onnxruntime.quantization import CalibrationDataReader, QuantFormat, QuantType, quantize_static
+    from onnxruntime.quantization.shape_inference import quant_pre_process
+
+    class FrameReader(CalibrationDataReader):
+        def __init__(self, input_name: str):
+            self.input_name = input_name
+            self.preprocess = ClassifyPreprocessor(imgsz, max_batch=1)
+            self.frames = iter(images)
+
+        def get_next(self):
+            frame = next(self.frames, None)
+            if frame is None:
+                return None
+            return {self.input_name: self.preprocess([frame]).copy()}
+
+    import onnxruntime as ort
+
+    input_name = ort.InferenceSession(str(onnx_path), providers=["CPUExecutionProvider"]).get_inputs()[0].name
+    preprocessed_path = output_path.with_suffix(".pre.onnx")
+    quant_pre_process(str(onnx_path), str(preprocessed_path))
+    try:
+        quantize_static(
+            str(preprocessed_path),
+            str(output_path),
+            FrameReader(input_name),
+            quant_format=QuantFormat.QDQ,
+            per_channel=True,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+        )
+    finally:
+        preprocessed_path.unlink(missing_ok=True)
+
+
+def export(
+    model_path: str,
+    imgsz: int = 224,
+    dynamic: bool = True,
+    int8: bool = False,
+    calib_dir: str | None = None,
+    calib_images: int = 300,
+) -> list[Path]:
+    """Export `model_path` (.pt) to ONNX, and to INT8 ONNX if `int8`. Returns the exported paths."""
+    from ultralytics import YOLO
+
+    model = YOLO(model_path)
+    onnx_path = Path(model.export(format="onnx", imgsz=imgsz, dynamic=dynamic, simplify=True))
+    write_metadata(onnx_path, model.names, imgsz, source=str(model_path))
+    exported = [onnx_path]
+
+    if int8:
+        if calib_dir is None:
+            raise ValueError("INT8 quantization needs calibration images (--calib-dir).")
+        int8_path = onnx_path.with_suffix(".int8.onnx")
+        quantize_int8(onnx_path, int8_path, load_images(calib_dir, calib_images), imgsz)
+        write_metadata(int8_path, model.names, imgsz, source=str(model_path), quantization="int8")
+        exported.append(int8_path)
+
+    for path in exported:
+        logging.info("Exported %s", path)
+    return exported
+
+
+def measure_import_s(backend: str) -> float:
+    code = (
+        f"import time; t = time.perf_counter(); {IMPORT_STATEMENTS[backend]}; print(time.perf_counter() - t)"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    return float(proc.stdout.strip()) if proc.returncode == 0 else float("nan")
+
+
+def measure_latency_ms(model, frames: list[np.ndarray], runs: int) -> tuple[float, float]:
+    model.predict(frames)  # warmup
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        model.predict(frames)
+        latencies.append((time.perf_counter() - start) * 1e3)
+    return percentile(latencies, 50), percentile(latencies, 95)
+
+
+def predict_all(model, images: list[np.ndarray], batch_size: int = 8) -> np.ndarray:
+    return np.concatenate(
+        [model.predict(images[i : i + batch_size]) for i in range(0, len(images), batch_size)]
+    )
+
+
+def benchmark(
+    reference: str,
+    candidates: list[str],
+    images_dir: str,
+    backends: list[str] = ("onnx",),
+    batch: int = 5,
+    runs: int = 50,
+    max_images: int | None = 200,
+    num_threads: int | None = None,
+) -> list[dict]:
+    """
+    Latency (batch of 1 and of `batch` frames) and agreement with the `reference` model for every
+    candidate model and backend. Agreement is the share of images with the same top-1 class, and
+    the largest difference in class probability.
+    """
+    images = load_images(images_dir, max_images)
+    runs_to_measure = [(reference, "ultralytics")] + [(c, b) for c in candidates for b in backends]
+
+    rows = []
+    reference_probs = None
+    for path, backend in runs_to_measure:
+        start = time.perf_counter()
+        try:
+            model = load_classifier(path, backend, num_threads=num_threads)
+        except Exception as e:
+            logging.warning("Skipping %s with %s: %s", path, backend, e)
+            continue
+        load_s = time.perf_counter() - start
+
+        p50_1, p95_1 = measure_latency_ms(model, images[:1], runs)
+        p50_n, p95_n = measure_latency_ms(model, (images * batch)[:batch], runs)
+        probs = predict_all(model, images)
+        if reference_probs is None:
+            reference_probs = probs
+
+        rows.append(
+            {
+                "model": path,
+                "backend": backend,
+                "import_s": measure_import_s(backend),
+                "load_s": load_s,
+                "p50_ms_1": p50_1,
+                "p95_ms_1": p95_1,
+                f"p50_ms_{batch}": p50_n,
+                f"p95_ms_{batch}": p95_n,
+                "top1_agreement": float(np.mean(probs.argmax(1) == reference_probs.argmax(1))),
+                "max_abs_prob_diff": float(np.abs(probs - reference_probs).max()),
+            }
+        )
+    return rows
+
+
+def print_rows(rows: list[dict]):
+    if not rows:
+        return
+    keys = list(rows[0])
+    widths = {k: max(len(k), *(len(format_value(r[k])) for r in rows)) for k in keys}
+    print("  ".join(k.ljust(widths[k]) for k in keys))
+    for row in rows:
+        print("  ".join(format_value(row[k]).ljust(widths[k]) for k in keys))
+
+
+def format_value(value) -> str:
+    return f"{value:.3f}" if isinstance(value, float) else str(value)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="[%(asctime)s] %(levelname)s: %(message)s")
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser("export", help="Export a .pt classifier to ONNX (and INT8 ONNX).")
+    export_parser.add_argument("model_path")
+    export_parser.add_argument("--imgsz", type=int, default=224)
+    export_parser.add_argument(
+        "--static-batch", action="store_true", help="Export with a fixed batch size of 1."
+    )
+    export_parser.add_argument(
+        "--int8", action="store_true", help="Also write a statically quantized INT8 model."
+    )
+    export_parser.add_argument("--calib-dir", help="Calibration images for --int8.")
+    export_parser.add_argument("--calib-images", type=int, default=300)
+
+    bench_parser = subparsers.add_parser("benchmark", help="Compare backends against the .pt model.")
+    bench_parser.add_argument("reference", help="Reference .pt checkpoint.")
+    bench_parser.add_argument("--candidates", nargs="+", required=True, help="Exported models to compare.")
+    bench_parser.add_argument("--images", required=True, help="Folder of images (searched recursively).")
+    bench_parser.add_argument("--backends", nargs="+", default=["onnx"], choices=["onnx", "openvino"])
+    bench_parser.add_argument(
+        "--batch", type=int, default=5, help="Burst size (YOLO_BURST_FRAMES in smf.py)."
+    )
+    bench_parser.add_argument("--runs", type=int, default=50)
+    bench_parser.add_argument("--max-images", type=int, default=200)
+    bench_parser.add_argument("--threads", type=int)
+    bench_parser.add_argument("--output", help="Also write the results as JSON to this file.")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        export(
+            args.model_path, args.imgsz, not args.static_batch, args.int8, args.calib_dir, args.calib_images
+        )
+        return
+
+    rows = benchmark(
+        args.reference,
+        args.candidates,
+        args.images,
+        args.backends,
+        args.batch,
+        args.runs,
+        args.max_images,
+        args.threads,
+    )
+    print_rows(rows)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()